@@ -0,0 +1,74 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                '
+#                                                                              '
+#  This file is part of las-geoh5 package.                                     '
+#                                                                              '
+#  las-geoh5 is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                 '
+#                                                                              '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+"""Compare the bulk numpy parser of LAS data sections with lasio."""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+from pathlib import Path
+from timeit import timeit
+
+import lasio
+import numpy as np
+
+from las_geoh5.import_las import PARSERS
+
+
+def write_lasfile(path: Path, n_samples: int, n_curves: int) -> Path:
+    file = lasio.LASFile()
+    file.well["WELL"] = "benchmark"
+    file.append_curve("DEPTH", np.linspace(0, 1000, n_samples), unit="m")
+    for ind in range(n_curves):
+        file.append_curve(f"CURVE_{ind}", np.random.randn(n_samples))
+
+    filepath = path / f"benchmark_{n_samples}.las"
+    with open(filepath, "w", encoding="utf8") as out:
+        file.write(out)
+
+    return filepath
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--curves", type=int, default=8, help="Number of curves.")
+    parser.add_argument("--repeat", type=int, default=3, help="Reads per file.")
+    parser.add_argument(
+        "--samples",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 100_000, 500_000],
+        help="Number of samples of each benchmarked file.",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'samples':>10} {'size (MB)':>10} {'lasio (s)':>10} {'numpy (s)':>10} {'speedup':>8}"
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for n_samples in args.samples:
+            filepath = write_lasfile(Path(tmpdir), n_samples, args.curves)
+            times = {
+                name: timeit(
+                    lambda read=read, file=filepath: read(file), number=args.repeat
+                )
+                / args.repeat
+                for name, read in PARSERS.items()
+            }
+            print(
+                f"{n_samples:>10} {filepath.stat().st_size / 1e6:>10.1f} "
+                f"{times['lasio']:>10.3f} {times['numpy']:>10.3f} "
+                f"{times['lasio'] / times['numpy']:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                '
+#                                                                              '
+#  This file is part of las-geoh5 package.                                     '
+#                                                                              '
+#  las-geoh5 is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                 '
+#                                                                              '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+
+import lasio
+import numpy as np
+from geoh5py.groups import DrillholeGroup
+from tqdm import tqdm
+
+from las_geoh5.concatenation import deferred_writes
+from las_geoh5.import_files.params import ImportOptions
+from las_geoh5.import_files.report import ImportReport
+from las_geoh5.import_las import (
+    LASRecord,
+    LASTranslator,
+    add_records,
+    attach_surveys,
+    get_or_create_drillhole,
+    report_errors,
+)
+from las_geoh5.workspace_index import WorkspaceIndex
+
+
+def group_records(
+    data: Iterable[lasio.LASFile | LASRecord],
+    translator: LASTranslator,
+    skip_empty_header: bool = False,
+    logger: logging.Logger | None = None,
+) -> dict[str, dict[bytes, list[LASRecord]]]:
+    """
+    Group LAS records by well name, then by depth data.
+
+    :param data: Las files or records containing drillhole data.
+    :param translator: Translator for LAS files.
+    :param skip_empty_header: Whether to drop the records without collar.
+    :param logger: Logger object if warnings are enabled.
+
+    :return: Records by well name and by bytes of their depth data.
+    """
+
+    drillholes: dict[str, dict[bytes, list[LASRecord]]] = {}
+    for datum in data:
+        if not isinstance(datum, LASRecord):
+            datum = LASRecord.from_lasfile(datum, translator, logger)
+
+        if all(k == 0 for k in datum.collar) and skip_empty_header:
+            datum.release()
+            continue
+
+        kind, locations = next(iter(datum.depths.items()))
+        key = kind.encode() + np.asarray(locations, dtype=float).tobytes()
+        drillholes.setdefault(datum.name, {}).setdefault(key, []).append(datum)
+
+    return drillholes
+
+
+def create_drillholes(
+    data: Iterable[lasio.LASFile | LASRecord],
+    drillhole_group: DrillholeGroup,
+    property_group: str,
+    *,
+    surveys: Path | list[Path] | None = None,
+    logger: logging.Logger | None = None,
+    options: ImportOptions | None = None,
+    index: WorkspaceIndex | None = None,
+    attach: bool = True,
+    report: ImportReport | None = None,
+):
+    """
+    Import LAS files in bulk, grouped by drillhole.
+
+    Unlike :func:`las_geoh5.import_las.las_to_drillhole`, all the files are
+    first collected in memory and grouped by well name. Each drillhole is then
+    created once and receives the curves of its files sharing the same depths
+    in a single call, while the concatenated arrays of the drillhole group are
+    written once all the drillholes and surveys are added.
+
+    :param data: Las files or records containing drillhole data.
+    :param drillhole_group: Drillhole group container.
+    :param property_group: Property group name.
+    :param surveys: Path to a survey file stored as .csv or .las format.
+    :param logger: Logger object if warnings are enabled.
+    :param options: Import options covering name translations, collocation
+        tolerance, and warnings control.
+    :param index: Index of the workspace, built from the workspace if not
+        provided. It records the data created from each file.
+    :param attach: Attach the surveys once the data is added.
+    :param report: Report of the files failing to import, applying its error
+        policy to the drillholes and groups of records failing to be written.
+        Errors are raised if None.
+    """
+
+    options = options or ImportOptions()
+    index = index or WorkspaceIndex(drillhole_group.workspace, drillhole_group)
+    if not isinstance(surveys, list):
+        surveys = [surveys] if surveys else []
+
+    drillholes = group_records(
+        data, LASTranslator(options.names), options.skip_empty_header, logger
+    )
+    try:
+        with deferred_writes(drillhole_group, options.flush_bytes):
+            for records in tqdm(
+                drillholes.values(), desc="Adding drillholes and data to workspace"
+            ):
+                collocated = list(records.values())
+                with report_errors([k for group in collocated for k in group], report):
+                    drillhole = get_or_create_drillhole(
+                        collocated[0][0], drillhole_group, index, logger
+                    )
+                    for group in collocated:
+                        with report_errors(group, report):
+                            add_records(
+                                drillhole,
+                                group,
+                                property_group,
+                                options.collocation_tolerance,
+                                index=index,
+                            )
+
+            if attach:
+                attach_surveys(drillhole_group, surveys, logger, index=index)
+    finally:
+        for records in drillholes.values():
+            for group in records.values():
+                for record in group:
+                    record.release()
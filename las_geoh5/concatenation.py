@@ -0,0 +1,88 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                '
+#                                                                              '
+#  This file is part of las-geoh5 package.                                     '
+#                                                                              '
+#  las-geoh5 is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                 '
+#                                                                              '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import numpy as np
+from geoh5py.groups import DrillholeGroup
+from geoh5py.shared.concatenation import Concatenator
+from geoh5py.shared.utils import INV_KEY_MAP, KEY_MAP
+
+
+def appended_size(drillhole_group: Concatenator, field: str) -> int:
+    """
+    Size of the values last added to a concatenated array.
+
+    :param drillhole_group: Drillhole group holding the concatenated arrays.
+    :param field: Name of the attribute saved by the drillhole group.
+
+    :return: Size in bytes of the values described by the last row of the
+        index of the array, or 0 for the attributes without values.
+    """
+
+    alias = KEY_MAP.get(INV_KEY_MAP.get(field, field), field)
+    values = drillhole_group.data.get(alias)
+    index = drillhole_group.index.get(alias)
+    if values is None or index is None or len(index) == 0:
+        return 0
+
+    return int(index["Size"][-1]) * np.asarray(values).itemsize
+
+
+@contextmanager
+def deferred_writes(
+    drillhole_group: DrillholeGroup, flush_size: int | None = None
+) -> Iterator[None]:
+    """
+    Defer the writes of the concatenated arrays of a drillhole group.
+
+    geoh5py keeps the concatenated arrays of a drillhole group in memory, but
+    rewrites the full array of a channel to the geoh5 file every time data is
+    added to it. Within this context, the modified arrays are only written
+    once on exit, or whenever the values added since the last write exceed
+    the flush size. Nested contexts on the same group write on the outer exit.
+
+    :param drillhole_group: Drillhole group receiving the data.
+    :param flush_size: Size in bytes of the values added to the arrays before
+        they are written, or None to write them on exit only.
+    """
+
+    if not isinstance(drillhole_group, Concatenator) or "save_attribute" in vars(
+        drillhole_group
+    ):
+        yield
+        return
+
+    fields: dict[str, None] = {}
+    pending = 0
+
+    def flush():
+        nonlocal pending
+        for field in fields:
+            type(drillhole_group).save_attribute(drillhole_group, field)
+        fields.clear()
+        pending = 0
+
+    def defer(field: str):
+        nonlocal pending
+        fields[field] = None
+        pending += appended_size(drillhole_group, field)
+        if flush_size is not None and pending >= flush_size:
+            flush()
+
+    drillhole_group.save_attribute = defer
+    try:
+        yield
+    finally:
+        del drillhole_group.save_attribute
+        flush()
@@ -10,19 +10,34 @@
 
 from __future__ import annotations
 
+import os
 import sys
+from functools import partial
+from itertools import pairwise
 from pathlib import Path
+from uuid import UUID
 
+from geoh5py import Workspace
 from geoh5py.groups import DrillholeGroup
 from geoh5py.objects import Drillhole
 from geoh5py.shared.utils import fetch_active_workspace
 from geoh5py.ui_json import InputFile
 from tqdm import tqdm
 
+from las_geoh5.export_files.params import ExportOptions
 from las_geoh5.export_las import drillhole_to_las
+from las_geoh5.pool import stream
 
 
-def run(params_json: str | Path, output_dir: str | Path | None = None):
+SERIAL_COUNT = 16
+PARTITIONS_PER_WORKER = 4
+
+
+def run(
+    params_json: str | Path,
+    output_dir: str | Path | None = None,
+    n_workers: int | None = None,
+):
     """
     Export drillhole data from GEOH5 to LAS.
 
@@ -30,6 +45,9 @@ def run(params_json: str | Path, output_dir: str | Path | None = None):
         GEOH5 file, and an output directory for LAS.
     :param output_dir: if specified, use this path as the directory to write out the resulting
         LAS files, instead of the ``rootpath`` location defined by the parameter file.
+    :param n_workers: if specified, number of processes writing the LAS files, or 0
+        to write them in the main process, instead of the number defined by the
+        parameter file.
     """
     ifile = InputFile.read_ui_json(params_json)
     dh_group = ifile.data["drillhole_group"]
@@ -38,29 +56,153 @@ def run(params_json: str | Path, output_dir: str | Path | None = None):
     else:
         rootpath = Path(ifile.data["rootpath"])
     use_directories = ifile.data["use_directories"]
+    if n_workers is None:
+        n_workers = ifile.data.get("n_workers")
+    options = ExportOptions(
+        **{key: value for key, value in ifile.data.items() if value is not None}
+    )
     with fetch_active_workspace(ifile.data["geoh5"]):
-        export_las_files(dh_group, rootpath, use_directories)
+        export_las_files(
+            dh_group, rootpath, use_directories, n_workers=n_workers, options=options
+        )
+
+
+def worker_count(n_drillholes: int, n_workers: int | None = None) -> int:
+    """
+    Number of processes writing LAS files.
+
+    Without a number of processes given, exports of less than
+    ``SERIAL_COUNT`` drillholes are written in the main process, as starting
+    the processes would take longer than writing the files. Otherwise, one
+    process is used per drillhole, up to the cpu count.
+
+    :param n_drillholes: Number of drillholes to export.
+    :param n_workers: Number of processes, chosen from the drillholes if None.
+
+    :return: Number of processes, 0 to write the files in the main process.
+    """
+
+    if n_workers is not None:
+        return n_workers
+
+    if n_drillholes < SERIAL_COUNT:
+        return 0
+
+    return min(n_drillholes, os.cpu_count() or 1)
+
+
+def partition(uids: list[UUID], n_partitions: int) -> list[list[UUID]]:
+    """
+    Split drillhole uids into contiguous partitions of similar lengths.
+
+    :param uids: Unique identifiers of the drillholes.
+    :param n_partitions: Number of partitions, at most one per drillhole.
+
+    :return: Partitions of the drillhole uids.
+    """
+
+    n_partitions = max(min(n_partitions, len(uids)), 1)
+    size, extra = divmod(len(uids), n_partitions)
+    bounds = [i * size + min(i, extra) for i in range(n_partitions + 1)]
+
+    return [uids[start:end] for start, end in pairwise(bounds)]
+
+
+def export_drillholes(
+    uids: list[UUID],
+    *,
+    h5file: Path,
+    basepath: Path,
+    use_directories: bool,
+    options: ExportOptions | None = None,
+) -> int:
+    """
+    Export drillholes of a geoh5 file, opened read-only, to LAS files.
+
+    :param uids: Unique identifiers of the drillholes to export.
+    :param h5file: Path to the geoh5 file.
+    :param basepath: Base path where directories/files will be created.
+    :param use_directories: Use directories to organize LAS files by property group.
+    :param options: Export options covering the precision and null value.
+
+    :return: Number of drillholes exported.
+    """
+
+    with Workspace(h5file, mode="r") as workspace:
+        for uid in uids:
+            drillhole_to_las(
+                workspace.get_entity(uid)[0],
+                basepath,
+                use_directories=use_directories,
+                options=options,
+            )
+
+    return len(uids)
 
 
 def export_las_files(
-    group: DrillholeGroup, basepath: str | Path, use_directories: bool = True
+    group: DrillholeGroup,
+    basepath: str | Path,
+    use_directories: bool = True,
+    *,
+    n_workers: int | None = None,
+    options: ExportOptions | None = None,
 ):
     """
     Export contents of drillhole group to LAS files organized by directories.
 
+    With worker processes, the drillholes are split into partitions, each
+    exported by a process opening the geoh5 file read-only. The drillhole
+    group must then be saved to a geoh5 file, opened read-only, as the
+    processes cannot read the changes pending in a writable one. Other
+    drillhole groups are exported by the main process.
+
     :param group: Drillhole group container.
     :param basepath: Base path where directories/files will be created.
     :param use_directories: Use directories to organize LAS files by property group.
+    :param n_workers: Number of processes writing the LAS files, or 0 to write
+        them in the main process. If None, small exports are written in the main
+        process, avoiding the start up of the processes.
+    :param options: Export options covering the precision and null value.
     """
 
     if isinstance(basepath, str):
         basepath = Path(basepath)
 
     drillholes = [k for k in group.children if isinstance(k, Drillhole)]
+    processes = worker_count(len(drillholes), n_workers)
+    h5file = group.workspace.h5file
 
     print(f"Exporting drillhole surveys and property group data to '{basepath}'")
-    for drillhole in tqdm(drillholes):
-        drillhole_to_las(drillhole, basepath, use_directories=use_directories)
+    if (
+        processes == 0
+        or not isinstance(h5file, str | Path)
+        or group.workspace.geoh5.mode != "r"
+    ):
+        for drillhole in tqdm(drillholes):
+            drillhole_to_las(
+                drillhole, basepath, use_directories=use_directories, options=options
+            )
+        return
+
+    partitions = partition(
+        [drillhole.uid for drillhole in drillholes],
+        processes * PARTITIONS_PER_WORKER,
+    )
+    exported = stream(
+        partial(
+            export_drillholes,
+            h5file=Path(h5file),
+            basepath=basepath,
+            use_directories=use_directories,
+            options=options,
+        ),
+        partitions,
+        processes=processes,
+    )
+    with tqdm(total=len(drillholes)) as progress:
+        for count in exported:
+            progress.update(count)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,64 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                '
+#                                                                              '
+#  This file is part of las-geoh5 package.                                     '
+#                                                                              '
+#  las-geoh5 is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                 '
+#                                                                              '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from pydantic import BaseModel, Field, NonNegativeInt, PositiveInt
+
+
+DECIMALS = 5
+INDEX_CURVES = ("DEPTH", "DEPT", "FROM", "TO")
+
+
+class ExportOptions(BaseModel):
+    """
+    Stores options for the drillhole export.
+
+    The precision set for all the curves does not reduce the depths of the
+    ``INDEX_CURVES`` below ``DECIMALS``, as coarser depths would merge the
+    samples of a drillhole. They are only reduced when set by curve name.
+
+    :param decimals: Number of decimals of the values, for all the curves or
+        by curve name, the other curves keeping ``DECIMALS``.
+    :param significant_digits: Number of significant digits of the values, for
+        all the curves or by curve name, taking precedence over the decimals.
+        Large and small values are written in scientific notation.
+    :param width: Minimum number of characters of the values, aligning the
+        columns of the data section, or 0 for the shortest values.
+    :param null_value: Value written in place of the missing values.
+    """
+
+    decimals: NonNegativeInt | dict[str, NonNegativeInt] = DECIMALS
+    significant_digits: PositiveInt | dict[str, PositiveInt] | None = None
+    width: int = Field(default=10, ge=0)
+    null_value: float = -9999.25
+
+    def number_format(self, name: str) -> str:
+        """
+        Format of the values of a curve.
+
+        :param name: Name of the curve.
+
+        :return: printf-style format of the values.
+        """
+
+        digits = self.significant_digits
+        if isinstance(digits, dict):
+            digits = digits.get(name)
+        elif name in INDEX_CURVES:
+            digits = None
+        if digits is not None:
+            return f"%{self.width}.{digits}g"
+
+        decimals = self.decimals
+        if isinstance(decimals, dict):
+            decimals = decimals.get(name, DECIMALS)
+        elif name in INDEX_CURVES:
+            decimals = max(decimals, DECIMALS)
+
+        return f"%{self.width}.{decimals}f"
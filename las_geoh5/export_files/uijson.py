@@ -41,5 +41,52 @@ ui_json = dict(
             "tooltip": "Organize LAS files by property group directories",
             "value": True,
         },
+        "n_workers": {
+            "main": True,
+            "label": "Number of processes",
+            "value": 0,
+            "min": 0,
+            "optional": True,
+            "enabled": False,
+            "tooltip": (
+                "Number of processes writing the files, or 0 to write them in "
+                "the main process. Chosen from the number of drillholes if disabled."
+            ),
+        },
+        "decimals": {
+            "main": True,
+            "label": "Number of decimals",
+            "value": 5,
+            "min": 0,
+            "tooltip": "Number of decimals of the exported values.",
+        },
+        "significant_digits": {
+            "main": True,
+            "label": "Significant digits",
+            "value": 6,
+            "min": 1,
+            "optional": True,
+            "enabled": False,
+            "tooltip": (
+                "Number of significant digits of the exported values, "
+                "used instead of the number of decimals if enabled."
+            ),
+        },
+        "width": {
+            "main": True,
+            "label": "Column width",
+            "value": 10,
+            "min": 0,
+            "tooltip": (
+                "Minimum number of characters of the values, aligning the "
+                "columns, or 0 for the shortest values."
+            ),
+        },
+        "null_value": {
+            "main": True,
+            "label": "Null value",
+            "value": -9999.25,
+            "tooltip": "Value written in place of the missing values.",
+        },
     },
 )
@@ -10,13 +10,25 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Iterator
 from pathlib import Path
+from typing import TextIO
 
+import numpy as np
 from geoh5py.data import ReferencedData
 from geoh5py.objects import Drillhole
 from geoh5py.shared.concatenation import ConcatenatedPropertyGroup
 from lasio import HeaderItem, LASFile
 
+from las_geoh5.export_files.params import ExportOptions
+
+
+DATA_FORMAT = "%10.5f"
+TEXT_FORMAT = "%10s"
+CHUNK_ROWS = 4096
+NAN_FIELD = re.compile(r" +nan(?=[ \n])")
+
 
 def add_well_data(
     file: LASFile,
@@ -120,10 +132,130 @@ def add_survey_data(file: LASFile, drillhole: Drillhole) -> LASFile:
     return file
 
 
+def column_formats(
+    file: LASFile, formats: str | dict[str, str] = DATA_FORMAT
+) -> list[str]:
+    """
+    Formats of the data columns of a LAS file.
+
+    :param file: LAS file object.
+    :param formats: printf-style format of the numeric values, including
+        their width, or formats by curve mnemonic, falling back on
+        ``DATA_FORMAT`` for the other curves.
+
+    :return: Format of each curve, ``TEXT_FORMAT`` for the non-numeric ones.
+    """
+
+    if isinstance(formats, str):
+        formats = {curve.mnemonic: formats for curve in file.curves}
+
+    return [
+        formats.get(curve.mnemonic, DATA_FORMAT)
+        if np.asarray(curve.data).dtype.kind in "biuf"
+        else TEXT_FORMAT
+        for curve in file.curves
+    ]
+
+
+def format_data(
+    columns: list[np.ndarray], formats: list[str], null_value: str
+) -> Iterator[str]:
+    """
+    Format the data section of a LAS file in bulk.
+
+    The rows are formatted by chunks, with a single format operation on all
+    the values of a chunk, rather than value by value. The missing values are
+    then replaced by the null value as is, so that it is read back exactly
+    whatever the precision of the curves.
+
+    :param columns: Values of each curve.
+    :param formats: printf-style format of each curve.
+    :param null_value: Text written in place of the missing values.
+
+    :return: Formatted chunks of rows.
+    """
+
+    if not columns:
+        return
+
+    def null_field(match: re.Match) -> str:
+        return " " + null_value.rjust(len(match.group()) - 1)
+
+    data = np.column_stack(columns)
+    row_format = " " + " ".join(formats) + "\n"
+    for start in range(0, len(data), CHUNK_ROWS):
+        chunk = data[start : start + CHUNK_ROWS]
+        text = (row_format * len(chunk)) % tuple(chunk.ravel().tolist())
+        yield NAN_FIELD.sub(null_field, text) if "nan" in text else text
+
+
+def number_formats(file: LASFile, options: ExportOptions) -> dict[str, str]:
+    """
+    Formats of the curves of a LAS file from the export options.
+
+    :param file: LAS file object.
+    :param options: Export options covering the precision of the curves.
+
+    :return: printf-style format by curve mnemonic.
+    """
+
+    return {
+        curve.mnemonic: options.number_format(curve.mnemonic) for curve in file.curves
+    }
+
+
+def write_las(
+    file: LASFile,
+    output: TextIO,
+    formats: str | dict[str, str] = DATA_FORMAT,
+    null_value: float | None = None,
+):
+    """
+    Write a LAS 2.0 file, formatting its data section in bulk.
+
+    The header sections are written by lasio, while the data section is
+    formatted from the stacked curves by :func:`format_data`, with the
+    missing values replaced by the ``NULL`` value of the header.
+
+    :param file: LAS file object.
+    :param output: Text stream receiving the file.
+    :param formats: printf-style format of the numeric values, including
+        their width, or formats by curve mnemonic.
+    :param null_value: Value of the missing values, replacing the ``NULL``
+        value of the header if provided.
+    """
+
+    if null_value is not None:
+        file.well["NULL"].value = null_value
+
+    columns = [curve.data for curve in file.curves]
+    formats = column_formats(file, formats)
+    limits: dict[str, str | None] = {"STRT": None, "STOP": None, "STEP": None}
+    if columns and len(columns[0]) > 0:
+        index = columns[0]
+        limits["STRT"] = (formats[0] % index[0]).strip()
+        limits["STOP"] = (formats[0] % index[-1]).strip()
+        if len(index) > 1:
+            limits["STEP"] = (formats[0] % (index[1] - index[0])).strip()
+
+    # lasio writes the header sections of the file emptied of its data
+    try:
+        for curve in file.curves:
+            curve.data = curve.data[:0]
+        file.write(output, **limits)
+    finally:
+        for curve, values in zip(file.curves, columns, strict=True):
+            curve.data = values
+
+    for chunk in format_data(columns, formats, str(file.well["NULL"].value)):
+        output.write(chunk)
+
+
 def write_curves(
     drillhole: Drillhole,
     basepath: str | Path,
     use_directories: bool = True,
+    options: ExportOptions | None = None,
 ):
     """
     Write a formatted .las file for each property group in 'drillhole'.
@@ -132,8 +264,11 @@ def write_curves(
         groups for collocated data.
     :param basepath: Path to working directory.
     :param use_directories: True if data is stored in sub-directories
+    :param options: Export options covering the precision and null value.
     """
 
+    options = options or ExportOptions()
+
     if isinstance(basepath, str):
         basepath = Path(basepath)
 
@@ -158,20 +293,20 @@ def write_curves(
 
         if use_directories:
             subpath = basepath / group.name
-            if not subpath.exists():
-                subpath.mkdir()
+            subpath.mkdir(exist_ok=True)
         else:
             subpath = basepath
 
         filename = f"{drillhole.name}_{group.name}.las"
         with open(subpath / filename, "a", encoding="utf8") as io:  # pylint: disable=invalid-name
-            file.write(io)
+            write_las(file, io, number_formats(file, options), options.null_value)
 
 
 def write_survey(
     drillhole: Drillhole,
     basepath: str | Path,
     use_directories: bool = True,
+    options: ExportOptions | None = None,
 ):
     """
     Write a formatted .las file with survey data from 'drillhole'.
@@ -180,8 +315,11 @@ def write_survey(
         groups for collocated data.
     :param basepath: Path to working directory.
     :param use_directories: True if data is stored in sub-directories
+    :param options: Export options covering the precision and null value.
     """
 
+    options = options or ExportOptions()
+
     if isinstance(basepath, str):
         basepath = Path(basepath)
 
@@ -191,18 +329,18 @@ def write_survey(
 
     if use_directories:
         basepath = basepath / "Surveys"
-        if not basepath.exists():
-            basepath.mkdir()
+        basepath.mkdir(exist_ok=True)
 
     filename = f"{drillhole.name}_survey.las"
     with open(basepath / filename, "a", encoding="utf8") as io:  # pylint: disable=invalid-name
-        file.write(io)
+        write_las(file, io, number_formats(file, options), options.null_value)
 
 
 def drillhole_to_las(
     drillhole: Drillhole,
     basepath: str | Path,
     use_directories: bool = True,
+    options: ExportOptions | None = None,
 ):
     """
     Write a formatted .las file with data from 'drillhole'.
@@ -211,7 +349,9 @@ def drillhole_to_las(
         groups for collocated data.
     :param basepath: Path to working directory.
     :param use_directories: True if data is stored in sub-directories
+    :param options: Export options covering the precision of the values, by
+        decimals or significant digits, and the null value of missing data.
     """
 
-    write_survey(drillhole, basepath, use_directories)
-    write_curves(drillhole, basepath, use_directories)
+    write_survey(drillhole, basepath, use_directories, options)
+    write_curves(drillhole, basepath, use_directories, options)
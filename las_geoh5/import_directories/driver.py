@@ -11,15 +11,27 @@
 from __future__ import annotations
 
 import sys
+from contextlib import closing
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 
-import lasio
 from geoh5py.groups import DrillholeGroup
 from geoh5py.shared.utils import fetch_active_workspace
 from geoh5py.ui_json import InputFile
 
+from las_geoh5.import_files.driver import pool_options
 from las_geoh5.import_files.params import ImportOptions
-from las_geoh5.import_las import las_to_drillhole
+from las_geoh5.import_files.report import ImportReport
+from las_geoh5.import_las import (
+    LASTranslator,
+    attach_surveys,
+    las_to_drillhole,
+    read_record,
+)
+from las_geoh5.pool import stream
+from las_geoh5.workspace_index import WorkspaceIndex
 
 
 def run(file: str):
@@ -32,12 +44,21 @@ def run(file: str):
         import_las_directory(dh_group, parent_folder)
 
 
-def import_las_directory(dh_group: DrillholeGroup, basepath: str | Path):
+def import_las_directory(
+    dh_group: DrillholeGroup,
+    basepath: str | Path,
+    options: ImportOptions | None = None,
+):
     """
     Import directory/files from previous export.
 
-    :param workspace: Project workspace.
+    The LAS files of all property group folders are read in parallel by a
+    single process pool, and added to the drillhole group one folder after
+    the other. The surveys are attached once all the data is imported.
+
+    :param dh_group: Drillhole group receiving the data.
     :param basepath: Root directory for LAS data.
+    :param options: Import options.
 
     :return: New drillhole group containing imported items.
     """
@@ -50,27 +71,50 @@ def import_las_directory(dh_group: DrillholeGroup, basepath: str | Path):
     if not basepath.is_dir():
         raise OSError(f"Path is not a directory: {basepath}")
 
-    surveys_path = basepath / "Surveys"
-    surveys = list(surveys_path.iterdir()) if surveys_path.exists() else None
+    if options is None:
+        options = ImportOptions()
 
-    property_group_folders = [
-        p for p in basepath.iterdir() if p.is_dir() and p.name != "Surveys"
+    surveys_path = basepath / "Surveys"
+    surveys = list(surveys_path.iterdir()) if surveys_path.exists() else []
+
+    lasfiles = [
+        (prop.name, str(file))
+        for prop in basepath.iterdir()
+        if prop.is_dir() and prop.name != "Surveys"
+        for file in prop.iterdir()
+        if file.suffix == ".las"
     ]
-
-    for prop in property_group_folders:
-        lasfiles = []
-        for file in [k for k in prop.iterdir() if k.suffix == ".las"]:
-            lasfiles.append(
-                lasio.read(file, mnemonic_case="preserve", encoding="utf-8")
+    names = [name for name, _ in lasfiles]
+    files = [file for _, file in lasfiles]
+    report = ImportReport(options.on_error, options.quarantine_directory)
+    records = stream(
+        partial(
+            read_record,
+            translator=LASTranslator(options.names),
+            shared=options.shared_memory,
+            parser=options.parser,
+        ),
+        files,
+        capture_errors=report.capture_errors,
+        **pool_options(options, files),
+    )
+
+    index = WorkspaceIndex(dh_group.workspace, dh_group)
+    with closing(records):
+        for name, group in groupby(zip(names, records, strict=True), key=itemgetter(0)):
+            print(f"Importing property group data from to '{name}'")
+            las_to_drillhole(
+                report.filter(record for _, record in group),
+                dh_group,
+                name,
+                options=options,
+                index=index,
+                attach=False,
+                report=report,
             )
-        print(f"Importing property group data from to '{prop.name}'")
-        las_to_drillhole(
-            lasfiles,
-            dh_group,
-            prop.name,
-            surveys=surveys,
-            options=ImportOptions(),
-        )
+
+    attach_surveys(dh_group, surveys, None, index=index)
+    report.summarize()
 
     return dh_group
 
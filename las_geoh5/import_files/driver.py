@@ -11,27 +11,44 @@
 from __future__ import annotations
 
 import logging
+import os
 import sys
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import Callable, Iterator
+from contextlib import closing, contextmanager
 from datetime import datetime
-from multiprocessing import Pool
+from functools import partial
+from io import BytesIO
 from pathlib import Path
-from shutil import move
+from shutil import copyfile, move
+from typing import Any
 
 from geoh5py import Workspace
 from geoh5py.groups import DrillholeGroup
 from geoh5py.shared.utils import fetch_active_workspace
 from geoh5py.ui_json import InputFile
-from tqdm import tqdm
 
+from las_geoh5.bulk_import import create_drillholes
+from las_geoh5.import_files.manifest import ImportManifest
 from las_geoh5.import_files.params import ImportOptions, NameOptions
-from las_geoh5.import_las import las_to_drillhole, lasio_read
+from las_geoh5.import_files.report import ImportReport
+from las_geoh5.import_files.shards import import_shards
+from las_geoh5.import_las import (
+    LASRecord,
+    LASTranslator,
+    attach_surveys,
+    las_to_drillhole,
+    read_header,
+    read_record,
+)
+from las_geoh5.pool import Failure, stream
+from las_geoh5.workspace_index import WorkspaceIndex
 
 
 _logger = logging.getLogger(__name__)
 _logger.name = "Import Files"
 
+SERIAL_SIZE = 2**23
+
 
 @contextmanager
 def log_to_file(
@@ -86,7 +103,430 @@ def log_execution_time(message: str, log_level: int = logging.INFO) -> Iterator[
     _logger.log(log_level, out)
 
 
-def run(params_json: Path, output_geoh5: Path | None = None):
+def worker_count(
+    files: list[str], n_workers: int | None = None, *, limited: bool = False
+) -> int:
+    """
+    Number of processes reading LAS files.
+
+    Without a number of processes given, imports of a single file or of less
+    than ``SERIAL_SIZE`` bytes are read in the main process, as starting the
+    processes and transferring the records would take longer than reading
+    the files. Otherwise, one process is used per file, up to the cpu count.
+    Limited imports always use processes, as the limits only apply to them.
+
+    :param files: Paths to the LAS files.
+    :param n_workers: Number of processes, chosen from the files if None.
+    :param limited: Whether the processes are limited in time or memory.
+
+    :return: Number of processes, 0 to read the files in the main process.
+    """
+
+    if n_workers is not None:
+        return n_workers
+
+    size = sum(Path(file).stat().st_size for file in files if Path(file).is_file())
+    if not limited and (len(files) < 2 or size < SERIAL_SIZE):
+        return 0
+
+    return min(len(files), os.cpu_count() or 1)
+
+
+def pool_options(options: ImportOptions, files: list[str]) -> dict[str, Any]:
+    """
+    Options of the process pools reading the LAS files.
+
+    :param options: Import options.
+    :param files: Paths to the LAS files read by the pool.
+
+    :return: Keyword arguments of :func:`las_geoh5.pool.stream`.
+    """
+
+    limited = options.timeout is not None or options.memory_limit is not None
+
+    return {
+        "processes": worker_count(files, options.n_workers, limited=limited),
+        "queue_size": options.queue_size,
+        "timeout": options.timeout,
+        "memory_limit": options.memory_limit,
+        "max_tasks": options.max_tasks,
+        "priority": file_size if options.order == "size" else None,
+    }
+
+
+def file_size(file: str) -> int:
+    """
+    Size of a LAS file, setting the priority of the files read by size.
+
+    Reading the largest files first lets the small ones fill the processes
+    at the end of the import, rather than a large file read last by a single
+    process. Missing files are given the lowest priority.
+
+    :param file: Path to the LAS file.
+
+    :return: Size of the file in bytes, or -1 if missing.
+    """
+
+    try:
+        return Path(file).stat().st_size
+    except OSError:
+        return -1
+
+
+def scan_headers(
+    files: list[str],
+    dh_group: DrillholeGroup,
+    translator: LASTranslator,
+    report: ImportReport | None = None,
+    **kwargs,
+) -> list[str]:
+    """
+    Read the headers of LAS files to drop the ones without collar information.
+
+    Only the header sections are parsed, so that the data of the skipped files
+    is never read.
+
+    :param files: Paths to the LAS files.
+    :param dh_group: Destination drillhole group.
+    :param translator: Translator for LAS files.
+    :param report: Report of the files failing to import, raising on the first
+        error if not provided.
+    :param kwargs: Options of the process pool, see :func:`las_geoh5.pool.stream`.
+
+    :return: Paths to the LAS files with collar information.
+    """
+
+    headers = stream(
+        partial(read_header, translator=translator),
+        files,
+        capture_errors=report is not None and report.capture_errors,
+        **kwargs,
+    )
+    kept = {}
+    skipped = 0
+    for file, header in zip(files, headers, strict=True):
+        if isinstance(header, Failure):
+            if report is not None:
+                report.reject(header)
+        elif any(header.collar):
+            kept[file] = header
+        else:
+            skipped += 1
+
+    if skipped:
+        _logger.info("Skipping %i LAS file(s) without collar information.", skipped)
+
+    names = {header.name for header in kept.values()}
+    _logger.info(
+        "Importing %i LAS file(s) into %i drillhole(s), including %i new ones.",
+        len(kept),
+        len(names),
+        len(names - {child.name for child in dh_group.children}),
+    )
+
+    return list(kept)
+
+
+def select_changed(
+    files: list[str],
+    manifest: ImportManifest,
+    dh_group: DrillholeGroup,
+    property_group: str,
+) -> list[str]:
+    """
+    Drop the LAS files unchanged since their last import.
+
+    The data imported from the changed files is removed from the drillhole
+    group, to be replaced by the new import.
+
+    :param files: Paths to the LAS files.
+    :param manifest: Manifest of the previous imports.
+    :param dh_group: Destination drillhole group.
+    :param property_group: Property group name.
+
+    :return: Paths to the new or changed LAS files.
+    """
+
+    selected = manifest.select(files, property_group)
+    if len(selected) < len(files):
+        _logger.info(
+            "Skipping %i LAS file(s) unchanged since their last import.",
+            len(files) - len(selected),
+        )
+
+    removed = manifest.remove_data(dh_group, selected)
+    if removed:
+        _logger.info("Replacing %i data from changed LAS file(s).", removed)
+
+    return selected
+
+
+def fetch_group(
+    workspace: Workspace, group: DrillholeGroup | None, resumed: bool = False
+) -> DrillholeGroup:
+    """
+    Fetch the drillhole group receiving the drillholes from a workspace.
+
+    :param workspace: Destination workspace.
+    :param group: Drillhole group selected in the parameters, if any.
+    :param resumed: Whether the workspace is restored from a checkpoint, in
+        which case the group created by the interrupted import is fetched.
+
+    :return: The destination drillhole group.
+    """
+
+    if group is not None:
+        return workspace.get_entity(group.uid)[0]
+
+    if resumed:
+        for candidate in reversed(workspace.groups):
+            if (
+                isinstance(candidate, DrillholeGroup)
+                and ImportManifest.find(candidate) is not None
+            ):
+                return candidate
+
+    return DrillholeGroup.create(workspace)
+
+
+def open_destination(
+    ifile: InputFile,
+    options: ImportOptions,
+    output_geoh5: Path | None = None,
+    checkpoint: Path | None = None,
+) -> tuple[Workspace, DrillholeGroup]:
+    """
+    Open the workspace and drillhole group receiving the drillholes.
+
+    By default, the drillhole group is copied to a new in-memory workspace.
+    In append mode, the geoh5 file is opened in write mode, after being
+    copied to the output location if any, so that only the new drillholes
+    and data are written.
+
+    :param ifile: Input file with the import parameters.
+    :param options: Import options.
+    :param output_geoh5: Path to the output GEOH5 file, if any.
+    :param checkpoint: Path to the checkpoint file of an interrupted import to
+        resume from, if any. Its content replaces the input GEOH5 file.
+
+    :return: The destination workspace and drillhole group.
+    """
+
+    geoh5_path = ifile.data["geoh5"].h5file
+    group = ifile.data["drillhole_group"]
+    source = geoh5_path
+    if checkpoint is not None and checkpoint.is_file():
+        _logger.info("Resuming the import from checkpoint '%s'.", checkpoint.name)
+        source = checkpoint
+
+    if not options.append:
+        if source == checkpoint:
+            workspace = Workspace(BytesIO(source.read_bytes()), mode="r+")
+            return workspace, fetch_group(workspace, group, resumed=True)
+
+        workspace = Workspace()
+        with fetch_active_workspace(ifile.data["geoh5"]) as geoh5:
+            if group is None:
+                return workspace, DrillholeGroup.create(workspace)
+
+            return workspace, geoh5.get_entity(group.uid)[0].copy(parent=workspace)
+
+    ifile.data["geoh5"].close()
+    if output_geoh5 is not None:
+        output_geoh5.unlink(missing_ok=True)
+        copyfile(source, output_geoh5)
+        geoh5_path = output_geoh5
+    elif ifile.data["monitoring_directory"]:
+        working_path = Path(ifile.data["monitoring_directory"]) / ".working"
+        working_path.mkdir(exist_ok=True)
+        temp_geoh5 = working_path / f"temp{datetime.now().timestamp():.3f}.geoh5"
+        copyfile(source, temp_geoh5)
+        geoh5_path = temp_geoh5
+    elif source != geoh5_path:
+        copyfile(source, geoh5_path)
+
+    workspace = Workspace(geoh5_path, mode="r+")
+
+    return workspace, fetch_group(workspace, group, resumed=source == checkpoint)
+
+
+def commit_checkpoint(dh_group: DrillholeGroup, checkpoint: Path) -> DrillholeGroup:
+    """
+    Save the state of the workspace to a checkpoint file.
+
+    The workspace is closed for its content to be complete, copied to a
+    temporary file then renamed over the checkpoint, so that an interruption
+    at any time leaves the last checkpoint intact. The entities of the
+    workspace are loaded again when re-opening it.
+
+    :param dh_group: Destination drillhole group.
+    :param checkpoint: Path to the checkpoint file.
+
+    :return: The destination drillhole group of the re-opened workspace.
+    """
+
+    workspace = dh_group.workspace
+    workspace.close()
+
+    temp_file = checkpoint.with_name(f".{checkpoint.name}")
+    if isinstance(workspace.h5file, BytesIO):
+        temp_file.write_bytes(workspace.h5file.getvalue())
+    else:
+        copyfile(workspace.h5file, temp_file)
+    temp_file.replace(checkpoint)
+
+    workspace.open(mode="r+")
+
+    return workspace.get_entity(dh_group.uid)[0]
+
+
+def import_batches(  # pylint: disable=too-many-locals
+    files: list[str],
+    dh_group: DrillholeGroup,
+    *,
+    reader: Callable[[str], LASRecord],
+    property_group: str,
+    options: ImportOptions,
+    manifest: ImportManifest,
+    checkpoint: Path,
+    report: ImportReport,
+) -> DrillholeGroup:
+    """
+    Import LAS files into a drillhole group, in batches separated by checkpoints.
+
+    The imported files are recorded in the manifest of the drillhole group at
+    the end of each batch, so that a checkpoint lists the files it contains.
+    Each batch is read by its own process pool, so that no worker holds the
+    geoh5 file when the workspace is closed for a checkpoint. The files
+    failing to import are left out of the manifest. With the ``bulk`` option,
+    the records of a batch are held in memory and written by drillhole. With
+    the ``shards``
+    option, the new drillholes of a batch are written by the processes to
+    temporary geoh5 files, merged into the drillhole group before the other
+    files are imported. The surveys of the drillholes are extended to their
+    end of hole once all the batches are imported, as the files of a drillhole
+    can be split between batches.
+
+    :param files: Paths to the LAS files.
+    :param dh_group: Destination drillhole group.
+    :param reader: Function reading the record of a LAS file.
+    :param property_group: Property group name.
+    :param options: Import options.
+    :param manifest: Manifest of the previous imports.
+    :param checkpoint: Path to the checkpoint file.
+    :param report: Report of the files failing to import.
+
+    :return: The destination drillhole group, re-fetched after checkpoints.
+    """
+
+    size = options.checkpoint or max(len(files), 1)
+    index = None
+    for start in range(0, len(files), size):
+        batch = files[start : start + size]
+        remaining, sources = batch, {}
+        processes = worker_count(
+            batch, options.n_workers, limited=options.memory_limit is not None
+        )
+        if options.shards and processes > 0:
+            remaining, dh_group, sources = import_shards(
+                batch,
+                dh_group,
+                processes=processes,
+                reader=reader,
+                property_group=property_group,
+                options=options,
+                report=report,
+            )
+
+        index = WorkspaceIndex(dh_group.workspace, dh_group)
+        with closing(
+            stream(
+                reader,
+                remaining,
+                capture_errors=report.capture_errors,
+                **pool_options(options, remaining),
+            )
+        ) as records:
+            (create_drillholes if options.bulk else las_to_drillhole)(
+                report.filter(records),
+                dh_group,
+                property_group,
+                options=options,
+                index=index,
+                attach=False,
+                report=report,
+            )
+        if options.incremental or options.checkpoint:
+            failed = report.failed
+            manifest.record(
+                [file for file in batch if file not in failed],
+                property_group,
+                {**sources, **index.sources},
+            )
+            manifest.write(dh_group)
+
+        if options.checkpoint and start + size < len(files):
+            dh_group = commit_checkpoint(dh_group, checkpoint)
+            _logger.info(
+                "Checkpoint saved after %i of %i LAS file(s).",
+                start + size,
+                len(files),
+            )
+
+    if index is not None:
+        attach_surveys(dh_group, [], index=index)
+
+    return dh_group
+
+
+def save_destination(
+    workspace: Workspace,
+    ifile: InputFile,
+    options: ImportOptions,
+    output_geoh5: Path | None = None,
+):
+    """
+    Write the destination workspace to its output location.
+
+    :param workspace: Destination workspace.
+    :param ifile: Input file with the import parameters.
+    :param options: Import options.
+    :param output_geoh5: Path to the output GEOH5 file, if any.
+    """
+
+    if options.append:
+        workspace.close()
+        if output_geoh5 is None and ifile.data["monitoring_directory"]:
+            move(
+                workspace.h5file,
+                Path(ifile.data["monitoring_directory"]) / workspace.h5file.name,
+            )
+    elif output_geoh5 is not None:
+        output_geoh5.unlink(missing_ok=True)
+        workspace.save_as(output_geoh5)
+    elif ifile.data["monitoring_directory"]:
+        working_path = Path(ifile.data["monitoring_directory"]) / ".working"
+        working_path.mkdir(exist_ok=True)
+        temp_geoh5 = f"temp{datetime.now().timestamp():.3f}.geoh5"
+        workspace.save_as(working_path / temp_geoh5)
+        workspace.close()
+        move(
+            working_path / temp_geoh5,
+            Path(ifile.data["monitoring_directory"]) / temp_geoh5,
+        )
+    else:
+        geoh5_path = ifile.data["geoh5"].h5file
+        geoh5_path.unlink()
+        workspace.save_as(geoh5_path)
+
+    workspace.close()
+
+
+def run(
+    params_json: Path,
+    output_geoh5: Path | None = None,
+    n_workers: int | None = None,
+):
     """
     Import LAS files into a geoh5 file.
 
@@ -95,36 +535,37 @@ def run(params_json: Path, output_geoh5: Path | None = None):
         destination drill hole group.
         For output, will either write the created GEOH5 with a timestamped name to
         ``monitoring_directory``, if defined, or overwrite the input GEOH5 file.
+        With the ``append`` parameter, the drillholes and data are added to the
+        input GEOH5 file, or to a copy of it for the other outputs.
+        With the ``checkpoint`` parameter, the state of the import is saved every
+        given number of files to a ``.checkpoint.geoh5`` file next to the JSON file,
+        from which an interrupted import restarts with the ``resume`` parameter.
     :param output_geoh5: if specified, use this path to write out the resulting GEOH5 file,
         instead of the GEOH5 output location defined by the parameter file.
+    :param n_workers: if specified, number of processes reading the LAS files, or 0
+        to read them in the main process, instead of the number defined by the
+        parameter file.
     """
 
     with log_to_file(_logger, params_json.parent) as log_file:
         with log_execution_time("All done"):
             ifile = InputFile.read_ui_json(params_json)
+            options = ImportOptions(names=NameOptions(**ifile.data), **ifile.data)
+            if n_workers is not None:
+                options = options.model_copy(update={"n_workers": n_workers})
+            report = ImportReport(
+                options.on_error, options.quarantine_directory, logger=_logger
+            )
 
             _logger.info(
                 "Importing LAS file data to workspace '%s.geoh5'.",
                 ifile.data["geoh5"].h5file.stem,
             )
 
-            workspace = Workspace()
-            with log_execution_time("Finished reading LAS files"):
-                with Pool() as pool:
-                    futures = []
-                    for file in tqdm(
-                        ifile.data["files"].split(";"), desc="Reading LAS files"
-                    ):
-                        futures.append(pool.apply_async(lasio_read, (file,)))
-
-                    lasfiles = [future.get() for future in futures]
-
-            with fetch_active_workspace(ifile.data["geoh5"]) as geoh5:
-                if ifile.data["drillhole_group"] is None:
-                    dh_group = DrillholeGroup.create(workspace)
-                else:
-                    dh_group = geoh5.get_entity(ifile.data["drillhole_group"].uid)[0]
-                    dh_group = dh_group.copy(parent=workspace)
+            checkpoint = params_json.with_suffix("").with_suffix(".checkpoint.geoh5")
+            workspace, dh_group = open_destination(
+                ifile, options, output_geoh5, checkpoint if options.resume else None
+            )
 
             _logger.info(
                 "Saving drillhole data into drillhole group '%s' under property group '%s'",
@@ -132,38 +573,52 @@ def run(params_json: Path, output_geoh5: Path | None = None):
                 ifile.data["name"],
             )
 
-            with log_execution_time("Finished saving drillhole data"):
-                name_options = NameOptions(**ifile.data)
-                las_to_drillhole(
-                    lasfiles,
+            with log_execution_time(
+                "Finished reading LAS files and saving drillhole data"
+            ):
+                translator = LASTranslator(options.names)
+                files = ifile.data["files"].split(";")
+                manifest = ImportManifest.read(dh_group)
+                if options.incremental or options.resume:
+                    files = select_changed(
+                        files, manifest, dh_group, ifile.data["name"]
+                    )
+                if options.skip_empty_header:
+                    files = scan_headers(
+                        files,
+                        dh_group,
+                        translator,
+                        report,
+                        **pool_options(options, files),
+                    )
+                if options.checkpoint:
+                    manifest.write(dh_group)
+                    dh_group = commit_checkpoint(dh_group, checkpoint)
+
+                dh_group = import_batches(
+                    files,
                     dh_group,
-                    ifile.data["name"],
-                    options=ImportOptions(names=name_options, **ifile.data),
+                    reader=partial(
+                        read_record,
+                        translator=translator,
+                        shared=options.shared_memory,
+                        parser=options.parser,
+                    ),
+                    property_group=ifile.data["name"],
+                    options=options,
+                    manifest=manifest,
+                    checkpoint=checkpoint,
+                    report=report,
                 )
 
+            report.summarize()
+
     if log_file.exists() and log_file.stat().st_size > 0:
         dh_group.add_file(log_file)
     log_file.unlink(missing_ok=True)
 
-    if output_geoh5 is not None:
-        output_geoh5.unlink(missing_ok=True)
-        workspace.save_as(output_geoh5)
-    elif ifile.data["monitoring_directory"]:
-        working_path = Path(ifile.data["monitoring_directory"]) / ".working"
-        working_path.mkdir(exist_ok=True)
-        temp_geoh5 = f"temp{datetime.now().timestamp():.3f}.geoh5"
-        workspace.save_as(working_path / temp_geoh5)
-        workspace.close()
-        move(
-            working_path / temp_geoh5,
-            Path(ifile.data["monitoring_directory"]) / temp_geoh5,
-        )
-    else:
-        geoh5_path = geoh5.h5file
-        geoh5.h5file.unlink()
-        workspace.save_as(geoh5_path)
-
-    workspace.close()
+    save_destination(workspace, ifile, options, output_geoh5)
+    checkpoint.unlink(missing_ok=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,262 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                '
+#                                                                              '
+#  This file is part of las-geoh5 package.                                     '
+#                                                                              '
+#  las-geoh5 is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                 '
+#                                                                              '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from uuid import UUID
+
+from geoh5py.data import Data, FilenameData
+from geoh5py.groups import DrillholeGroup
+from geoh5py.shared import Entity
+from geoh5py.shared.concatenation import ConcatenatedObject
+from pydantic import BaseModel
+
+
+MANIFEST_NAME = "import_manifest.json"
+
+
+def file_key(file: str | Path) -> str:
+    """
+    Key of a file in the manifest.
+
+    :param file: Path to the file.
+
+    :return: Resolved path of the file.
+    """
+
+    return str(Path(file).resolve())
+
+
+def file_hash(file: str | Path) -> str:
+    """
+    Hash of the content of a file.
+
+    :param file: Path to the file.
+
+    :return: Hexadecimal SHA-256 digest.
+    """
+
+    return hashlib.sha256(Path(file).read_bytes()).hexdigest()
+
+
+def remove_concatenated_data(drillhole: ConcatenatedObject, data: list[Data]):
+    """
+    Remove data from a concatenated drillhole, along with the depth or from-to
+    data of the property groups left empty.
+
+    geoh5py removes the property groups only holding their depth or from-to
+    data after a removal, but keeps these data in the drillhole, where they
+    would accumulate over the imports replacing the same files.
+
+    :param drillhole: Drillhole holding the data.
+    :param data: Data to remove.
+    """
+
+    locations = {
+        group: [k for k in (group.depth_, group.from_, group.to_) if k is not None]
+        for group in {datum.property_group for datum in data}
+        if group is not None
+    }
+    drillhole.remove_children(data)
+
+    remaining = drillhole.property_groups or []
+    orphans = [
+        datum
+        for group, values in locations.items()
+        if group not in remaining
+        for datum in values
+    ]
+    for datum in orphans:
+        datum.allow_delete = True
+    drillhole.remove_children(orphans)
+
+
+class ManifestEntry(BaseModel):
+    """
+    Fingerprint of an imported LAS file and the data created from it.
+
+    :param size: Size of the file in bytes.
+    :param mtime: Modification time of the file.
+    :param sha256: Hash of the content of the file.
+    :param property_group: Property group name the file was imported under.
+    :param drillhole: Drillhole receiving the data.
+    :param data: Data created from the file.
+    """
+
+    size: int
+    mtime: float
+    sha256: str
+    property_group: str
+    drillhole: UUID | None = None
+    data: list[UUID] = []
+
+    def is_current(self, file: str | Path, property_group: str) -> bool:
+        """
+        Whether a file is unchanged since it was imported under a property group.
+
+        The content is only hashed if the size or modification time differ.
+
+        :param file: Path to the file.
+        :param property_group: Property group name of the import.
+
+        :return: True if the file can be skipped.
+        """
+
+        if self.property_group != property_group:
+            return False
+
+        stat = Path(file).stat()
+        if stat.st_size == self.size and stat.st_mtime == self.mtime:
+            return True
+
+        return stat.st_size == self.size and file_hash(file) == self.sha256
+
+
+class ImportManifest(BaseModel):
+    """
+    Record of the LAS files imported into a drillhole group.
+
+    The manifest is stored as a JSON file attached to the drillhole group, so
+    that the following imports can skip the files that did not change, and
+    replace the data of the files that did.
+
+    :param files: Entries by resolved path of the files.
+    """
+
+    files: dict[str, ManifestEntry] = {}
+
+    @staticmethod
+    def find(drillhole_group: DrillholeGroup) -> FilenameData | None:
+        """
+        Find the manifest attached to a drillhole group.
+
+        :param drillhole_group: Drillhole group receiving the data.
+
+        :return: The file data holding the manifest, if any.
+        """
+
+        for child in drillhole_group.children:
+            if isinstance(child, FilenameData) and child.values == MANIFEST_NAME:
+                return child
+
+        return None
+
+    @classmethod
+    def read(cls, drillhole_group: DrillholeGroup) -> ImportManifest:
+        """
+        Read the manifest attached to a drillhole group.
+
+        :param drillhole_group: Drillhole group receiving the data.
+
+        :return: The manifest, empty if none is attached.
+        """
+
+        file_data = cls.find(drillhole_group)
+        if file_data is None or file_data.file_bytes is None:
+            return cls()
+
+        return cls.model_validate_json(file_data.file_bytes)
+
+    def write(self, drillhole_group: DrillholeGroup):
+        """
+        Attach the manifest to a drillhole group, replacing any previous one.
+
+        The previous manifest is updated in place rather than removed, so that
+        the unreferenced types of the workspace are left untouched.
+
+        :param drillhole_group: Drillhole group receiving the data.
+        """
+
+        blob = self.model_dump_json(indent=2).encode("utf-8")
+        file_data = self.find(drillhole_group)
+        if file_data is None:
+            drillhole_group.add_file(blob, name=MANIFEST_NAME)
+        else:
+            file_data.file_bytes = blob
+
+    def select(self, files: list[str], property_group: str) -> list[str]:
+        """
+        Select the files that are new or changed since their last import.
+
+        :param files: Paths to the LAS files.
+        :param property_group: Property group name of the import.
+
+        :return: Paths to the LAS files to import.
+        """
+
+        return [
+            file
+            for file in files
+            if file_key(file) not in self.files
+            or not self.files[file_key(file)].is_current(file, property_group)
+        ]
+
+    def remove_data(self, drillhole_group: DrillholeGroup, files: list[str]) -> int:
+        """
+        Remove the data created by previous imports of files.
+
+        :param drillhole_group: Drillhole group receiving the data.
+        :param files: Paths to the LAS files.
+
+        :return: Number of data removed.
+        """
+
+        workspace = drillhole_group.workspace
+        count = 0
+        for file in files:
+            entry = self.files.pop(file_key(file), None)
+            if entry is None or entry.drillhole is None:
+                continue
+
+            drillhole = workspace.get_entity(entry.drillhole)[0]
+            if drillhole is None:
+                continue
+
+            data = [
+                datum
+                for uid in entry.data
+                if (datum := drillhole.get_entity(uid)[0]) is not None
+            ]
+            if isinstance(drillhole, ConcatenatedObject):
+                remove_concatenated_data(drillhole, data)
+            else:
+                for datum in data:
+                    workspace.remove_entity(datum)
+            count += len(data)
+
+        return count
+
+    def record(
+        self,
+        files: list[str],
+        property_group: str,
+        sources: dict[str, list[Entity]],
+    ):
+        """
+        Record the imported files and the data created from them.
+
+        :param files: Paths to the imported LAS files.
+        :param property_group: Property group name of the import.
+        :param sources: Data created, by path of the file they come from.
+        """
+
+        for file in files:
+            stat = Path(file).stat()
+            data = sources.get(str(file), [])
+            self.files[file_key(file)] = ManifestEntry(
+                size=stat.st_size,
+                mtime=stat.st_mtime,
+                sha256=file_hash(file),
+                property_group=property_group,
+                drillhole=data[0].parent.uid if data else None,
+                data=[k.uid for k in data],
+            )
@@ -8,7 +8,10 @@
 #                                                                              '
 # ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
 
-from pydantic import BaseModel, ConfigDict, model_validator
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 LAS_GEOH5_STANDARD = {
@@ -46,6 +49,48 @@ class ImportOptions(BaseModel):
     :param collocation_tolerance: Tolerance for collocation of collar and depth data.
     :param warnings: Whether to show warnings.
     :param skip_empty_header: Whether to skip empty headers.
+    :param queue_size: Maximum number of parsed LAS files held in memory while
+        waiting to be written to the workspace.
+    :param shared_memory: Whether to transfer the curve values of parsed LAS files
+        through shared memory rather than pickling them.
+    :param parser: Parser of the LAS data sections, either 'numpy' for the bulk
+        parser, which falls back on lasio for wrapped or malformed files, or
+        'lasio'.
+    :param append: Whether to add the drillholes and data to the input geoh5
+        file in place, rather than rewriting the drillhole group.
+    :param incremental: Whether to skip the LAS files unchanged since their last
+        import into the drillhole group, and replace the data of the changed ones.
+    :param checkpoint: Number of LAS files imported between checkpoints saving
+        the state of the import, or 0 to disable checkpoints.
+    :param resume: Whether to resume an interrupted import from its last
+        checkpoint, skipping the LAS files already imported.
+    :param on_error: Policy for the LAS files failing to import, either 'skip'
+        to leave them out, 'quarantine' to also move them to the quarantine
+        directory, or 'abort' to stop the import on the first error.
+    :param quarantine_directory: Directory receiving the quarantined files.
+    :param timeout: Time limit in seconds to read a LAS file, after which the
+        processes reading the files are replaced and the file fails to import.
+    :param memory_limit: Memory limit in megabytes of the processes reading the
+        LAS files, above which the file being read fails to import.
+    :param max_tasks: Number of LAS files read by a process before it is
+        replaced, releasing the memory it holds.
+    :param order: Order in which the LAS files are read, either 'files' for
+        the order of the input files, or 'size' for the largest files first
+        among those queued together, so that the processes finish together.
+        The files are imported in the order of the input files either way,
+        which sets the data receiving the copy names of repeated curves.
+    :param n_workers: Number of processes reading the LAS files, or 0 to read
+        them in the main process. If None, small imports are read in the main
+        process, avoiding the start up of the processes, unless a timeout or
+        memory limit applies to them.
+    :param bulk: Whether to hold the LAS files of a batch in memory, so that
+        each drillhole is written at once rather than file by file.
+    :param shards: Whether the processes write the new drillholes to temporary
+        geoh5 files, merged into the drillhole group, rather than passing the
+        data to the main process for writing.
+    :param flush_size: Size in megabytes of the data added to the drillhole
+        group before its concatenated arrays are written to the geoh5 file. If
+        None, the arrays are written once per batch of imported files.
     """
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -54,3 +99,31 @@ class ImportOptions(BaseModel):
     collocation_tolerance: float = 0.01
     warnings: bool = True
     skip_empty_header: bool = False
+    queue_size: int = Field(default=16, gt=0)
+    shared_memory: bool = False
+    parser: Literal["numpy", "lasio"] = "numpy"
+    append: bool = False
+    incremental: bool = False
+    checkpoint: int = Field(default=0, ge=0)
+    resume: bool = False
+    on_error: Literal["skip", "abort", "quarantine"] = "skip"
+    quarantine_directory: Path | None = None
+    timeout: float | None = Field(default=None, gt=0)
+    memory_limit: int | None = Field(default=None, gt=0)
+    max_tasks: int | None = Field(default=None, gt=0)
+    order: Literal["size", "files"] = "size"
+    n_workers: int | None = Field(default=None, ge=0)
+    bulk: bool = False
+    shards: bool = False
+    flush_size: int | None = Field(default=None, gt=0)
+
+    @property
+    def flush_bytes(self) -> int | None:
+        """Flush size in bytes."""
+        return None if self.flush_size is None else self.flush_size * 2**20
+
+    @model_validator(mode="after")
+    def quarantine_directory_required(self) -> "ImportOptions":
+        if self.on_error == "quarantine" and self.quarantine_directory is None:
+            raise ValueError("A quarantine directory is required to quarantine files.")
+        return self
@@ -0,0 +1,133 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                '
+#                                                                              '
+#  This file is part of las-geoh5 package.                                     '
+#                                                                              '
+#  las-geoh5 is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                 '
+#                                                                              '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from shutil import move
+from typing import Any
+
+from las_geoh5.pool import Failure
+
+
+def available_path(directory: Path, name: str) -> Path:
+    """
+    Path to a file of a directory, numbered if the name is already taken.
+
+    :param directory: Directory receiving the file.
+    :param name: Name of the file.
+
+    :return: Path to the file, with the stem suffixed by '_1', '_2', ... if
+        needed, so that no existing file is replaced.
+    """
+
+    path = directory / name
+    count = 0
+    while path.exists():
+        count += 1
+        path = directory / f"{Path(name).stem}_{count}{Path(name).suffix}"
+
+    return path
+
+
+class ImportReport:
+    """
+    Record the LAS files failing to import, and apply the error policy to them.
+
+    :param on_error: Policy for the LAS files failing to import, either 'skip'
+        to leave them out, 'quarantine' to also move them to the quarantine
+        directory, or 'abort' to stop the import on the first error.
+    :param quarantine_directory: Directory receiving the quarantined files.
+    :param logger: Logger reporting the failures.
+    """
+
+    def __init__(
+        self,
+        on_error: str = "skip",
+        quarantine_directory: Path | None = None,
+        logger: logging.Logger | None = None,
+    ):
+        if on_error == "quarantine" and quarantine_directory is None:
+            raise ValueError("A quarantine directory is required to quarantine files.")
+
+        self.on_error = on_error
+        self.quarantine_directory = quarantine_directory
+        self.logger = logger or logging.getLogger(__name__)
+        self.failures: list[Failure] = []
+
+    @property
+    def capture_errors(self) -> bool:
+        """
+        Whether the errors raised by the files are captured rather than raised.
+        """
+        return self.on_error != "abort"
+
+    @property
+    def failed(self) -> set[str]:
+        """
+        Paths to the LAS files that failed to import.
+        """
+        return {str(failure.item) for failure in self.failures}
+
+    def reject(self, failure: Failure):
+        """
+        Record a file failing to import, moving it to the quarantine directory
+        if required. Files with the name of a quarantined one are numbered.
+
+        :param failure: Failure of the file.
+        """
+
+        self.failures.append(failure)
+        self.logger.warning("Skipping LAS file '%s': %s", failure.item, failure.reason)
+
+        if self.on_error == "quarantine" and self.quarantine_directory is not None:
+            self.quarantine_directory.mkdir(parents=True, exist_ok=True)
+            move(
+                failure.item,
+                available_path(self.quarantine_directory, Path(failure.item).name),
+            )
+
+    def filter(self, results: Iterable[Any]) -> Iterator[Any]:
+        """
+        Drop the failures from results, rejecting the corresponding files.
+
+        :param results: Results of the files, read with errors captured.
+
+        :return: Iterator over the successful results.
+        """
+
+        for result in results:
+            if isinstance(result, Failure):
+                self.reject(result)
+            else:
+                yield result
+
+    def summarize(self):
+        """
+        Log the files that failed to import along with the reasons.
+        """
+
+        if not self.failures:
+            return
+
+        self.logger.warning(
+            "%i LAS file(s) failed to import%s:\n%s",
+            len(self.failures),
+            (
+                f" and were moved to '{self.quarantine_directory}'"
+                if self.on_error == "quarantine"
+                else ""
+            ),
+            "\n".join(
+                f"  {failure.item}: {failure.reason}" for failure in self.failures
+            ),
+        )
@@ -0,0 +1,494 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                '
+#                                                                              '
+#  This file is part of las-geoh5 package.                                     '
+#                                                                              '
+#  las-geoh5 is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                 '
+#                                                                              '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from functools import partial
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any, NamedTuple
+from uuid import UUID, uuid4
+
+import h5py
+import numpy as np
+from geoh5py import Workspace
+from geoh5py.groups import DrillholeGroup
+from geoh5py.shared import Entity
+from geoh5py.shared.utils import as_str_if_uuid
+
+from las_geoh5.bulk_import import create_drillholes
+from las_geoh5.import_files.params import ImportOptions
+from las_geoh5.import_files.report import ImportReport
+from las_geoh5.import_las import (
+    LASHeader,
+    LASRecord,
+    LASTranslator,
+    las_to_drillhole,
+    read_header,
+)
+from las_geoh5.pool import Failure, stream
+from las_geoh5.workspace_index import WorkspaceIndex
+
+
+COMPRESSION = 5
+
+
+class Shard(NamedTuple):
+    """
+    Drillholes written by a process to a temporary geoh5 file.
+
+    :param path: Path to the geoh5 file of the shard.
+    :param group: Drillhole group holding the drillholes.
+    :param sources: Drillhole and data created, by path of the file they come from.
+    :param failures: Failures of the LAS files that could not be imported.
+    """
+
+    path: Path
+    group: UUID
+    sources: dict[str, tuple[UUID, list[UUID]]]
+    failures: list[Failure]
+
+
+def partition(
+    files: list[str], headers: dict[str, LASHeader], n_shards: int
+) -> list[list[str]]:
+    """
+    Partition LAS files by drillhole into shards of about the same size.
+
+    All the files of a drillhole are placed in the same shard, so that each
+    drillhole is written by a single process. The largest drillholes are
+    placed first, each in the shard holding the fewest bytes so far.
+
+    :param files: Paths to the LAS files.
+    :param headers: Headers of the LAS files, by path.
+    :param n_shards: Number of shards.
+
+    :return: Paths to the LAS files of the non-empty shards.
+    """
+
+    drillholes: dict[str, list[str]] = {}
+    for file in files:
+        drillholes.setdefault(headers[file].name, []).append(file)
+
+    sizes = {
+        name: sum(Path(file).stat().st_size for file in group)
+        for name, group in drillholes.items()
+    }
+    shards: list[list[str]] = [[] for _ in range(max(n_shards, 1))]
+    loads = [0] * len(shards)
+    for name in sorted(drillholes, key=sizes.__getitem__, reverse=True):
+        smallest = loads.index(min(loads))
+        shards[smallest] += drillholes[name]
+        loads[smallest] += sizes[name]
+
+    return [shard for shard in shards if shard]
+
+
+def write_shard(
+    files: list[str],
+    *,
+    reader: Callable[[str], LASRecord],
+    property_group: str,
+    options: ImportOptions,
+    directory: Path,
+    capture_errors: bool = True,
+) -> Shard:
+    """
+    Import LAS files into the drillhole group of a new temporary geoh5 file.
+
+    :param files: Paths to the LAS files.
+    :param reader: Function reading the record of a LAS file.
+    :param property_group: Property group name.
+    :param options: Import options.
+    :param directory: Directory receiving the geoh5 file.
+    :param capture_errors: Return the failures of the files rather than
+        raising on the first error.
+
+    :return: The shard holding the drillholes.
+    """
+
+    path = directory / f"{uuid4()}.geoh5"
+    failures = []
+
+    def keep(records):
+        for record in records:
+            if isinstance(record, Failure):
+                failures.append(record)
+            else:
+                yield record
+
+    with Workspace.create(path) as workspace:
+        group = DrillholeGroup.create(workspace)
+        index = WorkspaceIndex(workspace, group)
+        (create_drillholes if options.bulk else las_to_drillhole)(
+            keep(stream(reader, files, processes=0, capture_errors=capture_errors)),
+            group,
+            property_group,
+            options=options,
+            index=index,
+            attach=False,
+        )
+        sources = {
+            file: (data[0].parent.uid, [datum.uid for datum in data])
+            for file, data in index.sources.items()
+        }
+
+    return Shard(path, group.uid, sources, failures)
+
+
+def type_key(data_type: h5py.Group) -> tuple | None:
+    """
+    Key matching the data types shared by the drillholes of different shards.
+
+    Float types are matched by name, and referenced types by name and value
+    map, as done by :obj:`las_geoh5.workspace_index.TypeRegistry` for the
+    data of a single workspace.
+
+    :param data_type: Data type stored in a geoh5 file.
+
+    :return: Key of the data type, or None for the other types.
+    """
+
+    primitive_type = data_type.attrs.get("Primitive type")
+    if primitive_type == "Float":
+        return data_type.attrs["Name"], primitive_type, None
+
+    if primitive_type == "Referenced" and "Value map" in data_type:
+        value_map = tuple(
+            (int(key), value.decode() if isinstance(value, bytes) else str(value))
+            for key, value in data_type["Value map"][:].tolist()
+        )
+        return data_type.attrs["Name"], primitive_type, value_map
+
+    return None
+
+
+def merge_types(source: h5py.Group, target: h5py.Group) -> dict[str, str]:
+    """
+    Copy the data types of a shard missing from the target geoh5 file.
+
+    :param source: Data types of the shard.
+    :param target: Data types of the target geoh5 file.
+
+    :return: Identifiers of the target types replacing the ones of the shard.
+    """
+
+    keys = {}
+    for uid, data_type in target.items():
+        key = type_key(data_type)
+        if key is not None:
+            keys.setdefault(key, uid)
+
+    replaced = {}
+    for uid, data_type in source.items():
+        key = type_key(data_type)
+        if key in keys:
+            replaced[uid] = keys[key]
+        elif uid not in target:
+            source.copy(data_type, target, name=uid)
+
+    return replaced
+
+
+def length(target: h5py.Group, name: str, gathered: dict[str, tuple]) -> int:
+    """
+    Length of a dataset once the arrays gathered for it are appended.
+
+    :param target: Group holding the dataset.
+    :param name: Name of the dataset.
+    :param gathered: Type and arrays to append, by dataset name.
+
+    :return: Length of the dataset and of the arrays to append.
+    """
+
+    current = len(target[name]) if name in target else 0
+    return current + sum(len(values) for values in gathered.get(name, ((), []))[1])
+
+
+def write_gathered(target: h5py.Group, gathered: dict[str, tuple]):
+    """
+    Append the arrays gathered for the datasets, writing each dataset once.
+
+    :param target: Group holding the datasets, created if missing.
+    :param gathered: Type of the values stored in the file, and the arrays to
+        append, by dataset name.
+    """
+
+    for name, (dtype, arrays) in gathered.items():
+        if name in target:
+            if len(target[name]) > 0:
+                dtype = target[name].dtype
+                arrays = [target[name][:], *arrays]
+            del target[name]
+
+        target.create_dataset(
+            name,
+            data=np.concatenate([values.astype(dtype) for values in arrays]),
+            dtype=dtype,
+            compression="gzip",
+            compression_opts=COMPRESSION,
+        )
+
+
+def gather_shard(
+    source: h5py.Group,
+    target: h5py.Group,
+    types: dict[str, str],
+    gathered: dict[str, tuple],
+):
+    """
+    Gather the concatenated arrays of a drillhole group to append to another one.
+
+    The start indices of the drillholes are shifted by the length of the target
+    arrays, including the arrays gathered from the previous shards.
+
+    :param source: Drillhole group of the shard.
+    :param target: Drillhole group receiving the drillholes.
+    :param types: Identifiers of the target types replacing the ones of the shard.
+    :param gathered: Type and arrays to append, by dataset name relative to the
+        target group, extended with the arrays of the shard.
+    """
+
+    def gather(name: str, values: np.ndarray, dtype: Any):
+        gathered.setdefault(name, (dtype, []))[1].append(values)
+
+    attributes = []
+    for attribute in source["Concatenated Data"]["Attributes Jsons"][:]:
+        values = json.loads(attribute)
+        if values.get("Type ID") in types:
+            values["Type ID"] = types[values["Type ID"]]
+            attribute = json.dumps(values).encode()
+        attributes.append(attribute)
+
+    concatenated = source["Concatenated Data"]
+    for name, index in concatenated["Index"].items():
+        data = f"Data/{name}" if name in concatenated["Data"] else name
+        rows = index[:]
+        rows["Start index"] += length(target, f"Concatenated Data/{data}", gathered)
+        gather(
+            f"Concatenated Data/{data}", concatenated[data][:], concatenated[data].dtype
+        )
+        gather(f"Concatenated Data/Index/{name}", rows, index.dtype)
+
+    gather(
+        "Concatenated Data/Attributes Jsons",
+        np.array(attributes, dtype=object),
+        concatenated["Attributes Jsons"].dtype,
+    )
+    gather(
+        "Concatenated object IDs",
+        source["Concatenated object IDs"][:],
+        source["Concatenated object IDs"].dtype,
+    )
+
+
+def merge_shards(h5file: str | Path | BytesIO, group: UUID, shards: list[Shard]):
+    """
+    Assemble the drillholes of shards into the drillhole group of a geoh5 file.
+
+    The concatenated arrays of all the shards are gathered before being
+    appended, so that each dataset of the drillhole group is written once. The
+    file must be closed by its workspace, and re-opened after the merge for the
+    drillholes to be loaded.
+
+    :param h5file: Path or buffer of the target geoh5 file.
+    :param group: Drillhole group receiving the drillholes.
+    :param shards: Shards holding the drillholes.
+    """
+
+    with h5py.File(h5file, "r+") as target_file:
+        base = target_file[list(target_file)[0]]
+        target = base["Groups"][as_str_if_uuid(group)]
+        target_types = base["Types"].require_group("Data types")
+        gathered: dict[str, tuple] = {}
+        for shard in shards:
+            with h5py.File(shard.path, "r") as source_file:
+                source_base = source_file[list(source_file)[0]]
+                source = source_base["Groups"][as_str_if_uuid(shard.group)]
+                if "Concatenated Data" not in source:
+                    continue
+
+                types = merge_types(source_base["Types"]["Data types"], target_types)
+                gather_shard(source, target, types, gathered)
+
+        write_gathered(target, gathered)
+
+
+def write_shards(
+    shards: list[list[str]],
+    directory: Path,
+    *,
+    reader: Callable[[str], LASRecord],
+    property_group: str,
+    options: ImportOptions,
+    report: ImportReport,
+) -> list[Shard]:
+    """
+    Write shards with one process each.
+
+    The failures of the files are recorded in the report, including all the
+    files of a shard if its process fails.
+
+    :param shards: Paths to the LAS files of each shard.
+    :param directory: Directory receiving the geoh5 files.
+    :param reader: Function reading the record of a LAS file.
+    :param property_group: Property group name.
+    :param options: Import options.
+    :param report: Report of the files failing to import.
+
+    :return: The shards written.
+    """
+
+    results = stream(
+        partial(
+            write_shard,
+            reader=reader,
+            property_group=property_group,
+            options=options,
+            directory=directory,
+            capture_errors=report.capture_errors,
+        ),
+        shards,
+        processes=len(shards),
+        capture_errors=report.capture_errors,
+        memory_limit=options.memory_limit,
+    )
+    written = []
+    for files, shard in zip(shards, results, strict=True):
+        if isinstance(shard, Failure):
+            for file in files:
+                report.reject(Failure(file, shard.reason))
+            continue
+
+        for failure in shard.failures:
+            report.reject(failure)
+        written.append(shard)
+
+    return written
+
+
+def fetch_sources(workspace: Workspace, shards: list[Shard]) -> dict[str, list[Entity]]:
+    """
+    Fetch the data merged from shards.
+
+    :param workspace: Workspace holding the merged drillholes.
+    :param shards: Merged shards.
+
+    :return: Data created, by path of the file they come from.
+    """
+
+    sources = {}
+    for shard in shards:
+        for file, (uid, data) in shard.sources.items():
+            drillhole = workspace.get_entity(uid)[0]
+            sources[file] = [drillhole.get_entity(datum)[0] for datum in data]
+
+    return sources
+
+
+def split_new_drillholes(
+    files: list[str],
+    index: WorkspaceIndex,
+    translator: LASTranslator,
+    n_shards: int,
+) -> tuple[list[str], list[list[str]]]:
+    """
+    Split the LAS files of new drillholes into shards.
+
+    The files of drillholes already in the workspace, as well as the files
+    whose header cannot be read, are left to the main process.
+
+    :param files: Paths to the LAS files.
+    :param index: Index of the workspace names.
+    :param translator: Translator for LAS files.
+    :param n_shards: Number of shards.
+
+    :return: Paths to the LAS files left to the main process, and to the LAS
+        files of each shard.
+    """
+
+    headers = stream(
+        partial(read_header, translator=translator),
+        files,
+        processes=n_shards,
+        capture_errors=True,
+    )
+    remaining = []
+    new = {}
+    for file, header in zip(files, headers, strict=True):
+        if isinstance(header, Failure) or header.name in index.names:
+            remaining.append(file)
+        else:
+            new[file] = header
+
+    return remaining, partition(list(new), new, n_shards)
+
+
+def import_shards(
+    files: list[str],
+    dh_group: DrillholeGroup,
+    *,
+    processes: int,
+    reader: Callable[[str], LASRecord],
+    property_group: str,
+    options: ImportOptions,
+    report: ImportReport,
+) -> tuple[list[str], DrillholeGroup, dict[str, list[Entity]]]:
+    """
+    Import the new drillholes with one process per shard, then merge the shards.
+
+    Each process writes complete drillholes to a temporary geoh5 file, so that
+    the data is written in parallel. The workspace is closed during the merge,
+    and its entities are loaded again when re-opening it.
+
+    :param files: Paths to the LAS files.
+    :param dh_group: Destination drillhole group.
+    :param processes: Number of processes writing the shards.
+    :param reader: Function reading the record of a LAS file.
+    :param property_group: Property group name.
+    :param options: Import options.
+    :param report: Report of the files failing to import.
+
+    :return: Paths to the LAS files left to the main process, the destination
+        drillhole group of the re-opened workspace, and the data created by
+        path of the file they come from.
+    """
+
+    files, shards = split_new_drillholes(
+        files,
+        WorkspaceIndex(dh_group.workspace, dh_group),
+        LASTranslator(options.names),
+        processes,
+    )
+    if not shards:
+        return files, dh_group, {}
+
+    with TemporaryDirectory() as directory:
+        written = write_shards(
+            shards,
+            Path(directory),
+            reader=reader,
+            property_group=property_group,
+            options=options,
+            report=report,
+        )
+        workspace = dh_group.workspace
+        workspace.close()
+        merge_shards(workspace.h5file, dh_group.uid, written)
+        workspace.open(mode="r+")
+
+    return (
+        files,
+        workspace.get_entity(dh_group.uid)[0],
+        fetch_sources(workspace, written),
+    )
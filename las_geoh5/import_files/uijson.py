@@ -85,6 +85,141 @@ ui_json = dict(
                 "Check this box to skip these files."
             ),
         },
+        "append": {
+            "main": True,
+            "label": "Append to input file",
+            "value": False,
+            "tooltip": (
+                "Add the drillholes and data to the input geoh5 file in place, "
+                "rather than rewriting the drillhole group."
+            ),
+        },
+        "incremental": {
+            "main": True,
+            "label": "Skip unchanged files",
+            "value": False,
+            "tooltip": (
+                "Skip the files unchanged since their last import into the "
+                "drillhole group, and replace the data of the changed ones."
+            ),
+        },
+        "checkpoint": {
+            "main": True,
+            "label": "Files between checkpoints",
+            "value": 0,
+            "min": 0,
+            "tooltip": (
+                "Number of files imported between checkpoints saving the state "
+                "of the import. Set to 0 to disable checkpoints."
+            ),
+        },
+        "resume": {
+            "main": True,
+            "label": "Resume from checkpoint",
+            "value": False,
+            "tooltip": (
+                "Resume an interrupted import from its last checkpoint, "
+                "skipping the files already imported."
+            ),
+        },
+        "n_workers": {
+            "main": True,
+            "label": "Number of processes",
+            "value": 0,
+            "min": 0,
+            "optional": True,
+            "enabled": False,
+            "tooltip": (
+                "Number of processes reading the files, or 0 to read them in "
+                "the main process. Chosen from the size of the import if disabled."
+            ),
+        },
+        "timeout": {
+            "main": True,
+            "label": "Time limit per file (s)",
+            "value": 60.0,
+            "min": 1.0,
+            "optional": True,
+            "enabled": False,
+            "tooltip": (
+                "Time limit to read a file, after which the processes are "
+                "replaced and the file fails to import. Unlimited if disabled."
+            ),
+        },
+        "memory_limit": {
+            "main": True,
+            "label": "Memory limit per process (MB)",
+            "value": 4096,
+            "min": 1,
+            "optional": True,
+            "enabled": False,
+            "tooltip": (
+                "Memory limit of the processes reading the files, above which "
+                "the file being read fails to import. Unlimited if disabled."
+            ),
+        },
+        "max_tasks": {
+            "main": True,
+            "label": "Files per process",
+            "value": 100,
+            "min": 1,
+            "optional": True,
+            "enabled": False,
+            "tooltip": (
+                "Number of files read by a process before it is replaced, "
+                "releasing the memory it holds. Never replaced if disabled."
+            ),
+        },
+        "bulk": {
+            "main": True,
+            "label": "Write by drillhole",
+            "value": False,
+            "tooltip": (
+                "Hold the files in memory to write each drillhole at once, "
+                "rather than file by file."
+            ),
+        },
+        "shards": {
+            "main": True,
+            "label": "Write drillholes in parallel",
+            "value": False,
+            "tooltip": (
+                "Write the new drillholes from the processes to temporary "
+                "files, merged into the drillhole group."
+            ),
+        },
+        "flush_size": {
+            "main": True,
+            "label": "Write buffer (MB)",
+            "value": 512,
+            "min": 1,
+            "optional": True,
+            "enabled": False,
+            "tooltip": (
+                "Size of the data added to the drillhole group before it is "
+                "written to the file. Written once per batch of files if disabled."
+            ),
+        },
+        "on_error": {
+            "main": True,
+            "label": "Files failing to import",
+            "choiceList": ["skip", "quarantine", "abort"],
+            "value": "skip",
+            "tooltip": (
+                "Skip the files failing to import, move them to the quarantine "
+                "directory, or abort the import on the first error."
+            ),
+        },
+        "quarantine_directory": {
+            "main": True,
+            "label": "Quarantine directory",
+            "fileDescription": ["Directory"],
+            "fileType": ["directory"],
+            "value": None,
+            "directoryOnly": True,
+            "optional": True,
+            "enabled": False,
+        },
         "warnings": {
             "main": True,
             "label": "Warnings",
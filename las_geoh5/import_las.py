@@ -8,23 +8,36 @@
 #                                                                              '
 # ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
 
+# pylint: disable=too-many-lines
+
 from __future__ import annotations
 
 import logging
+import numbers
 import re
+import sys
+from collections.abc import Container, Iterable, Iterator
+from contextlib import contextmanager
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import lasio
 import numpy as np
 from geoh5py import Workspace
+from geoh5py.data import Data
 from geoh5py.groups import DrillholeGroup
 from geoh5py.objects import Drillhole, ObjectBase
-from geoh5py.shared import Entity
 from geoh5py.shared.concatenation import ConcatenatedDrillhole
 from tqdm import tqdm
 
+from las_geoh5.concatenation import deferred_writes
 from las_geoh5.import_files.params import ImportOptions, NameOptions
+from las_geoh5.import_files.report import ImportReport
+from las_geoh5.lasio_patch import patch_lasio_reader
+from las_geoh5.pool import Failure, stream
+from las_geoh5.workspace_index import WorkspaceIndex, value_map_key
 
 
 _logger = logging.getLogger(__name__)
@@ -150,7 +163,220 @@ def get_collar(
     return collar
 
 
-def find_copy_name(obj: Workspace | ObjectBase, basename: str, start: int = 0):
+class SharedArray(NamedTuple):
+    """Handle on an array stored in a shared memory block."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+class LASHeader(NamedTuple):
+    """Content of the header of a LAS file needed to plan an import."""
+
+    name: str
+    collar: list[float]
+    curves: list[str]
+
+
+class LASRecord:
+    """
+    Compact representation of the content of a LAS file needed for import.
+
+    Holds the well name and collar read from the header, the depth locations,
+    and the remaining numeric curves stacked in a single 2-D array, so that
+    parsed files can be passed between processes at about the cost of their
+    numeric data. Text curves are held apart, by curve name.
+
+    :param name: Name of the well.
+    :param collar: Collar coordinates of the well.
+    :param depths: Depth data as 'from-to' interval or 'depth' locations.
+    :param curves: Names of the data curves.
+    :param units: Units of the data curves.
+    :param values: Values of the numeric data curves stacked as rows.
+    :param value_maps: Value maps of the referenced data curves.
+    :param text: Values of the text data curves by curve name.
+    """
+
+    __slots__ = (
+        "collar",
+        "curves",
+        "depths",
+        "memory",
+        "name",
+        "path",
+        "text",
+        "units",
+        "value_maps",
+        "values",
+    )
+
+    def __init__(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        name: str,
+        collar: list[float],
+        depths: dict[str, np.ndarray],
+        curves: list[str],
+        units: list[str],
+        values: np.ndarray,
+        value_maps: dict[str, dict[int, str]],
+        text: dict[str, np.ndarray] | None = None,
+    ):
+        self.name = name
+        self.collar = collar
+        self.depths = depths
+        self.curves = curves
+        self.units = units
+        self.values = values
+        self.value_maps = value_maps
+        self.text = text or {}
+        self.memory: SharedMemory | SharedArray | None = None
+        self.path: str | None = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = {k: getattr(self, k) for k in self.__slots__}
+        if isinstance(self.memory, SharedArray):
+            state["values"] = None
+
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        for key, value in state.items():
+            setattr(self, key, value)
+
+        handle = state["memory"]
+        if isinstance(handle, SharedArray):
+            memory = SharedMemory(name=handle.name)
+            self.memory = memory
+            self.values = np.ndarray(
+                handle.shape, dtype=handle.dtype, buffer=memory.buf
+            )
+
+    def share(self) -> LASRecord:
+        """
+        Move the curve values to a shared memory block.
+
+        Only a handle on the block is pickled afterward, and the values are
+        mapped back without copy when the record is unpickled. The receiving
+        process is responsible for calling :meth:`release` once the values
+        are consumed. Non-numeric values are left in place, as well as all
+        values on Windows, where the block does not outlive its creator.
+
+        :return: The record itself.
+        """
+
+        if sys.platform == "win32" or self.memory is not None or self.values.size == 0:
+            return self
+
+        memory = SharedMemory(create=True, size=self.values.nbytes)
+        shared = np.ndarray(self.values.shape, self.values.dtype, buffer=memory.buf)
+        shared[:] = self.values
+        del shared
+        self.memory = SharedArray(memory.name, self.values.shape, self.values.dtype.str)
+        memory.close()
+
+        # the receiving process owns the block from now on, which must not be
+        # unlinked by the resource tracker of this one when it exits
+        resource_tracker.unregister(
+            memory._name,  # pylint: disable=protected-access
+            "shared_memory",
+        )
+
+        return self
+
+    def release(self):
+        """Free the shared memory block holding the curve values, if any."""
+
+        if isinstance(self.memory, SharedArray):
+            # the values were shared but consumed by the process sharing them
+            self.memory = SharedMemory(name=self.memory.name)
+        if not isinstance(self.memory, SharedMemory):
+            return
+
+        self.values = np.empty((len(self.curves) - len(self.text), 0))
+        self.memory.unlink()
+        self.memory.close()
+        self.memory = None
+
+    @classmethod
+    def from_lasfile(
+        cls,
+        lasfile: lasio.LASFile,
+        translator: LASTranslator | None = None,
+        logger: logging.Logger | None = None,
+    ) -> LASRecord:
+        """
+        Extract the content of a lasio file object.
+
+        :param lasfile: Las file object.
+        :param translator: Translator for LAS file.
+        :param logger: Logger object if warnings are enabled.
+
+        :return: Record of the LAS file.
+        """
+
+        if translator is None:
+            translator = LASTranslator(NameOptions())
+
+        name = translator.retrieve("well_name", lasfile)
+        if not isinstance(name, str):
+            name = str(name)
+
+        curves = [
+            k for k in lasfile.curves if k.mnemonic not in ["DEPT", "DEPTH", "TO"]
+        ]
+        depths = get_depths(lasfile)
+        text = {
+            k.mnemonic: k.data
+            for k in curves
+            if not np.issubdtype(k.data.dtype, np.number)
+        }
+        numeric = [k for k in curves if k.mnemonic not in text]
+        values = np.empty((len(numeric), len(next(iter(depths.values())))))
+        for ind, curve in enumerate(numeric):
+            values[ind] = curve.data
+
+        is_referenced = any(k.descr == "REFERENCE" for k in lasfile.params)
+        value_maps = {}
+        for curve in curves:
+            if is_referenced and any(
+                curve.mnemonic in k.mnemonic for k in lasfile.params
+            ):
+                value_maps[curve.mnemonic] = {
+                    int(k.mnemonic.split()[1][1:-1]): k.value
+                    for k in lasfile.params
+                    if curve.mnemonic in k.mnemonic
+                }
+
+        return cls(
+            name,
+            get_collar(lasfile, translator, logger),
+            depths,
+            [k.mnemonic for k in curves],
+            [k.unit for k in curves],
+            values,
+            value_maps,
+            text,
+        )
+
+    def curve_values(self) -> Iterator[tuple[str, str, np.ndarray]]:
+        """
+        Iterate over the data curves in the order of the file.
+
+        :return: Iterator over the name, unit and values of the curves.
+        """
+
+        rows = iter(self.values)
+        for curve, unit in zip(self.curves, self.units, strict=True):
+            yield curve, unit, self.text[curve] if curve in self.text else next(rows)
+
+
+def find_copy_name(
+    obj: Workspace | ObjectBase,
+    basename: str,
+    start: int = 0,
+    reserved: Container[str] = (),
+):
     """
     Augment name with increasing integer value until no entities found.
 
@@ -158,17 +384,108 @@ def find_copy_name(obj: Workspace | ObjectBase, basename: str, start: int = 0):
     :param basename: Existing name of entity in workspace.
     :param start: Integer name augmenter to test for existence.  Default is
         0 and does not add a suffix
+    :param reserved: Names of entities about to be created, also skipped.
 
     :returns: Suffix name of the earliest non-existent copy in workspace.
     """
 
     name = basename if start == 0 else f"{basename} ({start})"
     child = obj.get_entity(name)
-    if child and child[0] is not None:
-        name = find_copy_name(obj, basename, start=start + 1)
+    while name in reserved or (child and child[0] is not None):
+        start += 1
+        name = f"{basename} ({start})"
+        child = obj.get_entity(name)
+
     return name
 
 
+def index_surveys(surveys: list[Path]) -> dict[str, Path]:
+    """
+    Index survey files by drillhole name.
+
+    Files are matched on their stem, or on their stem without the '_survey'
+    suffix added on export.
+
+    :param surveys: Paths to survey files stored as .csv or .las format.
+
+    :return: Survey files by drillhole name.
+    """
+
+    index = {Path(survey).stem: Path(survey) for survey in surveys}
+    for stem, survey in list(index.items()):
+        if stem.endswith("_survey"):
+            index.setdefault(stem[: -len("_survey")], survey)
+
+    return index
+
+
+def read_survey(survey: str | Path) -> np.ndarray | None:
+    """
+    Read survey data from CSV or LAS format.
+
+    :param survey: Path to a survey file stored as .csv or .las format.
+
+    :return: Survey depths, dips and azimuths stacked as columns, or None if
+        the file does not hold the expected data.
+    """
+
+    survey = Path(survey)
+    if survey.suffix == ".las":
+        file = lasio_read(survey)
+        try:
+            return np.c_[get_depths(file)["depth"], file["DIP"], file["AZIM"]]
+        except (KeyError, ValueError):
+            return None
+
+    try:
+        surveys = np.loadtxt(survey, delimiter=",", ndmin=2)
+    except ValueError:
+        surveys = np.genfromtxt(survey, delimiter=",", skip_header=0, ndmin=2)
+
+    if surveys.shape[1] != 3:
+        return None
+
+    return surveys
+
+
+def set_survey(
+    drillhole: ConcatenatedDrillhole,
+    surveys: np.ndarray | None,
+    survey: Path,
+    logger: logging.Logger | None = None,
+) -> ConcatenatedDrillhole:
+    """
+    Set survey data read from a file on a drillhole.
+
+    Surveys from LAS files only replace the default survey of a drillhole.
+
+    :param drillhole: Drillhole object to append data to.
+    :param surveys: Survey data read from the file, or None if invalid.
+    :param survey: Path to the survey file.
+    :param logger: logger object if warning are enabled.
+
+    :return: Updated drillhole object.
+    """
+
+    if surveys is None:
+        if logger is not None and survey.suffix == ".las":
+            logger.warning(
+                "Attempted survey import failed because data read from "
+                ".las file did not contain the expected 3 curves 'DEPTH'"
+                ", 'DIP', 'AZIM'."
+            )
+        elif logger is not None:
+            logger.warning(
+                "Attempted survey import failed because data read from "
+                "comma separated file did not contain the expected 3 "
+                "columns of depth/dip/azimuth."
+            )
+    elif survey.suffix != ".las" or len(drillhole.surveys) == 1:
+        drillhole.surveys = surveys
+
+    return drillhole
+
+
 def add_survey(
     survey: str | Path,
     drillhole: ConcatenatedDrillhole,
@@ -184,150 +501,248 @@ def add_survey(
     :return: Updated drillhole object.
     """
 
-    if isinstance(survey, str):
-        survey = Path(survey)
+    survey = Path(survey)
 
-    if survey.suffix == ".las":
-        file = lasio_read(survey)
-        try:
-            surveys = np.c_[get_depths(file)["depth"], file["DIP"], file["AZIM"]]
-            if len(drillhole.surveys) == 1:
-                drillhole.surveys = surveys
-        except KeyError:
-            if logger is not None:
-                logger.warning(
-                    "Attempted survey import failed because data read from "
-                    ".las file did not contain the expected 3 curves 'DEPTH'"
-                    ", 'DIP', 'AZIM'."
-                )
-    else:
-        surveys = np.genfromtxt(survey, delimiter=",", skip_header=0)
-        if surveys.shape[1] == 3:
-            drillhole.surveys = surveys
-        else:
-            if logger is not None:
-                logger.warning(
-                    "Attempted survey import failed because data read from "
-                    "comma separated file did not contain the expected 3 "
-                    "columns of depth/dip/azimuth."
-                )
+    return set_survey(drillhole, read_survey(survey), survey, logger)
 
-    return drillhole
+
+def find_property_group(
+    drillhole: ConcatenatedDrillhole,
+    group_name: str,
+    depths: dict[str, np.ndarray],
+    collocation_tolerance: float,
+    index: WorkspaceIndex,
+) -> str:
+    """
+    Find the property group of a drillhole to receive data at given locations.
+
+    :param drillhole: Drillhole object to append data to.
+    :param group_name: Property group name.
+    :param depths: Depth data as 'from-to' interval or 'depth' locations.
+    :param collocation_tolerance: Tolerance for determining collocation of data.
+    :param index: Index of the workspace names.
+
+    :return: Name of a collocated property group, or a new copy name if groups
+        with the same root name exist at other locations.
+    """
+
+    locations = depths["depth"] if "depth" in depths else depths["from-to"]
+    groups = index.property_groups(drillhole)
+    if not any(group_name in name for name in groups.names):
+        return group_name
+
+    group = groups.find_collocated(group_name, locations, collocation_tolerance)
+    if group is not None:
+        return group.name
+
+    return index.copy_name(group_name)
 
 
 def add_data(
     drillhole: ConcatenatedDrillhole,
-    lasfile: lasio.LASFile,
+    lasfile: lasio.LASFile | LASRecord,
     group_name: str,
     collocation_tolerance: float = 0.01,
+    *,
+    index: WorkspaceIndex | None = None,
 ) -> ConcatenatedDrillhole:
     """
     Add data from LAS file curves to drillhole.
 
     :param drillhole: Drillhole object to append data to.
-    :param lasfile: Las file object.
+    :param lasfile: Las file object or record.
     :param group_name: Property group name.
     :param collocation_tolerance: Tolerance for determining collocation of data.
+    :param index: Index of the workspace names and data types, built from
+        the workspace if not provided.
 
     :return: Updated drillhole object.
     """
 
-    depths = get_depths(lasfile)
-    property_group_kwargs = {}
-    if "depth" in depths:
-        locations = depths["depth"]
-        property_group_kwargs["property_group_type"] = "Depth table"
-        property_group_kwargs["association"] = "DEPTH"
-    else:
-        locations = depths["from-to"]
-        property_group_kwargs["property_group_type"] = "Interval table"
-        property_group_kwargs["association"] = "FROM-TO"
+    if not isinstance(lasfile, LASRecord):
+        lasfile = LASRecord.from_lasfile(lasfile)
+
+    if index is None:
+        index = WorkspaceIndex(drillhole.workspace)
+
+    return add_records(
+        drillhole, [lasfile], group_name, collocation_tolerance, index=index
+    )
+
+
+def record_kwargs(
+    drillhole: ConcatenatedDrillhole,
+    record: LASRecord,
+    index: WorkspaceIndex,
+    reserved: Container[str] = (),
+) -> tuple[dict[str, Any], dict[str, tuple]]:
+    """
+    Arguments of geoh5py to add the curves of a LAS record to a drillhole.
+
+    :param drillhole: Drillhole object to append data to.
+    :param record: Record of the LAS file.
+    :param index: Index of the workspace names and data types.
+    :param reserved: Names of the data about to be added, also numbered.
+
+    :return: Arguments by data name, and the curve name, unit and value map of
+        the numeric data, identifying their data type.
+    """
 
     kwargs: dict[str, Any] = {}
-    for curve in [
-        k for k in lasfile.curves if k.mnemonic not in ["DEPT", "DEPTH", "TO"]
-    ]:
-        name = curve.mnemonic
-        if drillhole.get_data(name):
-            name = find_copy_name(drillhole, name)
-
-        kwargs[name] = {"values": curve.data, "association": "DEPTH"}
-        kwargs[name].update(depths)
-
-        is_referenced = any(name in k.mnemonic for k in lasfile.params)
-        is_referenced &= any(k.descr == "REFERENCE" for k in lasfile.params)
-        if is_referenced:
+    curve_types: dict[str, tuple] = {}
+    for curve, unit, values in record.curve_values():
+        name = curve
+        if drillhole.get_data(name) or name in reserved or name in kwargs:
+            name = find_copy_name(drillhole, name, reserved=[*reserved, *kwargs])
+
+        kwargs[name] = {"values": values, "association": "DEPTH"}
+        kwargs[name].update(record.depths)
+
+        value_map = record.value_maps.get(curve)
+        if value_map is not None:
             kwargs[name]["values"] = kwargs[name]["values"].astype(int)
-            value_map = {
-                k.mnemonic: k.value for k in lasfile.params if name in k.mnemonic
-            }
-            value_map = {int(k.split()[1][1:-1]): v for k, v in value_map.items()}
             kwargs[name]["value_map"] = value_map
             kwargs[name]["type"] = "referenced"
 
-        existing_data = drillhole.workspace.get_entity(name)[0]
-        if existing_data and isinstance(existing_data, Entity):
-            kwargs[name]["entity_type"] = existing_data.entity_type
+        if curve in record.text:
+            continue
+
+        curve_types[name] = (curve, unit, value_map)
+        entity_type = index.types.get(*curve_types[name])
+        if entity_type is not None:
+            kwargs[name]["entity_type"] = entity_type
+
+    return kwargs, curve_types
+
+
+def split_repeated_curves(
+    kwargs: dict[str, Any], curve_types: dict[str, tuple]
+) -> dict[str, Any]:
+    """
+    Remove the arguments of the curves repeating a curve without data type.
+
+    geoh5py creates a data type for each data added without one, so that the
+    repeated curves must be added once the type of their first occurrence is
+    registered.
+
+    :param kwargs: Arguments by data name, left with the first occurrences.
+    :param curve_types: Curve name, unit and value map of the numeric data.
+
+    :return: Arguments of the repeated curves by data name.
+    """
+
+    first: dict[tuple, str] = {}
+    repeated = {}
+    for name, (curve, unit, value_map) in curve_types.items():
+        if "entity_type" in kwargs[name]:
+            continue
+        if first.setdefault((curve, unit, value_map_key(value_map)), name) != name:
+            repeated[name] = kwargs.pop(name)
+
+    return repeated
+
+
+def register_data(
+    index: WorkspaceIndex,
+    data: Data | list[Data],
+    curve_types: dict[str, tuple],
+    sources: dict[str, str | None],
+):
+    """
+    Register the data added from LAS records to the index of the import.
+
+    :param index: Index of the workspace names and data types.
+    :param data: Data added to a drillhole.
+    :param curve_types: Curve name, unit and value map of the numeric data.
+    :param sources: Paths to the files the data come from, by data name.
+    """
+
+    for datum in data if isinstance(data, list) else [data]:
+        index.register(datum, source=sources.get(datum.name))
+        if datum.name in curve_types:
+            index.types.register(*curve_types[datum.name], datum.entity_type)
+
+
+def add_records(
+    drillhole: ConcatenatedDrillhole,
+    records: list[LASRecord],
+    group_name: str,
+    collocation_tolerance: float = 0.01,
+    *,
+    index: WorkspaceIndex,
+) -> ConcatenatedDrillhole:
+    """
+    Add the curves of LAS records sharing the same depths to a drillhole.
+
+    The curves of all the records are added with a single call to geoh5py,
+    under the property group of the first record. Curves with the same name
+    are numbered in the order of the records, and those without a data type
+    yet added by a second call reusing the type created by the first one.
+
+    :param drillhole: Drillhole object to append data to.
+    :param records: Records with the same depth data.
+    :param group_name: Property group name.
+    :param collocation_tolerance: Tolerance for determining collocation of data.
+    :param index: Index of the workspace names and data types.
+
+    :return: Updated drillhole object.
+    """
+
+    kwargs: dict[str, Any] = {}
+    curve_types: dict[str, tuple] = {}
+    sources: dict[str, str | None] = {}
+    for record in records:
+        record_data, record_types = record_kwargs(drillhole, record, index, kwargs)
+        kwargs.update(record_data)
+        curve_types.update(record_types)
+        sources.update(dict.fromkeys(record_data, record.path))
 
     if kwargs:
-        if drillhole.property_groups is not None:
-            root_name_matches = [
-                g for g in drillhole.property_groups if group_name in g.name
-            ]
-            if root_name_matches:
-                group = [
-                    g
-                    for g in root_name_matches
-                    if g.is_collocated(locations, collocation_tolerance)
-                ]
-                if group:
-                    group_name = group[0].name
-                else:
-                    group_name = find_copy_name(drillhole.workspace, group_name)
-
-        drillhole.add_data(kwargs, property_group=group_name)
+        group_name = find_property_group(
+            drillhole, group_name, records[0].depths, collocation_tolerance, index
+        )
+        repeated = split_repeated_curves(kwargs, curve_types)
+        data = drillhole.add_data(kwargs, property_group=group_name)
+        register_data(index, data, curve_types, sources)
+        if repeated:
+            for name, arguments in repeated.items():
+                arguments["entity_type"] = index.types.get(*curve_types[name])
+            data = drillhole.add_data(repeated, property_group=group_name)
+            register_data(index, data, curve_types, sources)
+        index.register_group(drillhole, group_name)
+        index.register_depths(drillhole, records[0].depths)
 
     return drillhole
 
 
-def create_or_append_drillhole(
-    lasfile: lasio.LASFile,
+def get_or_create_drillhole(
+    lasfile: LASRecord,
     drillhole_group: DrillholeGroup,
-    group_name: str,
-    *,
-    translator: LASTranslator | None = None,
-    collocation_tolerance: float = 0.01,
+    index: WorkspaceIndex,
     logger: logging.Logger | None = None,
 ) -> ConcatenatedDrillhole:
     """
-    Create a drillhole or append data to drillhole if it exists in workspace.
+    Get the drillhole of a LAS record, creating it if new.
 
-    :param lasfile: Las file object.
+    :param lasfile: Record of the LAS file.
     :param drillhole_group: Drillhole group container.
-    :param group_name: Property group name.
-    :param translator: Translator for LAS file.
-    :param collocation_tolerance: Tolerance for determining collocation of data.
+    :param index: Index of the workspace names.
     :param logger: Logger object if warnings are enabled.
 
-    :return: Created or augmented drillhole.
+    :return: Drillhole named after the well of the record.
     """
 
-    if translator is None:
-        translator = LASTranslator(NameOptions())
-
-    name = translator.retrieve("well_name", lasfile)
-    if not isinstance(name, str):
-        name = str(name)
+    name = lasfile.name
     if not name and logger is not None:
         logger.warning(
             "No well name provided for LAS file. Saving drillhole with name 'Unknown'."
         )
 
-    collar = get_collar(lasfile, translator, logger)
-    drillhole = drillhole_group.get_entity(name)[0]  # type: ignore
+    collar = lasfile.collar
+    drillhole = index.get_drillhole(name)
 
     if not isinstance(drillhole, Drillhole):
-        name = find_copy_name(drillhole_group.workspace, name)
+        name = index.copy_name(name)
         kwargs = {
             "name": name,
             "parent": drillhole_group,
@@ -336,200 +751,362 @@ def create_or_append_drillhole(
             kwargs["collar"] = collar
 
         drillhole = Drillhole.create(drillhole_group.workspace, **kwargs)
+        index.register(drillhole, drillhole=True)
 
     if not isinstance(drillhole, ConcatenatedDrillhole):
         raise TypeError(
             f"Drillhole {name} exists in workspace but is not a Drillhole object."
         )
 
+    return drillhole
+
+
+def create_or_append_drillhole(
+    lasfile: lasio.LASFile | LASRecord,
+    drillhole_group: DrillholeGroup,
+    group_name: str,
+    *,
+    translator: LASTranslator | None = None,
+    collocation_tolerance: float = 0.01,
+    logger: logging.Logger | None = None,
+    index: WorkspaceIndex | None = None,
+) -> ConcatenatedDrillhole:
+    """
+    Create a drillhole or append data to drillhole if it exists in workspace.
+
+    :param lasfile: Las file object or record.
+    :param drillhole_group: Drillhole group container.
+    :param group_name: Property group name.
+    :param translator: Translator for LAS file.
+    :param collocation_tolerance: Tolerance for determining collocation of data.
+    :param logger: Logger object if warnings are enabled.
+    :param index: Index of the workspace names, built from the workspace if
+        not provided.
+
+    :return: Created or augmented drillhole.
+    """
+
+    if not isinstance(lasfile, LASRecord):
+        lasfile = LASRecord.from_lasfile(lasfile, translator, logger)
+
+    if index is None:
+        index = WorkspaceIndex(drillhole_group.workspace, drillhole_group)
+
     drillhole = add_data(
-        drillhole, lasfile, group_name, collocation_tolerance=collocation_tolerance
+        get_or_create_drillhole(lasfile, drillhole_group, index, logger),
+        lasfile,
+        group_name,
+        collocation_tolerance=collocation_tolerance,
+        index=index,
     )
 
     return drillhole
 
 
+@contextmanager
+def report_errors(
+    records: list[LASRecord], report: ImportReport | None
+) -> Iterator[None]:
+    """
+    Apply the error policy of a report to the records failing to be written.
+
+    The files of the records are rejected by the report, unless the policy is
+    to abort or the records were not read from files, in which case the error
+    is raised.
+
+    :param records: Records written within the context.
+    :param report: Report of the files failing to import, raising if None.
+    """
+
+    try:
+        yield
+    except Exception as error:
+        if (
+            report is None
+            or not report.capture_errors
+            or any(record.path is None for record in records)
+        ):
+            raise
+
+        for record in records:
+            report.reject(Failure(record.path, f"{type(error).__name__}: {error}"))
+
+
 def las_to_drillhole(
-    data: lasio.LASFile | list[lasio.LASFile],
+    data: lasio.LASFile | LASRecord | Iterable[lasio.LASFile | LASRecord],
     drillhole_group: DrillholeGroup,
     property_group: str,
     *,
     surveys: Path | list[Path] | None = None,
     logger: logging.Logger | None = None,
     options: ImportOptions | None = None,
+    index: WorkspaceIndex | None = None,
+    attach: bool = True,
+    report: ImportReport | None = None,
 ):
     """
     Import a LAS file containing collocated datasets for a single drillhole.
 
-    :param data: Las file(s) containing drillhole data.
+    The concatenated arrays of the drillhole group are written once all the
+    files are added, or every ``flush_size`` megabytes of the import options.
+
+    :param data: Las file(s) or record(s) containing drillhole data. Any iterable
+        is accepted, so that files can be streamed in as they are read.
     :param drillhole_group: Drillhole group container.
     :param property_group: Property group name.
     :param surveys: Path to a survey file stored as .csv or .las format.
     :param logger: Logger object if warnings are enabled.
     :param options: Import options covering name translations, collocation
         tolerance, and warnings control.
+    :param index: Index of the workspace, built from the workspace if not
+        provided. It records the data created from each file.
+    :param attach: Attach the surveys once the data is added. Imports adding
+        data to the same drillholes over several calls attach them on the
+        last call only, as the single row surveys are extended to the end of
+        hole in the process.
+    :param report: Report of the files failing to import, applying its error
+        policy to the records failing to be written. Errors are raised if None.
 
     :return: A :obj:`geoh5py.objects.Drillhole` object
     """
 
-    if options is None:
-        options = ImportOptions()
-
+    options = options or ImportOptions()
     translator = LASTranslator(names=options.names)
+    index = index or WorkspaceIndex(drillhole_group.workspace, drillhole_group)
 
-    if not isinstance(data, list):
+    if isinstance(data, lasio.LASFile | LASRecord):
         data = [data]
     if not isinstance(surveys, list):
         surveys = [surveys] if surveys else []
 
-    for datum in tqdm(data, desc="Adding drillholes and data to workspace"):
-        collar = get_collar(datum, translator, logger)
-        if all(k == 0 for k in collar) and options.skip_empty_header:
-            continue
+    with deferred_writes(drillhole_group, options.flush_bytes):
+        for datum in tqdm(data, desc="Adding drillholes and data to workspace"):
+            if not isinstance(datum, LASRecord):
+                datum = LASRecord.from_lasfile(datum, translator, logger)
+
+            try:
+                if all(k == 0 for k in datum.collar) and options.skip_empty_header:
+                    continue
+
+                with report_errors([datum], report):
+                    create_or_append_drillhole(
+                        datum,
+                        drillhole_group,
+                        property_group,
+                        translator=translator,
+                        logger=logger,
+                        collocation_tolerance=options.collocation_tolerance,
+                        index=index,
+                    )
+            finally:
+                datum.release()
+
+        if attach:
+            attach_surveys(drillhole_group, surveys, logger, index=index)
+
+
+def attach_surveys(
+    drillhole_group: DrillholeGroup,
+    surveys: list[Path],
+    logger: logging.Logger | None = None,
+    *,
+    index: WorkspaceIndex | None = None,
+):
+    """
+    Attach survey files to the drillholes of a group, matched by name.
 
-        create_or_append_drillhole(
-            datum,
-            drillhole_group,
-            property_group,
-            translator=translator,
-            logger=logger,
-            collocation_tolerance=options.collocation_tolerance,
-        )
+    Survey files are indexed once by drillhole name and the matching ones are
+    read in parallel. Drillholes without a survey file and a single survey
+    row are extended to the deepest sample of their data.
 
-    for drillhole in tqdm(drillhole_group.children, desc="Attaching survey data."):
-        if not isinstance(drillhole, ConcatenatedDrillhole):
+    :param drillhole_group: Drillhole group container.
+    :param surveys: Paths to survey files stored as .csv or .las format.
+    :param logger: Logger object if warnings are enabled.
+    :param index: Index of the import, tracking the deepest samples of the
+        drillholes created. The data of other drillholes is read back.
+    """
+
+    survey_files = index_surveys(surveys)
+    drillholes = [
+        child
+        for child in drillhole_group.children
+        if isinstance(child, ConcatenatedDrillhole)
+    ]
+    matches = [
+        (drillhole, survey_files[drillhole.name])
+        for drillhole in drillholes
+        if drillhole.name in survey_files
+    ]
+    files = [file for _, file in matches]
+    values = stream(read_survey, files) if len(files) > 1 else map(read_survey, files)
+
+    for (drillhole, file), survey in tqdm(
+        zip(matches, values, strict=True),
+        total=len(matches),
+        desc="Attaching survey data.",
+    ):
+        set_survey(drillhole, survey, file, logger)
+
+    for drillhole in drillholes:
+        if drillhole.name in survey_files or len(drillhole.surveys) != 1:
             continue
 
-        survey = [
-            survey for survey in surveys if drillhole.name == survey.name.rstrip(".las")
-        ]
+        depth = get_end_of_hole(drillhole, index)
+        if depth is None:
+            continue
+
+        new_row = drillhole.surveys[0, :]
+        new_row[0] = depth
+        drillhole.surveys = np.vstack([drillhole.surveys, new_row])
+
 
-        if any(survey):
-            _ = add_survey(survey[0], drillhole, logger)
+def get_end_of_hole(
+    drillhole: ConcatenatedDrillhole, index: WorkspaceIndex | None = None
+) -> float | None:
+    """
+    Deepest sample of the data of a drillhole.
 
-        elif len(drillhole.surveys) == 1:
-            depths = []
-            if drillhole.depth_ is not None:
-                depths = [depth.values.max() for depth in drillhole.depth_]
-            elif drillhole.to_ is not None:
-                depths = [depth.values.max() for depth in drillhole.to_]
+    :param drillhole: Drillhole holding the data.
+    :param index: Index of the import. The depths tracked during the import
+        are used for the drillholes it created.
 
-            if len(depths) == 0:
-                continue
+    :return: Deepest depth, or None if the drillhole holds no data.
+    """
 
-            new_row = drillhole.surveys[0, :]
-            new_row[0] = np.max(depths)
-            drillhole.surveys = np.vstack([drillhole.surveys, new_row])
+    if index is not None and drillhole.uid in index.created:
+        return index.max_depth(drillhole)
 
+    depths = []
+    if drillhole.depth_ is not None:
+        depths = [depth.values.max() for depth in drillhole.depth_]
+    elif drillhole.to_ is not None:
+        depths = [depth.values.max() for depth in drillhole.to_]
 
-def _patch_lasio_reader():
-    """Patch lasio.reader.configure_metadata_patterns to handle edge cases."""
+    if len(depths) == 0:
+        return None
 
-    # patch only once
-    if getattr(lasio.reader, "patched_configure_metadata_patterns", False):
-        return
+    return float(np.max(depths))
 
-    _logger.debug("Patching lasio.reader.configure_metadata_patterns")
 
-    # TODO: Propose change on lasio to fix possible version issue
+def lasio_read(file, **kwargs):
+    """Read a LAS file using lasio.
 
-    def configure_metadata_patterns(line, section_name):  # pylint: disable=too-many-locals
-        """Configure regular-expression patterns to parse section meta-data lines.
+    Wrapper around lasio.read that patches the reader to handle some
+    edge cases in LAS files.
+    """
 
-        # OVERLOAD lasio.reader.configure_metadata_patterns
+    patch_lasio_reader()
+    return lasio.read(file, mnemonic_case="preserve", encoding="utf-8", **kwargs)
 
-        Arguments:
-            line (str): line from LAS header section
-            section_name (str): Name of the section the 'line' is from.
 
-        Returns:
-            An array of regular-expression strings (patterns).
-        """
+def numpy_read(file: str | Path) -> lasio.LASFile:
+    """
+    Read a LAS file, parsing its data section in bulk with numpy.
 
-        # Default return value
-        patterns = []
+    The header sections are parsed by lasio, while the data section is read
+    in a single pass, split once and reshaped to the number of curves. Wrapped,
+    delimited or otherwise malformed data sections are left to lasio.
 
-        # Default regular expressions for name, value and desc fields
-        name_re = r"\.?(?P<name>[^.]*)\."
-        value_re = r"(?P<value>.*):"
-        desc_re = r"(?P<descr>.*)"
+    :param file: Path to the LAS file.
 
-        # Default regular expression for unit field. Note that we
-        # attempt to match "1000 psi" as a special case which allows
-        # a single whitespace character, in contradiction to the LAS specification
-        # See GitHub issue #363 for details.
-        if "VERS" in line:
-            unit_re = r"(?P<unit>\D*)"
-        else:
-            unit_re = r"(?P<unit>([0-9]+\s)?[^\s]*)"
-
-        # Alternate regular expressions for special cases
-        name_missing_period_re = r"(?P<name>[^:]*):"
-        value_missing_period_re = r"(?P<value>.*)"
-        value_without_colon_delimiter_re = r"(?P<value>[^:]*)"
-        value_with_time_colon_re = (
-            r"(?P<value>.*?)(?:(?<!( [0-2][0-3]| hh| HH)):(?!([0-5][0-9]|mm|MM)))"
-        )
-        name_with_dots_re = r"\.?(?P<name>[^.].*[.])\."
-        no_desc_re = ""
-        no_unit_re = ""
-
-        # Configure special cases
-        # 1. missing period (assume that only name and value are present)
-        # 2. missing colon delimiter and description field
-        # 3. double_dots '..' caused by mnemonic abbreviation (with period)
-        #    next to the dot delimiter.
-        if ":" in line:
-            if "." not in line[: line.find(":")]:
-                # If there is no period, then we assume that the colon exists and
-                # everything on the left is the name, and everything on the right
-                # is the value - therefore no unit or description field.
-                name_re = name_missing_period_re
-                value_re = value_missing_period_re
-                desc_re = no_desc_re
-                unit_re = no_unit_re
-                value_with_time_colon_re = value_missing_period_re
-
-        if ":" not in line:
-            # If there isn't a colon delimiter then there isn't
-            # a description field either.
-            value_re = value_without_colon_delimiter_re
-            desc_re = no_desc_re
-
-            if ".." in line and section_name == "Curves":
-                name_re = name_with_dots_re
-        else:
-            if re.search(r"[^ ]\.\.", line) and section_name == "Curves":
-                double_dot = line.find("..")
-                desc_colon = line.rfind(":")
+    :return: lasio file object.
+    """
+
+    raw = Path(file).read_bytes()
+    data_section = re.search(rb"^[ \t]*~A.*$", raw, flags=re.MULTILINE | re.IGNORECASE)
+    if data_section is None or b"~" in raw[data_section.end() :]:
+        return lasio_read(file)
+
+    header = raw[: data_section.start()].decode("utf-8", errors="replace")
+    lasfile = lasio_read(header, ignore_data=True)
+    wrap = lasfile.version["WRAP"].value if "WRAP" in lasfile.version else "YES"
+    delimiter = lasfile.version["DLM"].value if "DLM" in lasfile.version else "SPACE"
+    n_curves = len(lasfile.curves)
+    data = raw[data_section.end() :]
+    tokens = data.split()
+    first_row = data.lstrip(b"\r\n").split(b"\n", 1)[0].split()
+
+    if (
+        str(wrap).upper() != "NO"
+        or str(delimiter).upper() != "SPACE"
+        or n_curves == 0
+        or len(first_row) != n_curves
+        or len(tokens) % n_curves != 0
+    ):
+        return lasio_read(file)
+
+    try:
+        values = np.array(tokens, dtype=float).reshape(-1, n_curves).T.copy()
+    except ValueError:
+        return lasio_read(file)
+
+    null = lasfile.well["NULL"].value if "NULL" in lasfile.well else None
+    if isinstance(null, numbers.Real):
+        values[1:][values[1:] == float(null)] = np.nan
+
+    for curve, curve_values in zip(lasfile.curves, values, strict=True):
+        curve.data = curve_values
+
+    return lasfile
+
+
+def read_header(file, translator: LASTranslator | None = None) -> LASHeader:
+    """
+    Read the header of a LAS file, stopping at the data section.
+
+    :param file: Path to the LAS file.
+    :param translator: Translator for LAS file.
 
-                # Check that a double_dot is not in the
-                # description string.
-                if double_dot < desc_colon:
-                    name_re = name_with_dots_re
+    :return: Well name, collar and curve names of the LAS file.
+    """
 
-        if section_name == "Parameter":
-            # Search for a value entry with a time-value first.
-            pattern = name_re + unit_re + value_with_time_colon_re + desc_re
-            patterns.append(pattern)
+    if translator is None:
+        translator = LASTranslator(NameOptions())
 
-        # Add the regular pattern for all section_names
-        # for the Parameter section this will run after time-value pattern
-        pattern = name_re + unit_re + value_re + desc_re
-        patterns.append(pattern)
+    lines = []
+    with open(file, encoding="utf-8", errors="replace") as las:
+        for line in las:
+            if line.lstrip()[:2].upper() == "~A":
+                break
+            lines.append(line)
 
-        return patterns
+    lasfile = lasio_read("".join(lines), ignore_data=True)
+    name = translator.retrieve("well_name", lasfile)
 
-    lasio.reader.configure_metadata_patterns = configure_metadata_patterns
-    lasio.reader.patched_configure_metadata_patterns = True
+    return LASHeader(
+        str(name),
+        get_collar(lasfile, translator),
+        [k.mnemonic for k in lasfile.curves],
+    )
 
 
-def lasio_read(file):
-    """Read a LAS file using lasio.
+PARSERS = {"numpy": numpy_read, "lasio": lasio_read}
 
-    Wrapper around lasio.read that patches the reader to handle some
-    edge cases in LAS files.
+
+def read_record(
+    file,
+    translator: LASTranslator | None = None,
+    shared: bool = False,
+    parser: str = "numpy",
+) -> LASRecord:
+    """
+    Read a LAS file into a compact record.
+
+    :param file: Path to the LAS file.
+    :param translator: Translator for LAS file.
+    :param shared: Move the curve values to shared memory.
+    :param parser: Parser of the data section, either 'numpy' for the bulk
+        parser or 'lasio'.
+
+    :return: Record of the LAS file.
     """
 
-    _patch_lasio_reader()
-    return lasio.read(file, mnemonic_case="preserve", encoding="utf-8")
+    if parser not in PARSERS:
+        raise ValueError(f"Parser must be one of {list(PARSERS)}, not '{parser}'.")
+
+    record = LASRecord.from_lasfile(PARSERS[parser](file), translator)
+    record.path = str(file)
+    if shared:
+        record.share()
+
+    return record
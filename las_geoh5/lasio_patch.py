@@ -0,0 +1,239 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                '
+#                                                                              '
+#  This file is part of las-geoh5 package.                                     '
+#                                                                              '
+#  las-geoh5 is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                 '
+#                                                                              '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import logging
+import re
+from functools import lru_cache
+
+import lasio
+
+
+_logger = logging.getLogger(__name__)
+
+_DOUBLE_DOTS = re.compile(r"[^ ]\.\.")
+
+
+def _line_shape(line: str, section_name: str | None) -> tuple[bool, ...]:
+    """
+    Classify a header line by the special cases handled by its patterns.
+
+    :param line: Line from a LAS header section.
+    :param section_name: Name of the section the line is from.
+
+    :return: Flags for the version unit, colon delimiter, missing period,
+        mnemonic with dots and parameter section cases.
+    """
+
+    colon = line.find(":")
+    if colon < 0:
+        with_dots = ".." in line and section_name == "Curves"
+    else:
+        with_dots = (
+            section_name == "Curves"
+            and _DOUBLE_DOTS.search(line) is not None
+            and line.find("..") < line.rfind(":")
+        )
+
+    return (
+        "VERS" in line,
+        colon >= 0,
+        colon >= 0 and "." not in line[:colon],
+        with_dots,
+        section_name == "Parameter",
+    )
+
+
+@lru_cache
+def _metadata_patterns(  # pylint: disable=too-many-arguments, too-many-positional-arguments
+    version: bool,
+    colon: bool,
+    missing_period: bool,
+    with_dots: bool,
+    parameter: bool,
+) -> tuple[re.Pattern, ...]:
+    """
+    Compiled regular-expression patterns for a shape of header line.
+
+    :param version: Line holds the 'VERS' mnemonic.
+    :param colon: Line has a colon delimiter.
+    :param missing_period: Line has no period before the colon delimiter.
+    :param with_dots: Mnemonic abbreviated with a period next to the delimiter.
+    :param parameter: Line is from the parameter section.
+
+    :return: Patterns to try in order.
+    """
+
+    # Default regular expressions for name, value and desc fields
+    name_re = r"\.?(?P<name>[^.]*)\."
+    value_re = r"(?P<value>.*):"
+    desc_re = r"(?P<descr>.*)"
+
+    # Default regular expression for unit field. Note that we
+    # attempt to match "1000 psi" as a special case which allows
+    # a single whitespace character, in contradiction to the LAS specification
+    # See GitHub issue #363 for details.
+    if version:
+        unit_re = r"(?P<unit>\D*)"
+    else:
+        unit_re = r"(?P<unit>([0-9]+\s)?[^\s]*)"
+
+    value_with_time_colon_re = (
+        r"(?P<value>.*?)(?:(?<!( [0-2][0-3]| hh| HH)):(?!([0-5][0-9]|mm|MM)))"
+    )
+
+    # Configure special cases
+    # 1. missing period (assume that only name and value are present)
+    # 2. missing colon delimiter and description field
+    # 3. double_dots '..' caused by mnemonic abbreviation (with period)
+    #    next to the dot delimiter.
+    if missing_period:
+        # If there is no period, then we assume that the colon exists and
+        # everything on the left is the name, and everything on the right
+        # is the value - therefore no unit or description field.
+        name_re = r"(?P<name>[^:]*):"
+        value_re = r"(?P<value>.*)"
+        desc_re = ""
+        unit_re = ""
+        value_with_time_colon_re = value_re
+
+    if not colon:
+        # If there isn't a colon delimiter then there isn't
+        # a description field either.
+        value_re = r"(?P<value>[^:]*)"
+        desc_re = ""
+
+    if with_dots:
+        name_re = r"\.?(?P<name>[^.].*[.])\."
+
+    patterns = []
+    if parameter:
+        # Search for a value entry with a time-value first.
+        patterns.append(name_re + unit_re + value_with_time_colon_re + desc_re)
+
+    # Add the regular pattern for all section_names
+    # for the Parameter section this will run after time-value pattern
+    patterns.append(name_re + unit_re + value_re + desc_re)
+
+    return tuple(re.compile(pattern) for pattern in patterns)
+
+
+def _split_header_line(line: str) -> dict[str, str] | None:
+    """
+    Split a plain 'MNEM.UNIT VALUE : DESCRIPTION' header line without regex.
+
+    Lines falling in any of the special cases of the metadata patterns are
+    left to the regular expressions.
+
+    :param line: Line from a LAS header section.
+
+    :return: Name, unit, value and description of the line, or None.
+    """
+
+    if line.count(":") != 1 or ".." in line or "VERS" in line or line[:1] == ".":
+        return None
+
+    head, descr = line.split(":")
+    if "." not in head:
+        return None
+
+    name, rest = head.split(".", 1)
+    if rest[:1].isdigit():
+        return None
+
+    unit, value = "", rest
+    if rest and not rest[0].isspace():
+        unit = rest.split(None, 1)[0]
+        value = rest[len(unit) :]
+
+    unit = unit.strip()
+    if unit.endswith("."):
+        unit = unit.strip(".")
+
+    return {
+        "name": name.strip(),
+        "unit": unit,
+        "value": value.strip(),
+        "descr": descr.strip(),
+    }
+
+
+def _read_header_line(line, pattern=None, section_name=None):
+    """
+    Read a line from a LAS header section.
+
+    # OVERLOAD lasio.reader.read_header_line
+
+    Plain lines are split directly, others are matched against compiled
+    patterns cached by shape of line.
+
+    :param line: Line from a LAS header section.
+    :param pattern: Pattern to use instead of the configured ones.
+    :param section_name: Name of the section the line is from.
+
+    :return: Name, unit, value and description of the line.
+    """
+
+    if pattern is None:
+        fields = _split_header_line(line)
+        if fields is not None:
+            return fields
+
+        patterns: tuple = _metadata_patterns(*_line_shape(line, section_name))
+    else:
+        patterns = (pattern,)
+
+    match = None
+    for candidate in patterns:
+        match = re.match(candidate, line)
+        if match is not None:
+            break
+
+    fields = {"name": "", "unit": "", "value": "", "descr": ""}
+    for key, value in match.groupdict().items():  # type: ignore
+        fields[key] = value.strip()
+        if key == "unit" and fields[key].endswith("."):
+            fields[key] = fields[key].strip(".")  # see lasio issue #36
+
+    return fields
+
+
+def _configure_metadata_patterns(line, section_name):
+    """
+    Configure regular-expression patterns to parse section meta-data lines.
+
+    # OVERLOAD lasio.reader.configure_metadata_patterns
+
+    :param line: Line from LAS header section.
+    :param section_name: Name of the section the 'line' is from.
+
+    :return: List of regular-expression strings (patterns).
+    """
+
+    return [
+        pattern.pattern
+        for pattern in _metadata_patterns(*_line_shape(line, section_name))
+    ]
+
+
+def patch_lasio_reader():
+    """Patch the lasio.reader header line parsing to handle edge cases."""
+
+    # patch only once
+    if getattr(lasio.reader, "patched_configure_metadata_patterns", False):
+        return
+
+    _logger.debug("Patching lasio.reader.configure_metadata_patterns")
+
+    # TODO: Propose change on lasio to fix possible version issue
+    lasio.reader.configure_metadata_patterns = _configure_metadata_patterns
+    lasio.reader.read_header_line = _read_header_line
+    lasio.reader.patched_configure_metadata_patterns = True
@@ -0,0 +1,312 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                '
+#                                                                              '
+#  This file is part of las-geoh5 package.                                     '
+#                                                                              '
+#  las-geoh5 is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                 '
+#                                                                              '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
+from heapq import heappop, heappush
+from itertools import islice
+from multiprocessing import Pool
+from multiprocessing.pool import AsyncResult
+from queue import Empty, SimpleQueue
+from time import monotonic
+from typing import Any, NamedTuple
+
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+
+class Failure(NamedTuple):
+    """Error raised by a function applied to an item in a worker process."""
+
+    item: Any
+    reason: str
+
+
+def capture(func: Callable, item: Any) -> Any:
+    """
+    Apply a function to an item, returning the error raised as a failure.
+
+    :param func: Function applied to the item.
+    :param item: Item to process.
+
+    :return: Result of the function, or a :obj:`Failure` if it raised.
+    """
+
+    try:
+        return func(item)
+    except Exception as error:  # noqa: BLE001  # pylint: disable=broad-exception-caught
+        return Failure(item, f"{type(error).__name__}: {error}")
+
+
+def limit_memory(memory_limit: int | None):
+    """
+    Limit the address space of the current process.
+
+    Allocations beyond the limit raise a :obj:`MemoryError`. The limit is only
+    applied on platforms supporting it.
+
+    :param memory_limit: Maximum address space in megabytes, unlimited if None.
+    """
+
+    if memory_limit is None or resource is None:
+        return
+
+    limit = memory_limit * 2**20
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def release(results: Iterable[Any]):
+    """
+    Release the completed results that are discarded rather than consumed.
+
+    Results with a ``release`` method, such as the records holding their
+    values in shared memory, are released. The results still running when
+    their worker is terminated are lost.
+
+    :param results: Results of the discarded items, either values or the
+        asynchronous results of the pool.
+    """
+
+    for result in results:
+        if isinstance(result, AsyncResult):
+            if not (result.ready() and result.successful()):
+                continue
+            result = result.get()
+        if callable(getattr(result, "release", None)):
+            result.release()
+
+
+class _Workers:
+    """
+    Process pool replaced when a task exceeds the time limit.
+
+    :param func: Function applied to each item.
+    :param processes: Number of worker processes.
+    :param timeout: Time limit of a task in seconds, unlimited if None.
+    :param memory_limit: Memory limit of the workers in megabytes.
+    :param max_tasks: Number of tasks completed by a worker before it is
+        replaced, unlimited if None.
+    :param capture_errors: Whether to return a :obj:`Failure` for the tasks
+        exceeding the time limit, rather than raising.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        func: Callable,
+        *,
+        processes: int | None,
+        timeout: float | None,
+        memory_limit: int | None,
+        max_tasks: int | None,
+        capture_errors: bool,
+    ):
+        self.func = func
+        self.timeout = timeout
+        self.capture_errors = capture_errors
+        self.pending: dict[int, tuple[Any, AsyncResult]] = {}
+        self.completed: SimpleQueue[int] = SimpleQueue()
+        self._earliest: tuple[int | None, float] = (None, 0.0)
+        self._start = partial(
+            Pool,
+            processes,
+            initializer=limit_memory,
+            initargs=(memory_limit,),
+            maxtasksperchild=max_tasks,
+        )
+        self.pool = self._start()
+
+    def submit(self, key: int, item: Any):
+        """
+        Submit an item to the pool.
+
+        :param key: Key identifying the item among the pending ones.
+        :param item: Item to process.
+        """
+
+        def notify(_):
+            self.completed.put(key)
+
+        self.pending[key] = (
+            item,
+            self.pool.apply_async(
+                self.func, (item,), callback=notify, error_callback=notify
+            ),
+        )
+
+    def next(self) -> tuple[int, Any]:
+        """
+        Wait for the result of the first item to complete.
+
+        Items are started in the order they are submitted, so the earliest one
+        pending has run for at least the time since it became the earliest.
+        When it exceeds the time limit, the pool is terminated and the other
+        pending items are submitted to a new pool, releasing the results
+        already completed.
+
+        :return: Key and result of the first item completed.
+        """
+
+        earliest = next(iter(self.pending))
+        if self._earliest[0] != earliest:
+            self._earliest = (earliest, monotonic())
+        deadline = None if self.timeout is None else self._earliest[1] + self.timeout
+
+        while True:
+            try:
+                key = self.completed.get(
+                    timeout=None if deadline is None else max(deadline - monotonic(), 0)
+                )
+            except Empty:
+                break
+
+            # Keys of the results lost with a terminated pool are ignored
+            if key in self.pending and self.pending[key][1].ready():
+                _, result = self.pending.pop(key)
+                return key, result.get()
+
+        item, _ = self.pending.pop(earliest)
+        self.pool.terminate()
+        release(result for _, result in self.pending.values())
+        self.pool = self._start()
+        for key, (other, _) in list(self.pending.items()):
+            self.submit(key, other)
+
+        message = f"Processing exceeded the time limit of {self.timeout} s."
+        if not self.capture_errors:
+            raise TimeoutError(f"{message} Item: {item!r}")
+
+        return earliest, Failure(item, f"TimeoutError: {message}")
+
+    def map(
+        self,
+        items: Iterable,
+        queue_size: int,
+        priority: Callable[[Any], Any] | None = None,
+    ) -> Iterator[Any]:
+        """
+        Process items, yielding the results in the order of the items.
+
+        The items are submitted as they enter the queue, bounding the number
+        of results pending or held for the previous items to ``queue_size``.
+
+        :param items: Items to process.
+        :param queue_size: Maximum number of pending results.
+        :param priority: Function giving the priority of an item, for the
+            items entering the queue together to be submitted by decreasing
+            priority. In the order of the items if None.
+
+        :return: Iterator over the results.
+        """
+
+        items = enumerate(items)
+        queue: list[tuple[Any, int, Any]] = []
+        results: dict[int, Any] = {}
+        start, end = 0, 0
+        try:
+            while True:
+                for index, item in islice(items, start + queue_size - end):
+                    key = 0 if priority is None else -priority(item)
+                    heappush(queue, (key, index, item))
+                    end = index + 1
+                while queue:
+                    _, index, item = heappop(queue)
+                    self.submit(index, item)
+
+                if not self.pending:
+                    return
+
+                index, result = self.next()
+                results[index] = result
+                while start in results:
+                    yield results.pop(start)
+                    start += 1
+        finally:
+            release(results.values())
+
+    def terminate(self):
+        """
+        Stop the worker processes, releasing the pending results.
+        """
+        self.pool.terminate()
+        release(result for _, result in self.pending.values())
+        self.pending.clear()
+
+
+def stream(  # pylint: disable=too-many-arguments
+    func: Callable,
+    items: Iterable,
+    *,
+    processes: int | None = None,
+    queue_size: int = 16,
+    capture_errors: bool = False,
+    timeout: float | None = None,
+    memory_limit: int | None = None,
+    max_tasks: int | None = None,
+    priority: Callable[[Any], Any] | None = None,
+) -> Iterator[Any]:
+    """
+    Apply a function to items in a process pool and yield results as they come.
+
+    At most ``queue_size`` items are submitted ahead of the consumer, so that
+    the consumer can start working on the first results while the following
+    items are processed, and memory stays bounded by the queue depth.
+    Results are collected as they complete, and held until the results of the
+    previous items are yielded, so that they are yielded in the order of the
+    items.
+
+    :param func: Function applied to each item, must be picklable.
+    :param items: Items to process.
+    :param processes: Number of worker processes. Defaults to the cpu count.
+        With 0, the items are processed in the current process, without the
+        time and memory limits.
+    :param queue_size: Maximum number of pending results.
+    :param capture_errors: Whether to yield a :obj:`Failure` for the items the
+        function raises on, rather than raising the error in the consumer.
+    :param timeout: Time limit in seconds to process an item, after which the
+        workers are replaced. Unlimited if None.
+    :param memory_limit: Memory limit of the worker processes in megabytes,
+        above which allocations raise a :obj:`MemoryError`. Unlimited if None.
+    :param max_tasks: Number of items processed by a worker before it is
+        replaced, releasing the memory it holds. Unlimited if None.
+    :param priority: Function giving the priority of an item. The items
+        entering the queue together are submitted by decreasing priority,
+        such as the largest files first. In the order of the items if None.
+
+    :return: Iterator over the results.
+    """
+
+    if queue_size < 1:
+        raise ValueError("Queue size must be a positive integer.")
+
+    if capture_errors:
+        func = partial(capture, func)
+
+    if processes == 0:
+        for item in items:
+            yield func(item)
+        return
+
+    workers = _Workers(
+        func,
+        processes=processes,
+        timeout=timeout,
+        memory_limit=memory_limit,
+        max_tasks=max_tasks,
+        capture_errors=capture_errors,
+    )
+    try:
+        yield from workers.map(items, queue_size, priority)
+    finally:
+        workers.terminate()
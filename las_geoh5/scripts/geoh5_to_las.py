@@ -44,11 +44,25 @@ def main():
             "If not specified, reads it from the ``rootpath`` key in the JSON parameter file."
         ),
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        required=False,
+        default=None,
+        help=(
+            """Number of processes writing the LAS files, or 0 to write them in the
+            main process. If not specified, reads it from the JSON parameter file,
+            or chooses it from the number of drillholes."""
+        ),
+    )
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 0:
+        parser.error("The number of workers must be a positive integer or 0.")
     output_dir = args.out
     if output_dir:
         output_dir.mkdir(parents=True, exist_ok=True)
-    driver.run(args.param_file, output_dir)
+    driver.run(args.param_file, output_dir, n_workers=args.workers)
 
 
 if __name__ == "__main__":
@@ -46,7 +46,22 @@ def main():
         ),
     )
 
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        required=False,
+        default=None,
+        help=(
+            """Number of processes reading the LAS files, or 0 to read them in the
+            main process. If not specified, reads it from the JSON parameter file,
+            or chooses it from the size of the import."""
+        ),
+    )
+
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 0:
+        parser.error("The number of workers must be a positive integer or 0.")
     output_filepath = args.out
     if output_filepath:
         if not output_filepath.suffix:
@@ -56,7 +71,7 @@ def main():
                 "Cowardly refuses to overwrite existing file '%s'.", output_filepath
             )
             sys.exit(1)
-    driver.run(args.param_file, output_filepath)
+    driver.run(args.param_file, output_filepath, n_workers=args.workers)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,315 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                '
+#                                                                              '
+#  This file is part of las-geoh5 package.                                     '
+#                                                                              '
+#  las-geoh5 is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                 '
+#                                                                              '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from uuid import UUID
+
+import numpy as np
+from geoh5py import Workspace
+from geoh5py.data import PrimitiveTypeEnum
+from geoh5py.data.data_type import DataType, ReferencedValueMapType
+from geoh5py.groups import DrillholeGroup, PropertyGroup
+from geoh5py.objects import ObjectBase
+from geoh5py.shared import Entity
+
+
+def value_map_key(value_map: dict | None) -> tuple | None:
+    """
+    Hashable fingerprint of a value map.
+
+    The 'Unknown' entry added to value maps by geoh5py is included, so that
+    maps read from the workspace and from LAS files compare equal.
+
+    :param value_map: Value map of referenced data.
+
+    :return: Sorted pairs of keys and values, or None for non-referenced data.
+    """
+
+    if value_map is None:
+        return None
+
+    value_map = {0: "Unknown", **{int(k): str(v) for k, v in value_map.items()}}
+    return tuple(sorted(value_map.items()))
+
+
+class TypeRegistry:
+    """
+    Registry of the data types shared by the curves of an import.
+
+    Types are keyed by curve name, unit and value map, and seeded once with
+    the numeric and referenced data types of the data loaded in the
+    workspace. Units are not stored on the types, so existing types are also
+    offered for any unit.
+
+    :param workspace: Workspace receiving the data.
+    """
+
+    def __init__(self, workspace: Workspace):
+        self.types: dict[tuple, DataType] = {}
+
+        for uid, name in workspace.list_data_name.items():
+            data = workspace.find_data(uid)
+            entity_type = getattr(data, "entity_type", None)
+            if isinstance(entity_type, ReferencedValueMapType):
+                value_map = entity_type.value_map
+                key = value_map_key(value_map() if value_map is not None else {})
+            elif (
+                isinstance(entity_type, DataType)
+                and entity_type.primitive_type is PrimitiveTypeEnum.FLOAT
+            ):
+                key = None
+            else:
+                continue
+
+            self.types.setdefault((name, None, key), entity_type)
+
+    def get(
+        self, name: str, unit: str, value_map: dict | None = None
+    ) -> DataType | None:
+        """
+        Get the data type of a curve.
+
+        :param name: Name of the curve.
+        :param unit: Unit of the curve.
+        :param value_map: Value map of a referenced curve.
+
+        :return: Registered data type, or None.
+        """
+
+        key = value_map_key(value_map)
+        entity_type = self.types.get((name, unit, key))
+        if entity_type is None:
+            entity_type = self.types.get((name, None, key))
+
+        return entity_type
+
+    def register(
+        self,
+        name: str,
+        unit: str,
+        value_map: dict | None,
+        entity_type: DataType,
+    ):
+        """
+        Register the data type of a curve, unless one is already registered.
+
+        :param name: Name of the curve.
+        :param unit: Unit of the curve.
+        :param value_map: Value map of a referenced curve.
+        :param entity_type: Data type created for the curve.
+        """
+
+        self.types.setdefault((name, unit, value_map_key(value_map)), entity_type)
+
+
+class PropertyGroupIndex:
+    """
+    Fingerprints of the property groups of a drillhole.
+
+    Groups are bucketed by the shape of their depth or interval locations,
+    along with the first and last values. Only the groups of the same shape
+    and with matching ends are compared in full for collocation.
+
+    :param drillhole: Drillhole holding the property groups.
+    """
+
+    def __init__(self, drillhole: ObjectBase):
+        self.names: list[str] = []
+        self.groups: dict[tuple, list[tuple[PropertyGroup, np.ndarray]]] = {}
+
+        for group in drillhole.property_groups or []:
+            self.add(group)
+
+    def add(self, group: PropertyGroup):
+        """
+        Add a property group to the index.
+
+        :param group: Property group of the drillhole.
+        """
+
+        self.names.append(group.name)
+        locations = getattr(group, "locations", None)
+        if locations is None:
+            return
+
+        self.groups.setdefault((locations.ndim, len(locations)), []).append(
+            (group, locations[[0, -1]] if len(locations) else locations)
+        )
+
+    def find_collocated(
+        self, name: str, locations: np.ndarray, tolerance: float
+    ) -> PropertyGroup | None:
+        """
+        Find a property group collocated with given locations.
+
+        :param name: Root name of the property group.
+        :param locations: Depths or intervals of the data.
+        :param tolerance: Tolerance for determining collocation of data.
+
+        :return: The first collocated group with the root name, or None.
+        """
+
+        ends = locations[[0, -1]] if len(locations) else locations
+        for group, group_ends in self.groups.get((locations.ndim, len(locations)), []):
+            if (
+                name in group.name
+                and np.allclose(ends, group_ends, atol=tolerance)
+                and group.is_collocated(locations, tolerance)
+            ):
+                return group
+
+        return None
+
+
+class WorkspaceIndex:
+    """
+    Index of the entities of a workspace, maintained during an import.
+
+    Drillholes of the group are looked up by name, copy names are allocated
+    from a counter per basename, data types are shared through a
+    :obj:`TypeRegistry` and property groups are matched through a
+    :obj:`PropertyGroupIndex`, without scanning the workspace for every file.
+    The deepest sample added to each drillhole is tracked to extend their
+    surveys without reading the data back.
+
+    :param workspace: Workspace receiving the data.
+    :param drillhole_group: Drillhole group receiving the drillholes.
+    """
+
+    def __init__(
+        self, workspace: Workspace, drillhole_group: DrillholeGroup | None = None
+    ):
+        self.names: set[str] = set(workspace.list_entities_name.values())
+        self.drillholes: dict[str, Entity] = {}
+        self.types = TypeRegistry(workspace)
+        self._counters: dict[str, int] = {}
+        self._property_groups: dict[UUID, PropertyGroupIndex] = {}
+        self.created: set[UUID] = set()
+        self.sources: dict[str, list[Entity]] = {}
+        self.depths: dict[UUID, dict[str, float]] = {}
+
+        if drillhole_group is not None:
+            for child in drillhole_group.children:
+                self.drillholes.setdefault(child.name, child)
+
+    def get_drillhole(self, name: str) -> Entity | None:
+        """
+        Get a child of the drillhole group by name.
+
+        :param name: Name of the drillhole.
+
+        :return: The first child with that name, or None.
+        """
+        return self.drillholes.get(name)
+
+    def property_groups(self, drillhole: ObjectBase) -> PropertyGroupIndex:
+        """
+        Get the index of the property groups of a drillhole.
+
+        :param drillhole: Drillhole holding the property groups.
+
+        :return: Property group index, built on first access.
+        """
+
+        if drillhole.uid not in self._property_groups:
+            self._property_groups[drillhole.uid] = PropertyGroupIndex(drillhole)
+
+        return self._property_groups[drillhole.uid]
+
+    def copy_name(self, basename: str) -> str:
+        """
+        Allocate the name of a new entity, augmented with an integer if taken.
+
+        :param basename: Name of the new entity.
+
+        :return: Name that is not used in the workspace.
+        """
+
+        count = self._counters.get(basename, 0)
+        name = basename if count == 0 else f"{basename} ({count})"
+        while name in self.names:
+            count += 1
+            name = f"{basename} ({count})"
+
+        self._counters[basename] = count
+        self.names.add(name)
+
+        return name
+
+    def register_group(self, drillhole: ObjectBase, name: str):
+        """
+        Add a property group of a drillhole to the index, if new.
+
+        :param drillhole: Drillhole holding the property group.
+        :param name: Name of the property group.
+        """
+
+        self.names.add(name)
+        groups = self.property_groups(drillhole)
+        if name in groups.names:
+            return
+
+        group = drillhole.get_property_group(name)[0]
+        if group is not None:
+            groups.add(group)
+
+    def register(
+        self, entity: Entity, drillhole: bool = False, source: str | None = None
+    ):
+        """
+        Add a new entity to the index.
+
+        :param entity: Entity created in the workspace.
+        :param drillhole: Whether the entity is a drillhole of the group.
+        :param source: Path of the file the entity was created from.
+        """
+
+        self.names.add(entity.name)
+        if source is not None:
+            self.sources.setdefault(source, []).append(entity)
+        if drillhole:
+            self.drillholes.setdefault(entity.name, entity)
+            self.created.add(entity.uid)
+
+    def register_depths(self, drillhole: ObjectBase, depths: dict[str, np.ndarray]):
+        """
+        Track the deepest sample of the data added to a drillhole.
+
+        :param drillhole: Drillhole receiving the data.
+        :param depths: Depth data as 'from-to' interval or 'depth' locations.
+        """
+
+        if "depth" in depths:
+            key, values = "depth", np.asarray(depths["depth"])
+        else:
+            key, values = "to", np.asarray(depths["from-to"])[:, 1]
+
+        if len(values) == 0 or np.isnan(values).all():
+            return
+
+        tracked = self.depths.setdefault(drillhole.uid, {})
+        tracked[key] = max(tracked.get(key, -np.inf), float(np.nanmax(values)))
+
+    def max_depth(self, drillhole: ObjectBase) -> float | None:
+        """
+        Deepest sample of the data added to a drillhole during the import.
+
+        Depth data take precedence over intervals, as for the data stored in
+        the drillhole.
+
+        :param drillhole: Drillhole receiving the data.
+
+        :return: Deepest depth, or None if no data was added.
+        """
+
+        tracked = self.depths.get(drillhole.uid, {})
+
+        return tracked.get("depth", tracked.get("to"))
@@ -0,0 +1,119 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                '
+#                                                                              '
+#  This file is part of las-geoh5 package.                                     '
+#                                                                              '
+#  las-geoh5 is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                 '
+#                                                                              '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+from geoh5py import Workspace
+from geoh5py.groups import DrillholeGroup
+from geoh5py.io import H5Writer
+
+from las_geoh5.bulk_import import create_drillholes
+from las_geoh5.concatenation import deferred_writes
+from las_geoh5.import_las import create_or_append_drillhole, las_to_drillhole
+
+from .helpers import TEST_FILES, generate_lasfile
+
+
+def test_create_drillholes(tmp_path: Path):
+    lasfiles = [
+        *TEST_FILES,
+        generate_lasfile(
+            "dh1",
+            {"UTMX": 0.0, "UTMY": 0.0, "ELEV": 10.0},
+            np.arange(0, 31, 1),
+            {"my_property": np.full(31, 2.0)},
+        ),
+    ]
+
+    def imported(geoh5_path: Path) -> dict:
+        with Workspace(geoh5_path, mode="r") as geoh5:
+            group = geoh5.get_entity("dh_group")[0]
+            return {
+                child.name: {
+                    "groups": sorted(pg.name for pg in child.property_groups),
+                    "data": {
+                        name: child.get_data(name)[0].values
+                        for name in child.get_data_list()
+                    },
+                }
+                for child in group.children
+            }
+
+    types = {}
+    for name, importer in [("file", las_to_drillhole), ("bulk", create_drillholes)]:
+        with Workspace.create(tmp_path / f"{name}.geoh5") as workspace:
+            with patch.object(
+                H5Writer,
+                "update_concatenated_field",
+                wraps=H5Writer.update_concatenated_field,
+            ) as mock_write:
+                importer(
+                    lasfiles,
+                    DrillholeGroup.create(workspace, name="dh_group"),
+                    "my_group",
+                )
+
+        fields = [call.args[2:] for call in mock_write.call_args_list]
+        assert len(fields) == len(set(fields))
+        with Workspace(tmp_path / f"{name}.geoh5", mode="r") as geoh5:
+            types[name] = sorted(k.name for k in geoh5.types)
+
+    assert types["bulk"] == types["file"]
+    by_file, bulk = imported(tmp_path / "file.geoh5"), imported(tmp_path / "bulk.geoh5")
+    assert bulk.keys() == by_file.keys()
+    for name, drillhole in bulk.items():
+        assert drillhole["groups"] == by_file[name]["groups"]
+        assert drillhole["data"].keys() == by_file[name]["data"].keys()
+        for data_name, values in drillhole["data"].items():
+            np.testing.assert_array_equal(values, by_file[name]["data"][data_name])
+
+    np.testing.assert_array_equal(bulk["dh1"]["data"]["my_property (2)"], 2.0)
+
+
+def test_deferred_writes_nested(tmp_path: Path):
+    with Workspace.create(tmp_path / "test.geoh5") as workspace:
+        dh_group = DrillholeGroup.create(workspace, name="dh_group")
+        with deferred_writes(dh_group):
+            with deferred_writes(dh_group):
+                create_or_append_drillhole(TEST_FILES[0], dh_group, "my_group")
+            assert "save_attribute" in vars(dh_group)
+
+        assert "save_attribute" not in vars(dh_group)
+
+    with Workspace(tmp_path / "test.geoh5", mode="r") as geoh5:
+        drillhole = geoh5.get_entity("dh1")[0]
+        np.testing.assert_array_equal(drillhole.get_data("my_property")[0].values, 0)
+
+
+def test_deferred_writes_flush_size(tmp_path: Path):
+    with Workspace.create(tmp_path / "test.geoh5") as workspace:
+        dh_group = DrillholeGroup.create(workspace, name="dh_group")
+        with patch.object(
+            H5Writer,
+            "update_concatenated_field",
+            wraps=H5Writer.update_concatenated_field,
+        ) as mock_write:
+            with deferred_writes(dh_group, flush_size=1):
+                for lasfile in TEST_FILES:
+                    create_or_append_drillhole(lasfile, dh_group, "my_group")
+
+                written = mock_write.call_count
+                assert written > 0
+
+            assert mock_write.call_count == written
+
+    with Workspace(tmp_path / "test.geoh5", mode="r") as geoh5:
+        for lasfile in TEST_FILES:
+            drillhole = geoh5.get_entity(lasfile.well["WELL"].value)[0]
+            assert drillhole.get_data("my_property")
@@ -12,6 +12,7 @@ import logging
 import random
 import string
 from pathlib import Path
+from unittest.mock import patch
 
 import lasio
 import numpy as np
@@ -21,8 +22,9 @@ from geoh5py.objects.drillhole import Drillhole
 from geoh5py.shared.utils import compare_entities
 from geoh5py.workspace import Workspace
 
-from las_geoh5.export_files.driver import export_las_files
-from las_geoh5.export_las import drillhole_to_las, write_curves
+from las_geoh5.export_files.driver import export_las_files, partition
+from las_geoh5.export_files.params import ExportOptions
+from las_geoh5.export_las import drillhole_to_las, write_curves, write_las
 from las_geoh5.import_directories.driver import import_las_directory
 from las_geoh5.import_files.params import ImportOptions, NameOptions
 from las_geoh5.import_las import (
@@ -32,7 +34,10 @@ from las_geoh5.import_las import (
     get_collar,
     get_depths,
     las_to_drillhole,
+    lasio_read,
+    numpy_read,
 )
+from las_geoh5.pool import stream
 
 
 def test_get_depths():
@@ -320,6 +325,201 @@ def test_import_las_directory(tmp_path: Path):
 
     assert len(dh_group.property_group_ids) == len(dh_group2.property_group_ids)
 
+    with Workspace.create(tmp_path / "import.geoh5") as geoh5:
+        new_group = import_las_directory(
+            DrillholeGroup.create(geoh5, name="dh_group"), tmp_path
+        )
+        for child in dh_group.children:
+            np.testing.assert_allclose(
+                new_group.get_entity(child.name)[0].surveys, child.surveys, atol=1e-4
+            )
+
+
+def test_import_las_directory_single_pool(tmp_path: Path):
+    workspace, dh_group = setup_import_las_directory(tmp_path)
+    (tmp_path / "export").mkdir()
+    with workspace.open():
+        export_las_files(dh_group, tmp_path / "export", use_directories=True)
+
+    folders = [k for k in (tmp_path / "export").iterdir() if k.name != "Surveys"]
+    assert len(folders) > 1
+
+    with Workspace.create(tmp_path / "import.geoh5") as geoh5:
+        new_group = DrillholeGroup.create(geoh5, name="dh_group")
+        with patch(
+            "las_geoh5.import_directories.driver.stream", wraps=stream
+        ) as mock_stream:
+            import_las_directory(
+                new_group, tmp_path / "export", options=ImportOptions(n_workers=2)
+            )
+
+        assert mock_stream.call_count == 1
+        assert len(mock_stream.call_args.args[1]) == sum(
+            len(list(folder.glob("*.las"))) for folder in folders
+        )
+        assert {child.name for child in new_group.children} == {"dh1", "dh2"}
+        assert len(new_group.get_entity("dh1")[0].property_groups) == len(folders)
+
+
+def test_export_las_files_parallel(tmp_path: Path):
+    workspace, dh_group = setup_import_las_directory(tmp_path)
+    for name in ["serial", "parallel"]:
+        (tmp_path / name).mkdir()
+
+    with Workspace(workspace.h5file, mode="r") as geoh5:
+        dh_group = geoh5.get_entity(dh_group.uid)[0]
+        export_las_files(dh_group, tmp_path / "serial", n_workers=0)
+        with patch("las_geoh5.export_files.driver.stream", wraps=stream) as mock_stream:
+            export_las_files(dh_group, tmp_path / "parallel", n_workers=2)
+
+    assert mock_stream.call_args.kwargs["processes"] == 2
+    serial = sorted(
+        path.relative_to(tmp_path / "serial")
+        for path in (tmp_path / "serial").rglob("*.las")
+    )
+    parallel = sorted(
+        path.relative_to(tmp_path / "parallel")
+        for path in (tmp_path / "parallel").rglob("*.las")
+    )
+    assert serial and serial == parallel
+    for path in serial:
+        assert (tmp_path / "serial" / path).read_text() == (
+            tmp_path / "parallel" / path
+        ).read_text()
+
+
+def test_export_las_files_writable(tmp_path: Path):
+    workspace, dh_group = setup_import_las_directory(tmp_path)
+    with workspace.open(mode="r+"):
+        drillhole = Drillhole.create(
+            workspace, collar=np.r_[20.0, 10.0, 10], parent=dh_group, name="dh3"
+        )
+        drillhole.add_data(
+            {"my_data": {"depth": np.arange(0, 5.0), "values": np.ones(5)}},
+            property_group="my_group",
+        )
+        with patch("las_geoh5.export_files.driver.stream", wraps=stream) as mock_stream:
+            export_las_files(dh_group, tmp_path, n_workers=2)
+
+    mock_stream.assert_not_called()
+    assert (tmp_path / "my_group" / "dh3_my_group.las").exists()
+
+
+def test_write_las(tmp_path: Path):
+    values = np.random.randn(10000)
+    values[[0, 5000]] = np.nan
+
+    def lasfile():
+        file = lasio.LASFile()
+        file.well["WELL"] = "dh1"
+        file.append_curve("DEPTH", np.arange(0, 10000.0) * 0.5, unit="m")
+        file.append_curve("my_data", values)
+        file.append_curve("my_ref", np.arange(10000) % 3)
+        return file
+
+    with open(tmp_path / "lasio.las", "w", encoding="utf8") as output:
+        lasfile().write(output)
+    with open(tmp_path / "bulk.las", "w", encoding="utf8") as output:
+        write_las(lasfile(), output, {"my_ref": "%3i"})
+
+    expected = lasio_read(tmp_path / "lasio.las")
+    for read in [lasio_read, numpy_read]:
+        result = read(tmp_path / "bulk.las")
+        assert result.well["WELL"].value == "dh1"
+        assert result.well["STOP"].value == expected.well["STOP"].value
+        assert [curve.mnemonic for curve in result.curves] == [
+            curve.mnemonic for curve in expected.curves
+        ]
+        for curve in expected.curves:
+            np.testing.assert_array_equal(result[curve.mnemonic], curve.data)
+
+    lines = (tmp_path / "bulk.las").read_text(encoding="utf8").splitlines()
+    assert lines[-1].startswith(" 4999.50000 ")
+    assert lines[-1].endswith(" 0")
+    assert len(lines[-1]) == 26
+
+
+def test_export_options():
+    options = ExportOptions(decimals={"DEPTH": 2}, significant_digits={"my_data": 3})
+    assert options.number_format("DEPTH") == "%10.2f"
+    assert options.number_format("my_data") == "%10.3g"
+    assert options.number_format("other") == "%10.5f"
+    assert ExportOptions(decimals=1, width=0).number_format("DEPTH") == "%0.5f"
+    assert ExportOptions(decimals=1, width=0).number_format("other") == "%0.1f"
+    assert ExportOptions(significant_digits=2).number_format("TO") == "%10.5f"
+    with pytest.raises(ValueError):
+        ExportOptions(decimals={"DEPTH": -1})
+
+
+def test_drillhole_to_las_precision(tmp_path: Path):
+    values = np.random.randn(50) * 1e4
+    values[[3, 10]] = np.nan
+    with Workspace.create(tmp_path / "test.geoh5") as workspace:
+        dh_group = DrillholeGroup.create(workspace, name="dh_group")
+        drillhole = Drillhole.create(
+            workspace, collar=np.r_[0.0, 10.0, 10], parent=dh_group, name="dh1"
+        )
+        drillhole.add_data(
+            {"my_data": {"depth": np.arange(0, 50.0), "values": values}},
+            property_group="my_group",
+        )
+        for name, options in [
+            ("default", None),
+            ("short", ExportOptions(decimals=1, width=0, null_value=-999.25)),
+            ("digits", ExportOptions(significant_digits={"my_data": 3})),
+        ]:
+            (tmp_path / name).mkdir()
+            drillhole_to_las(drillhole, tmp_path / name, options=options)
+
+    def size(name):
+        text = (tmp_path / name / "my_group" / "dh1_my_group.las").read_text()
+        return len(text.split("~ASCII")[1])
+
+    assert size("short") < 0.8 * size("default")
+
+    for read in [lasio_read, numpy_read]:
+        short = read(tmp_path / "short" / "my_group" / "dh1_my_group.las")
+        assert short.well["NULL"].value == -999.25
+        np.testing.assert_allclose(short["my_data"], values, atol=0.05)
+        assert np.isnan(short["my_data"][[3, 10]]).all()
+
+        digits = read(tmp_path / "digits" / "my_group" / "dh1_my_group.las")
+        np.testing.assert_allclose(digits["DEPTH"], np.arange(0, 50.0))
+        np.testing.assert_allclose(digits["my_data"], values, rtol=5e-3)
+
+
+def test_drillhole_to_las_index_precision(tmp_path: Path):
+    depths = np.arange(1000.0, 1100.0, 0.5)
+    with Workspace.create(tmp_path / "test.geoh5") as workspace:
+        drillhole = Drillhole.create(
+            workspace,
+            collar=np.r_[0.0, 10.0, 10],
+            surveys=np.c_[[0.0, 1234.5], [0.0, 0.0], [-90.0, -80.0]],
+            parent=DrillholeGroup.create(workspace, name="dh_group"),
+            name="dh1",
+        )
+        drillhole.add_data(
+            {"my_data": {"depth": depths, "values": np.random.randn(len(depths))}},
+            property_group="my_group",
+        )
+        drillhole_to_las(
+            drillhole, tmp_path, options=ExportOptions(significant_digits=2)
+        )
+
+    curves = lasio_read(tmp_path / "my_group" / "dh1_my_group.las")
+    np.testing.assert_allclose(curves["DEPTH"], depths)
+    survey = lasio_read(tmp_path / "Surveys" / "dh1_survey.las")
+    np.testing.assert_allclose(survey["DEPTH"], [0.0, 1234.5])
+
+
+def test_partition():
+    uids = list(range(10))
+    partitions = partition(uids, 4)
+    assert [len(part) for part in partitions] == [3, 3, 2, 2]
+    assert [uid for part in partitions for uid in part] == uids
+    assert partition(uids[:2], 8) == [[0], [1]]
+    assert partition([], 4) == [[]]
+
 
 def test_collocation_tolerance(tmp_path: Path):
     ws = Workspace.create(tmp_path / "test.geoh5")
@@ -39,6 +39,31 @@ def generate_lasfile(
     return file
 
 
+TEST_FILES = [
+    generate_lasfile(
+        "dh1",
+        {"UTMX": 0.0, "UTMY": 0.0, "ELEV": 10.0},
+        np.arange(0, 11, 1),
+        {"my_property": np.zeros(11)},
+    ),
+    generate_lasfile(
+        "dh1",
+        {"UTMX": 0.0, "UTMY": 0.0, "ELEV": 10.0},
+        np.arange(0, 11, 1),
+        {"my_property": np.ones(11)},
+    ),
+    generate_lasfile(
+        "dh2",
+        {"UTMX": 10.0, "UTMY": 10.0, "ELEV": 0.0},
+        np.arange(0, 21, 1),
+        {
+            "my_property": None,
+            "my_other_property": None,
+        },
+    ),
+]
+
+
 def write_lasfile(basepath: Path, lasfile: lasio.LASFile) -> Path:
     filepath = basepath / f"{lasfile.well['WELL'].value}.las"
     if filepath.exists():
@@ -57,6 +82,9 @@ def write_import_params_file(
     collar_xyz_names: tuple[str, str, str],
     *,
     skip_empty_header=False,
+    append=False,
+    incremental=False,
+    **values,
 ) -> Path:
     if drillhole_group is None:
         workspace = Workspace.create(json_output_path.parent / "import.geoh5")
@@ -74,6 +102,9 @@ def write_import_params_file(
                 "collar_y_name": collar_xyz_names[1],
                 "collar_z_name": collar_xyz_names[2],
                 "skip_empty_header": skip_empty_header,
+                "append": append,
+                "incremental": incremental,
+                **values,
             }
         )
         ifile.write_ui_json(json_output_path.name, json_output_path.parent)
@@ -84,6 +115,37 @@ def write_import_params_file(
     return Path(ifile.path_name)
 
 
+def setup_import(
+    tmp_path: Path, files: list[Path] | None = None, **values
+) -> tuple[DrillholeGroup, Path]:
+    """
+    Create an empty drillhole group and the parameters importing LAS files into it.
+
+    :param tmp_path: Directory receiving the geoh5, LAS and parameter files.
+    :param files: Paths to the LAS files, written from ``TEST_FILES`` if None.
+    :param values: Other values of the parameter file.
+
+    :return: The drillhole group and the path to the parameter file.
+    """
+
+    with Workspace.create(tmp_path / "test.geoh5") as workspace:
+        dh_group = DrillholeGroup.create(workspace, name="dh_group")
+
+    if files is None:
+        files = [write_lasfile(tmp_path, lasfile) for lasfile in TEST_FILES]
+
+    filepath = write_import_params_file(
+        tmp_path / "import_las_files.ui.json",
+        dh_group,
+        "my_property_group",
+        files,
+        ("UTMX", "UTMY", "ELEV"),
+        **values,
+    )
+
+    return dh_group, filepath
+
+
 def write_export_params_file(
     json_output_path: Path,
     workspace: Workspace,
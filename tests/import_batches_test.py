@@ -0,0 +1,338 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                '
+#                                                                              '
+#  This file is part of las-geoh5 package.                                     '
+#                                                                              '
+#  las-geoh5 is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                 '
+#                                                                              '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import importlib
+import logging
+import os
+from pathlib import Path
+from shutil import copyfile
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from geoh5py import Workspace
+from geoh5py.groups import DrillholeGroup
+from geoh5py.objects import Drillhole
+from geoh5py.ui_json import InputFile
+from lasio.exceptions import LASHeaderError
+
+from las_geoh5.import_files.driver import file_size, pool_options, worker_count
+from las_geoh5.import_files.manifest import ImportManifest
+from las_geoh5.import_files.params import ImportOptions
+from las_geoh5.import_las import get_or_create_drillhole
+
+from .helpers import (
+    TEST_FILES,
+    generate_lasfile,
+    setup_import,
+    write_lasfile,
+)
+
+
+def append_result(tmp_path: Path, output: str) -> tuple[Path, Path | None]:
+    """
+    Output of an import appending to the input geoh5 file.
+
+    :return: The geoh5 file receiving the drillholes, and the output file
+        given to the import, if any.
+    """
+
+    if output == "output":
+        return tmp_path / "output.geoh5", tmp_path / "output.geoh5"
+
+    if output == "monitoring":
+        return tmp_path / "monitoring", None
+
+    return tmp_path / "test.geoh5", None
+
+
+@pytest.mark.parametrize("output", ["input", "output", "monitoring"])
+def test_import_las_append(tmp_path: Path, output: str):
+    result, output_geoh5 = append_result(tmp_path, output)
+    monitoring = {}
+    if output == "monitoring":
+        result.mkdir()
+        monitoring["monitoring_directory"] = str(result)
+
+    dh_group, filepath = setup_import(tmp_path, append=True, **monitoring)
+    with Workspace(tmp_path / "test.geoh5") as workspace:
+        other_group = DrillholeGroup.create(workspace, name="other_group")
+        Drillhole.create(
+            workspace, name="dh1", parent=workspace.get_entity(dh_group.uid)[0]
+        ).add_data(
+            {"old": {"depth": np.arange(0, 5.0), "values": np.random.rand(5)}},
+            property_group="my_property_group",
+        )
+
+    modified = (tmp_path / "test.geoh5").stat().st_mtime
+    importlib.import_module("las_geoh5.import_files.driver").run(filepath, output_geoh5)
+
+    assert ((tmp_path / "test.geoh5").stat().st_mtime == modified) is (
+        output != "input"
+    )
+    if output == "monitoring":
+        result = next(result.glob("*.geoh5"))
+
+    with Workspace(result, mode="r") as geoh5:
+        assert geoh5.get_entity(other_group.uid)[0] is not None
+        group = geoh5.get_entity(dh_group.uid)[0]
+        drillholes = {k.name for k in group.children if isinstance(k, Drillhole)}
+        assert drillholes == {"dh1", "dh2"}
+        dh1 = group.get_entity("dh1")[0]
+        assert {"old", "my_property"}.issubset(dh1.get_data_list())
+
+
+def test_import_las_incremental(tmp_path: Path):
+    lasfiles = [write_lasfile(tmp_path, lasfile) for lasfile in TEST_FILES]
+    dh_group, filepath = setup_import(tmp_path, lasfiles, append=True, incremental=True)
+    module = importlib.import_module("las_geoh5.import_files.driver")
+
+    def imported_data():
+        with Workspace(tmp_path / "test.geoh5", mode="r") as geoh5:
+            group = geoh5.get_entity(dh_group.uid)[0]
+            return {
+                child.name: {
+                    name: child.get_data(name)[0].values
+                    for name in child.get_data_list()
+                    if "DEPTH" not in name
+                }
+                for child in group.children
+                if isinstance(child, Drillhole)
+            }
+
+    module.run(filepath)
+    first = imported_data()
+
+    with patch.object(
+        module, "las_to_drillhole", side_effect=module.las_to_drillhole
+    ) as mock_import:
+        module.run(filepath)
+
+    mock_import.assert_not_called()
+    assert imported_data().keys() == first.keys()
+    for name, data in imported_data().items():
+        assert data.keys() == first[name].keys()
+
+    lasfiles[2].unlink()
+    write_lasfile(
+        tmp_path,
+        generate_lasfile(
+            "dh2",
+            {"UTMX": 10.0, "UTMY": 10.0, "ELEV": 0.0},
+            np.arange(0, 21, 1),
+            {"my_property": np.full(21, 2.0), "my_other_property": None},
+        ),
+    )
+    module.run(filepath)
+    second = imported_data()
+
+    assert second["dh1"].keys() == first["dh1"].keys()
+    assert second["dh2"].keys() == first["dh2"].keys()
+    np.testing.assert_array_equal(second["dh2"]["my_property"], 2.0)
+    with Workspace(tmp_path / "test.geoh5", mode="r") as geoh5:
+        dh2 = geoh5.get_entity(dh_group.uid)[0].get_entity("dh2")[0]
+        assert sorted(dh2.get_data_list()) == [
+            "DEPTH",
+            "my_other_property",
+            "my_property",
+        ]
+
+
+@pytest.mark.parametrize("append", [False, True])
+def test_import_las_resume(tmp_path: Path, append: bool):
+    dh_group, filepath = setup_import(tmp_path, append=append, checkpoint=1)
+    module = importlib.import_module("las_geoh5.import_files.driver")
+    commit = module.commit_checkpoint
+
+    def interrupt(*args):
+        if interrupt.count == 2:
+            args[0].workspace.geoh5.close()
+            raise RuntimeError("Interrupted")
+        interrupt.count += 1
+        return commit(*args)
+
+    interrupt.count = 0
+    output = tmp_path / "output.geoh5"
+    with patch.object(module, "commit_checkpoint", side_effect=interrupt):
+        with pytest.raises(RuntimeError, match="Interrupted"):
+            module.run(filepath, output)
+
+    checkpoint = tmp_path / "import_las_files.checkpoint.geoh5"
+    with Workspace(checkpoint, mode="r") as geoh5:
+        group = geoh5.get_entity(dh_group.uid)[0]
+        assert len(ImportManifest.read(group).files) == 1
+
+    ifile = InputFile.read_ui_json(filepath)
+    ifile.data["resume"] = True
+    ifile.write_ui_json(filepath.name, filepath.parent)
+    with patch.object(
+        module, "las_to_drillhole", wraps=module.las_to_drillhole
+    ) as mock:
+        module.run(filepath, output)
+
+    assert mock.call_count == 2
+    assert not checkpoint.exists()
+    with Workspace(output, mode="r") as geoh5:
+        group = geoh5.get_entity(dh_group.uid)[0]
+        assert len(ImportManifest.read(group).files) == 3
+        dh1 = group.get_entity("dh1")[0]
+        dh2 = group.get_entity("dh2")[0]
+        assert {"my_property", "my_property (1)"}.issubset(dh1.get_data_list())
+        assert {"my_property", "my_other_property"}.issubset(dh2.get_data_list())
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_import_las_checkpoint_surveys(tmp_path: Path, bulk: bool):
+    files = []
+    for depths in [np.arange(0, 10.0, 0.5), np.arange(40, 50.0)]:
+        lasfile = generate_lasfile(
+            "dh1",
+            {"UTMX": 0.0, "UTMY": 0.0, "ELEV": 10.0},
+            depths,
+            {"my_property": None},
+        )
+        files.append(write_lasfile(tmp_path, lasfile))
+    dh_group, filepath = setup_import(tmp_path, files, checkpoint=1, bulk=bulk)
+
+    module = importlib.import_module("las_geoh5.import_files.driver")
+    module.run(filepath, tmp_path / "output.geoh5")
+
+    with Workspace(tmp_path / "output.geoh5", mode="r") as geoh5:
+        dh1 = geoh5.get_entity(dh_group.uid)[0].get_entity("dh1")[0]
+        np.testing.assert_array_equal(dh1.surveys[:, 0], [0.0, 49.0])
+
+
+@pytest.mark.parametrize("on_error", ["skip", "quarantine", "abort"])
+def test_import_las_failures(tmp_path: Path, on_error: str, caplog):
+    lasfiles = [write_lasfile(tmp_path, lasfile) for lasfile in TEST_FILES]
+    malformed = tmp_path / "malformed.las"
+    malformed.write_text("~Version\nVERS. 2.0:\n~Well\nnot a header line\n~A\n1 2\n")
+    (tmp_path / "other").mkdir()
+    other = copyfile(malformed, tmp_path / "other" / malformed.name)
+    quarantine = tmp_path / "quarantine"
+    dh_group, filepath = setup_import(
+        tmp_path,
+        [lasfiles[0], malformed, *lasfiles[1:], other],
+        on_error=on_error,
+        quarantine_directory=str(quarantine),
+    )
+
+    module = importlib.import_module("las_geoh5.import_files.driver")
+    output = tmp_path / "output.geoh5"
+    if on_error == "abort":
+        with pytest.raises(LASHeaderError, match="not a header line"):
+            module.run(filepath, output)
+        return
+
+    with caplog.at_level(logging.WARNING):
+        module.run(filepath, output)
+
+    assert "2 LAS file(s) failed to import" in caplog.text
+    assert f"{malformed}: LASHeaderError" in caplog.text
+    assert malformed.exists() is (on_error == "skip")
+    assert sorted(path.name for path in quarantine.glob("*.las")) == (
+        ["malformed.las", "malformed_1.las"] if on_error == "quarantine" else []
+    )
+
+    with Workspace(output, mode="r") as geoh5:
+        group = geoh5.get_entity(dh_group.uid)[0]
+        assert {
+            child.name for child in group.children if isinstance(child, Drillhole)
+        } == {"dh1", "dh2"}
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_import_las_write_failures(tmp_path: Path, bulk: bool, caplog):
+    lasfiles = [write_lasfile(tmp_path, lasfile) for lasfile in TEST_FILES]
+    dh_group, filepath = setup_import(tmp_path, lasfiles, bulk=bulk)
+
+    def clash(lasfile, *args):
+        if lasfile.name == "dh2":
+            raise TypeError("Drillhole dh2 exists in workspace but is not a Drillhole.")
+        return get_or_create_drillhole(lasfile, *args)
+
+    module = importlib.import_module("las_geoh5.import_files.driver")
+    with (
+        caplog.at_level(logging.WARNING),
+        patch("las_geoh5.import_las.get_or_create_drillhole", side_effect=clash),
+        patch("las_geoh5.bulk_import.get_or_create_drillhole", side_effect=clash),
+    ):
+        module.run(filepath, tmp_path / "output.geoh5")
+
+    assert "1 LAS file(s) failed to import" in caplog.text
+    assert f"{lasfiles[2]}: TypeError" in caplog.text
+
+    with Workspace(tmp_path / "output.geoh5", mode="r") as geoh5:
+        group = geoh5.get_entity(dh_group.uid)[0]
+        assert [
+            child.name for child in group.children if isinstance(child, Drillhole)
+        ] == ["dh1"]
+        assert {"my_property", "my_property (1)"}.issubset(
+            group.get_entity("dh1")[0].get_data_list()
+        )
+
+
+def test_file_size(tmp_path: Path):
+    (tmp_path / "a.las").write_bytes(b" " * 10)
+
+    assert file_size(str(tmp_path / "a.las")) == 10
+    assert file_size(str(tmp_path / "missing.las")) == -1
+
+
+@pytest.mark.parametrize("order", ["size", "files"])
+def test_import_las_order(tmp_path: Path, order: str):
+    lasfiles = [write_lasfile(tmp_path, lasfile) for lasfile in TEST_FILES]
+    lasfiles[1].write_text(lasfiles[1].read_text() + "\n" * 100)
+    dh_group, filepath = setup_import(tmp_path, lasfiles, order=order, n_workers=2)
+
+    module = importlib.import_module("las_geoh5.import_files.driver")
+    module.run(filepath, tmp_path / "output.geoh5")
+
+    with Workspace(tmp_path / "output.geoh5", mode="r") as geoh5:
+        dh1 = geoh5.get_entity(dh_group.uid)[0].get_entity("dh1")[0]
+        np.testing.assert_array_equal(dh1.get_data("my_property")[0].values, 0.0)
+        np.testing.assert_array_equal(dh1.get_data("my_property (1)")[0].values, 1.0)
+
+
+def test_worker_count(tmp_path: Path):
+    small = [write_lasfile(tmp_path, lasfile) for lasfile in TEST_FILES]
+    large = tmp_path / "large.las"
+    large.write_bytes(b" " * 2**23)
+
+    assert worker_count([str(large)]) == 0
+    assert worker_count([str(k) for k in small]) == 0
+    assert worker_count([str(large), *map(str, small)]) == min(4, os.cpu_count())
+    assert worker_count([str(k) for k in small], n_workers=2) == 2
+
+
+@pytest.mark.parametrize("limits", [{"timeout": 5.0}, {"memory_limit": 512}])
+def test_pool_options_limits(tmp_path: Path, limits: dict):
+    files = [str(write_lasfile(tmp_path, TEST_FILES[0]))]
+
+    assert pool_options(ImportOptions(), files)["processes"] == 0
+
+    kwargs = pool_options(ImportOptions(**limits), files)
+    assert kwargs["processes"] == 1
+    assert {key: kwargs[key] for key in limits} == limits
+
+    assert pool_options(ImportOptions(n_workers=0, **limits), files)["processes"] == 0
+
+
+def test_pool_limits_ui_json(tmp_path: Path):
+    _, filepath = setup_import(tmp_path)
+    data = InputFile.read_ui_json(filepath).data
+    assert (data["timeout"], data["memory_limit"], data["max_tasks"]) == (None,) * 3
+
+    (tmp_path / "limited").mkdir()
+    _, filepath = setup_import(tmp_path / "limited", timeout=5.0, max_tasks=10)
+    options = ImportOptions(**InputFile.read_ui_json(filepath).data)
+    assert (options.timeout, options.memory_limit, options.max_tasks) == (5.0, None, 10)
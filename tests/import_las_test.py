@@ -13,7 +13,11 @@ from __future__ import annotations
 import datetime
 import importlib
 import logging
+import pickle
+from functools import partial
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import lasio
@@ -24,41 +28,35 @@ from geoh5py.groups import DrillholeGroup
 from geoh5py.objects import Drillhole
 from lasio import LASFile
 
-from las_geoh5.import_files.driver import log_execution_time
+from las_geoh5.import_files.driver import (
+    log_execution_time,
+    scan_headers,
+)
 from las_geoh5.import_files.params import NameOptions
 from las_geoh5.import_las import (
+    LASRecord,
     LASTranslator,
     add_data,
     add_survey,
     create_or_append_drillhole,
+    find_copy_name,
+    index_surveys,
+    las_to_drillhole,
+    lasio_read,
+    numpy_read,
+    read_header,
+    read_record,
+)
+from las_geoh5.lasio_patch import patch_lasio_reader
+from las_geoh5.pool import stream
+from las_geoh5.workspace_index import WorkspaceIndex
+
+from .helpers import (
+    TEST_FILES,
+    generate_lasfile,
+    write_import_params_file,
+    write_lasfile,
 )
-
-from .helpers import generate_lasfile, write_import_params_file, write_lasfile
-
-
-TEST_FILES = [
-    generate_lasfile(
-        "dh1",
-        {"UTMX": 0.0, "UTMY": 0.0, "ELEV": 10.0},
-        np.arange(0, 11, 1),
-        {"my_property": np.zeros(11)},
-    ),
-    generate_lasfile(
-        "dh1",
-        {"UTMX": 0.0, "UTMY": 0.0, "ELEV": 10.0},
-        np.arange(0, 11, 1),
-        {"my_property": np.ones(11)},
-    ),
-    generate_lasfile(
-        "dh2",
-        {"UTMX": 10.0, "UTMY": 10.0, "ELEV": 0.0},
-        np.arange(0, 21, 1),
-        {
-            "my_property": None,
-            "my_other_property": None,
-        },
-    ),
-]
 
 
 def test_encoding(tmp_path: Path):
@@ -264,12 +262,7 @@ def test_skip_empty_header_option(tmp_path: Path):
         dh_group = DrillholeGroup.create(workspace, name="dh_group")
 
     files = [
-        generate_lasfile(
-            "dh1",
-            {"UTMX": 0.0, "UTMY": 0.0, "ELEV": 10.0},
-            np.arange(0, 11, 1),
-            {"my_property": np.zeros(11)},
-        ),
+        TEST_FILES[0],
         generate_lasfile(
             "dh2",
             {},
@@ -524,3 +517,369 @@ def test_existing_drillhole_new_collar_location(tmp_path):
     dh_compare = create_or_append_drillhole(lasfile, dh_group, "test")
 
     assert dh.uid == dh_compare.uid
+
+
+def test_las_record(tmp_path):
+    lasfile = generate_lasfile(
+        "dh1",
+        {"X": 1.0, "Y": 2.0, "ELEV": 3.0},
+        np.arange(0, 100, 0.5),
+        {"my_property": None, "my_other_property": None},
+    )
+    lasfile.append_curve("my_referenced", np.ones(200))
+    lasfile.params.append(
+        lasio.HeaderItem(mnemonic="my_referenced (1)", value="A", descr="REFERENCE")
+    )
+    record = read_record(write_lasfile(tmp_path, lasfile))
+
+    assert record.name == "dh1"
+    assert record.collar == [1.0, 2.0, 3.0]
+    assert np.allclose(record.depths["depth"], np.arange(0, 100, 0.5))
+    assert record.curves == ["my_property", "my_other_property", "my_referenced"]
+    assert record.values.shape == (3, 200)
+    assert record.values.flags.c_contiguous
+    assert np.allclose(record.values[0], lasfile["my_property"], atol=1e-5)
+    assert record.value_maps == {"my_referenced": {1: "A"}}
+    assert len(pickle.dumps(record)) < len(pickle.dumps(lasfile))
+
+    with Workspace.create(tmp_path / "test.geoh5") as workspace:
+        dh_group = DrillholeGroup.create(workspace, name="dh_group")
+        drillhole = create_or_append_drillhole(record, dh_group, "my_group")
+        assert drillhole.name == "dh1"
+        assert drillhole.get_data("my_referenced")[0].value_map()[1] == "A"
+        assert isinstance(pickle.loads(pickle.dumps(record)), LASRecord)
+
+
+def test_las_record_shared_memory(tmp_path):
+    lasfiles = [write_lasfile(tmp_path, lasfile) for lasfile in TEST_FILES]
+    records = list(stream(partial(read_record, shared=True), lasfiles, processes=2))
+    assert all(isinstance(k.memory, SharedMemory) for k in records)
+    names = [k.memory.name for k in records]
+    assert np.allclose(records[1].values, 1.0)
+
+    with Workspace.create(tmp_path / "test.geoh5") as workspace:
+        dh_group = DrillholeGroup.create(workspace, name="dh_group")
+        las_to_drillhole(records, dh_group, "my_property_group")
+        assert all(k.memory is None for k in records)
+        for name in names:
+            with pytest.raises(FileNotFoundError):
+                SharedMemory(name=name)
+
+        dh1 = workspace.get_entity("dh1")[0]
+        assert np.allclose(dh1.get_data("my_property (1)")[0].values, 1.0)
+
+
+def test_las_record_shared_memory_in_process(tmp_path):
+    lasfiles = [write_lasfile(tmp_path, lasfile) for lasfile in TEST_FILES]
+    records = list(stream(partial(read_record, shared=True), lasfiles, processes=0))
+    names = [k.memory.name for k in records]
+
+    with Workspace.create(tmp_path / "test.geoh5") as workspace:
+        dh_group = DrillholeGroup.create(workspace, name="dh_group")
+        las_to_drillhole(records, dh_group, "my_property_group")
+        dh1 = workspace.get_entity("dh1")[0]
+        assert np.allclose(dh1.get_data("my_property (1)")[0].values, 1.0)
+
+    assert all(k.memory is None for k in records)
+    for name in names:
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=name)
+
+
+def test_read_header(tmp_path, caplog):
+    files = [
+        write_lasfile(tmp_path, lasfile)
+        for lasfile in [
+            *TEST_FILES,
+            generate_lasfile("dh3", {}, np.arange(0, 11, 1), {"my_property": None}),
+        ]
+    ]
+    translator = LASTranslator(NameOptions(collar_x_name="UTMX", collar_y_name="UTMY"))
+    header = read_header(files[2], translator)
+    assert header.name == "dh2"
+    assert header.collar == [10.0, 10.0, 0.0]
+    assert header.curves == ["DEPTH", "my_property", "my_other_property"]
+
+    with Workspace.create(tmp_path / "test.geoh5") as workspace:
+        dh_group = DrillholeGroup.create(workspace, name="dh_group")
+        Drillhole.create(workspace, name="dh2", parent=dh_group)
+
+        with caplog.at_level(logging.INFO):
+            kept = scan_headers([str(k) for k in files], dh_group, translator)
+
+    assert kept == [str(k) for k in files[:3]]
+    assert "Skipping 1 LAS file(s) without collar information." in caplog.text
+    assert "into 2 drillhole(s), including 1 new ones." in caplog.text
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_numpy_read(tmp_path, newline):
+    values = np.random.randn(100)
+    values[[5, 50]] = -999.25
+    lasfile = generate_lasfile(
+        "dh1",
+        {"X": 1.0, "Y": 2.0, "ELEV": 3.0},
+        np.arange(0, 100, 1.0),
+        {"my_property": values, "my_other_property": None},
+    )
+    lasfile.well["NULL"].value = -999.25
+    filepath = write_lasfile(tmp_path, lasfile)
+    filepath.write_text(filepath.read_text(), newline=newline)
+
+    fast, reference = numpy_read(filepath), lasio_read(filepath)
+    assert fast.well["WELL"].value == "dh1"
+    assert [k.mnemonic for k in fast.curves] == [k.mnemonic for k in reference.curves]
+    for curve, other in zip(fast.curves, reference.curves, strict=True):
+        assert np.allclose(curve.data, other.data, equal_nan=True)
+    assert np.isnan(fast["my_property"][[5, 50]]).all()
+
+
+def test_numpy_read_integer_null(tmp_path):
+    filepath = tmp_path / "dh1.las"
+    filepath.write_text(
+        "~Version\nVERS. 2.0 :\nWRAP. NO :\n"
+        "~Well\nWELL. dh1 :\nNULL. -999 :\n"
+        "~Curve\nDEPTH.m :\nGR. :\n"
+        "~A\n0 -999\n1 2\n",
+        encoding="utf8",
+    )
+
+    lasfile = numpy_read(filepath)
+
+    assert np.isnan(lasfile["GR"][0])
+    assert lasfile["GR"][1] == 2.0
+
+
+@pytest.mark.parametrize("parser", ["numpy", "lasio"])
+def test_import_text_curve(tmp_path, parser):
+    filepath = tmp_path / "dh1.las"
+    filepath.write_text(
+        "~Version\nVERS. 2.0 :\nWRAP. NO :\n"
+        "~Well\nWELL. dh1 :\nNULL. -999.25 :\n"
+        "~Curve\nDEPTH.m :\nA. :\nB. :\n"
+        "~A\n0 abc 2\n1 def 3\n",
+        encoding="utf8",
+    )
+
+    record = read_record(filepath, shared=True, parser=parser)
+    assert record.values.shape == (1, 2)
+    assert list(record.text) == ["A"]
+
+    with Workspace.create(tmp_path / f"{__name__}.geoh5") as workspace:
+        dh_group = DrillholeGroup.create(workspace, name="dh_group")
+        las_to_drillhole([record], dh_group, "my_property_group")
+
+        drillhole = dh_group.get_entity("dh1")[0]
+        assert drillhole.get_data("A")[0].entity_type.primitive_type.name == "TEXT"
+        assert list(drillhole.get_data("A")[0].values) == ["abc", "def"]
+        assert drillhole.get_data("B")[0].entity_type.primitive_type.name == "FLOAT"
+        assert np.allclose(drillhole.get_data("B")[0].values, [2.0, 3.0])
+
+
+def test_numpy_read_fallback(tmp_path):
+    lasfile = generate_lasfile("dh1", {}, np.arange(0, 10, 1.0), {"my_property": None})
+    filepath = tmp_path / "wrapped.las"
+    with open(filepath, "w", encoding="utf8") as file:
+        lasfile.write(file, wrap=True)
+    assert np.allclose(
+        numpy_read(filepath)["my_property"], lasfile["my_property"], atol=1e-4
+    )
+
+    filepath = write_lasfile(tmp_path, lasfile)
+    filepath.write_text(filepath.read_text().replace("0.00000", "0,00000", 1))
+    with patch("las_geoh5.import_las.lasio_read", wraps=lasio_read) as mock_read:
+        fast = numpy_read(filepath)
+        assert mock_read.call_args.args == (filepath,)
+    assert fast["DEPTH"][0] == 0.0
+
+    with pytest.raises(ValueError, match="Parser must be one of"):
+        read_record(filepath, parser="other")
+
+
+@pytest.mark.parametrize(
+    ("line", "section_name"),
+    [
+        ("DEPT.M                 : Depth", "Curves"),
+        ("GR  .GAPI   45.2 : Gamma ray: corrected", "Curves"),
+        ("STRT.M   0.5 : First depth", "Well"),
+        ("NULL.  -999.25 : Null value", "Well"),
+        ("PRES.1000 psi   12 : Pressure", "Parameter"),
+        ("TIME.   12:30 : Start time", "Parameter"),
+        ("VERS.   2.0 : CWLS LOG ASCII STANDARD", "Version"),
+        ("WELL   : dh1", "Well"),
+        ("TD.M..  100.0 : Total depth", "Curves"),
+        ("UWI.   dh1", "Well"),
+        (".M  10 : leading period", "Well"),
+        ("UNIT.m.  3 : trailing period", "Well"),
+    ],
+)
+def test_read_header_line(line, section_name):
+    patch_lasio_reader()
+    reference = None
+    for pattern in lasio.reader.configure_metadata_patterns(line, section_name):
+        try:
+            reference = lasio.reader.read_header_line(line, pattern=pattern)
+            break
+        except AttributeError:
+            continue
+
+    assert reference is not None
+    assert lasio.reader.read_header_line(line, section_name=section_name) == reference
+
+
+def test_name_index(tmp_path):
+    with Workspace.create(tmp_path / "test.geoh5") as workspace:
+        dh_group = DrillholeGroup.create(workspace, name="dh_group")
+        Drillhole.create(workspace, name="dh1", parent=dh_group)
+        Drillhole.create(workspace, name="dh1 (1)")
+
+        index = WorkspaceIndex(workspace, dh_group)
+        assert index.get_drillhole("dh1").parent == dh_group
+        assert index.get_drillhole("dh1 (1)") is None
+        assert [index.copy_name("dh1") for _ in range(3)] == [
+            "dh1 (2)",
+            "dh1 (3)",
+            "dh1 (4)",
+        ]
+        assert index.copy_name("dh2") == "dh2"
+
+        lasfiles = [
+            generate_lasfile("dh2", {}, np.arange(0, 10, 1.0), {"my_property": None})
+            for _ in range(3)
+        ]
+        las_to_drillhole(lasfiles, dh_group, "my_group")
+        assert {k.name for k in dh_group.children} == {"dh1", "dh2"}
+        dh2 = dh_group.get_entity("dh2")[0]
+        assert sorted(k.name for k in dh2.property_groups) == [
+            "my_group",
+        ]
+        assert {"my_property", "my_property (1)", "my_property (2)"}.issubset(
+            dh2.get_data_list()
+        )
+
+    taken = {"dh3"} | {f"dh3 ({ind})" for ind in range(1, 5000)}
+    container = SimpleNamespace(
+        get_entity=lambda name: [name if name in taken else None]
+    )
+    assert find_copy_name(container, "dh3") == "dh3 (5000)"
+
+
+def test_shared_data_types(tmp_path):
+    depths = np.arange(0, 10, 1.0)
+    value_maps = [{1: "a", 2: "b"}, {1: "a", 2: "b"}, {1: "c", 2: "d"}]
+    records = [
+        LASRecord(
+            f"dh{ind}",
+            [0.0, 0.0, 0.0],
+            {"depth": depths},
+            ["gr", "lith"],
+            ["GAPI", ""],
+            np.vstack([np.random.rand(10), np.tile([1.0, 2.0], 5)]),
+            {"lith": value_map},
+        )
+        for ind, value_map in enumerate(value_maps)
+    ]
+
+    with Workspace.create(tmp_path / "test.geoh5") as workspace:
+        dh_group = DrillholeGroup.create(workspace, name="dh_group")
+        las_to_drillhole(records, dh_group, "my_group")
+        drillholes = sorted(dh_group.children, key=lambda k: k.name)
+
+        gr_types = {dh.get_data("gr")[0].entity_type.uid for dh in drillholes}
+        lith_types = [dh.get_data("lith")[0].entity_type.uid for dh in drillholes]
+
+        assert len(gr_types) == 1
+        assert lith_types[0] == lith_types[1] != lith_types[2]
+
+
+def test_property_group_index(tmp_path):
+    runs = [np.arange(0, 10, 1.0), np.arange(0, 20, 1.0), np.arange(0, 10, 1.0)]
+    runs += [np.arange(0, 10, 1.0) + 0.005, np.arange(5, 15, 1.0)]
+    lasfiles = [
+        generate_lasfile("dh1", {}, depths, {f"run {ind}": None})
+        for ind, depths in enumerate(runs)
+    ]
+
+    with Workspace.create(tmp_path / "test.geoh5") as workspace:
+        dh_group = DrillholeGroup.create(workspace, name="dh_group")
+        with patch(
+            "geoh5py.shared.concatenation.ConcatenatedPropertyGroup.is_collocated",
+            autospec=True,
+            side_effect=lambda group, locations, tolerance: np.allclose(
+                locations, group.locations, atol=tolerance
+            ),
+        ) as mock_collocated:
+            las_to_drillhole(lasfiles, dh_group, "my_group")
+
+        dh1 = dh_group.get_entity("dh1")[0]
+        groups = {
+            group.name: sorted(
+                name
+                for name in (dh1.get_entity(k)[0].name for k in group.properties)
+                if name.startswith("run")
+            )
+            for group in dh1.property_groups
+        }
+
+    assert mock_collocated.call_count == 2
+    assert groups == {
+        "my_group": ["run 0", "run 2", "run 3"],
+        "my_group (1)": ["run 1"],
+        "my_group (2)": ["run 4"],
+    }
+
+
+def test_attach_surveys(tmp_path):
+    names = ["dhs", "dhl", "dh_a"]
+    surveys = []
+    for ind, name in enumerate(names):
+        survey = np.c_[
+            np.linspace(0, 10.0 * (ind + 1), 5), np.ones(5) * 45.0, np.ones(5) * -80.0
+        ]
+        filepath = tmp_path / (f"{name}_survey.csv" if ind else f"{name}.csv")
+        np.savetxt(filepath, survey, delimiter=",", header="depth, dip, azimuth")
+        surveys.append(filepath)
+
+    index = index_surveys([*surveys, tmp_path / "dh_a_survey_survey.las"])
+    assert index["dhs"] == surveys[0]
+    assert index["dhl"] == index["dhl_survey"] == surveys[1]
+    assert index["dh_a"] == index["dh_a_survey"] == surveys[2]
+
+    lasfiles = [
+        generate_lasfile(name, {}, np.arange(0, 10, 1.0), {"my_property": None})
+        for name in [*names, "dh"]
+    ]
+    with Workspace.create(tmp_path / "test.geoh5") as workspace:
+        dh_group = DrillholeGroup.create(workspace, name="dh_group")
+        las_to_drillhole(lasfiles, dh_group, "my_group", surveys=surveys)
+
+        for ind, name in enumerate(names):
+            drillhole = dh_group.get_entity(name)[0]
+            assert drillhole.end_of_hole == 10.0 * (ind + 1)
+            assert len(drillhole.surveys) == 5
+
+        assert dh_group.get_entity("dh")[0].end_of_hole == 9.0
+
+
+def test_end_of_hole_tracking(tmp_path):
+    lasfiles = [
+        generate_lasfile("dh1", {}, np.arange(0, 10, 1.0), {"my_property": None}),
+        generate_lasfile("dh1", {}, np.arange(0, 25, 1.0), {"other": None}),
+        generate_lasfile("dh2", {}, np.arange(0, 5, 1.0), {"my_property": None}),
+    ]
+    with Workspace.create(tmp_path / "test.geoh5") as workspace:
+        dh_group = DrillholeGroup.create(workspace, name="dh_group")
+        Drillhole.create(workspace, name="dh2", parent=dh_group).add_data(
+            {"old": {"depth": np.arange(0, 50.0), "values": np.random.rand(50)}}
+        )
+        with patch.object(
+            WorkspaceIndex,
+            "max_depth",
+            autospec=True,
+            side_effect=WorkspaceIndex.max_depth,
+        ) as mock_depth:
+            las_to_drillhole(lasfiles, dh_group, "my_group")
+
+        assert mock_depth.call_count == 1
+        assert dh_group.get_entity("dh1")[0].end_of_hole == 24.0
+        assert dh_group.get_entity("dh2")[0].end_of_hole == 49.0
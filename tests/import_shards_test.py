@@ -0,0 +1,123 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                '
+#                                                                              '
+#  This file is part of las-geoh5 package.                                     '
+#                                                                              '
+#  las-geoh5 is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                 '
+#                                                                              '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+from unittest.mock import patch
+
+import h5py
+import numpy as np
+import pytest
+from geoh5py import Workspace
+from geoh5py.objects import Drillhole
+
+from las_geoh5.import_files.manifest import ImportManifest
+from las_geoh5.import_files.shards import COMPRESSION, partition, write_gathered
+from las_geoh5.import_las import read_header
+
+from .helpers import (
+    TEST_FILES,
+    generate_lasfile,
+    setup_import,
+    write_lasfile,
+)
+
+
+def assert_manifest(group, count: int):
+    manifest = ImportManifest.read(group)
+    assert len(manifest.files) == count
+    for entry in manifest.files.values():
+        drillhole = group.workspace.get_entity(entry.drillhole)[0]
+        assert drillhole.parent.uid == group.uid
+        assert all(drillhole.get_entity(uid)[0] is not None for uid in entry.data)
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+@pytest.mark.parametrize("append", [False, True])
+def test_import_las_shards(tmp_path: Path, append: bool, bulk: bool):
+    dh3 = generate_lasfile(
+        "dh3",
+        {"UTMX": 20.0, "UTMY": 20.0, "ELEV": 0.0},
+        np.arange(0, 31, 1),
+        {"my_property": np.full(31, 3.0)},
+    )
+    dh_group, filepath = setup_import(
+        tmp_path,
+        [write_lasfile(tmp_path, lasfile) for lasfile in [*TEST_FILES, dh3]],
+        append=append,
+        incremental=True,
+        shards=True,
+        bulk=bulk,
+    )
+    with Workspace(tmp_path / "test.geoh5") as workspace:
+        existing = Drillhole.create(
+            workspace,
+            name="dh1",
+            parent=workspace.get_entity(dh_group.uid)[0],
+            collar=[0.0, 0.0, 10.0],
+        )
+
+    module = importlib.import_module("las_geoh5.import_files.driver")
+    output = tmp_path / "output.geoh5"
+    with patch.object(module, "import_shards", wraps=module.import_shards) as mock:
+        module.run(filepath, output, n_workers=2)
+
+    assert mock.call_count == 1
+    with Workspace(output, mode="r") as geoh5:
+        group = geoh5.get_entity(dh_group.uid)[0]
+        drillholes = {child.name: child for child in group.children}
+        assert drillholes["dh1"].uid == existing.uid
+        assert {"my_property", "my_property (1)"}.issubset(
+            drillholes["dh1"].get_data_list()
+        )
+        assert {"my_property", "my_other_property"}.issubset(
+            drillholes["dh2"].get_data_list()
+        )
+        np.testing.assert_array_equal(
+            drillholes["dh3"].get_data("my_property")[0].values, 3.0
+        )
+        np.testing.assert_array_equal(drillholes["dh3"].collar.tolist(), [20, 20, 0])
+        assert [pg.name for pg in drillholes["dh3"].property_groups] == [
+            "my_property_group"
+        ]
+
+        assert_manifest(group, 4)
+
+
+def test_merge_shards_writes_once(tmp_path: Path):
+    dh_group, filepath = setup_import(tmp_path, shards=True)
+
+    module = importlib.import_module("las_geoh5.import_files.driver")
+    output = tmp_path / "output.geoh5"
+    with patch(
+        "las_geoh5.import_files.shards.write_gathered", wraps=write_gathered
+    ) as mock:
+        module.run(filepath, output, n_workers=2)
+
+    assert mock.call_count == 1
+    _, arrays = mock.call_args.args[1]["Concatenated object IDs"]
+    assert len(arrays) == 2
+
+    with h5py.File(output, "r") as h5file:
+        group = h5file[list(h5file)[0]]["Groups"][f"{{{dh_group.uid}}}"]
+        assert len(group["Concatenated object IDs"]) == 2
+        assert group["Concatenated object IDs"].compression_opts == COMPRESSION
+
+
+def test_partition(tmp_path: Path):
+    lasfiles = [str(write_lasfile(tmp_path, lasfile)) for lasfile in TEST_FILES]
+    headers = {file: read_header(file) for file in lasfiles}
+
+    shards = partition(lasfiles, headers, 2)
+
+    assert sorted(map(sorted, shards)) == [sorted(lasfiles[:2]), [lasfiles[2]]]
+    assert partition(lasfiles, headers, 4) == shards
@@ -0,0 +1,155 @@
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+#  Copyright (c) 2024-2026 Mira Geoscience Ltd.                                '
+#                                                                              '
+#  This file is part of las-geoh5 package.                                     '
+#                                                                              '
+#  las-geoh5 is distributed under the terms and conditions of the MIT License  '
+#  (see LICENSE file at the root of this source code package).                 '
+#                                                                              '
+# ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
+
+import os
+import time
+from typing import NamedTuple
+from unittest.mock import patch
+
+import pytest
+
+from las_geoh5.pool import Failure, stream
+
+
+def square(value: int) -> int:
+    return value**2
+
+
+def test_stream_preserves_order():
+    results = stream(square, range(20), processes=2, queue_size=3)
+    assert list(results) == [k**2 for k in range(20)]
+
+
+def started(value: int) -> tuple[int, float]:
+    return value, time.monotonic()
+
+
+def test_stream_priority():
+    results = list(
+        stream(started, [1, 3, 2, 5, 4], processes=1, queue_size=3, priority=abs)
+    )
+
+    assert [value for value, _ in results] == [1, 3, 2, 5, 4]
+    starts = sorted(results, key=lambda k: k[1])
+    assert [value for value, _ in starts] == [3, 2, 1, 5, 4]
+
+
+def test_stream_is_lazy():
+    consumed = []
+
+    def items():
+        for k in range(10):
+            consumed.append(k)
+            yield k
+
+    results = stream(square, items(), processes=2, queue_size=2)
+    assert next(results) == 0
+    assert len(consumed) == 2
+    results.close()
+
+
+def inverse(value: int) -> float:
+    return 1 / value
+
+
+def test_stream_capture_errors():
+    results = list(stream(inverse, range(-1, 2), processes=2, capture_errors=True))
+    assert results[0] == -1.0
+    assert results[2] == 1.0
+    assert isinstance(results[1], Failure)
+    assert results[1].item == 0
+    assert results[1].reason == "ZeroDivisionError: division by zero"
+
+
+def wait(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+def allocate(megabytes: int) -> int:
+    return len(bytearray(megabytes * 2**20))
+
+
+def process_id(_) -> int:
+    return os.getpid()
+
+
+def test_stream_timeout():
+    start = time.time()
+    results = list(
+        stream(wait, [0.0, 30.0, 0.1], processes=2, timeout=1.0, capture_errors=True)
+    )
+    assert time.time() - start < 10.0
+    assert results[0] == 0.0
+    assert results[2] == 0.1
+    assert results[1].item == 30.0
+    assert results[1].reason.startswith("TimeoutError")
+
+    with pytest.raises(TimeoutError, match="time limit of 1.0 s"):
+        list(stream(wait, [30.0], processes=1, timeout=1.0))
+
+
+RELEASED: list[float] = []
+
+
+class Resource(NamedTuple):
+    value: float
+
+    def release(self):
+        RELEASED.append(self.value)
+
+
+def acquire(seconds: float) -> Resource:
+    time.sleep(seconds)
+    return Resource(seconds)
+
+
+def test_stream_releases_discarded_results():
+    RELEASED.clear()
+    results = stream(acquire, [0.0, 0.01, 0.02], processes=2, queue_size=3)
+    assert next(results).value == 0.0
+    time.sleep(1.0)
+    results.close()
+    assert sorted(RELEASED) == [0.01, 0.02]
+
+    RELEASED.clear()
+    results = stream(
+        acquire, [0.0, 30.0, 0.01], processes=2, timeout=1.0, capture_errors=True
+    )
+    assert [getattr(k, "value", None) for k in results] == [0.0, None, 0.01]
+    assert not RELEASED
+
+
+def test_stream_memory_limit():
+    results = list(
+        stream(allocate, [1, 8192], processes=1, memory_limit=4096, capture_errors=True)
+    )
+    assert results[0] == 2**20
+    assert results[1].reason.startswith("MemoryError")
+
+
+def test_stream_max_tasks():
+    results = list(stream(process_id, range(4), processes=1, max_tasks=1))
+    assert len(set(results)) == 4
+
+
+def test_stream_in_process():
+    with patch("las_geoh5.pool.Pool") as mock_pool:
+        results = list(stream(inverse, range(-1, 2), processes=0, capture_errors=True))
+
+    mock_pool.assert_not_called()
+    assert results[0] == -1.0
+    assert results[1].reason == "ZeroDivisionError: division by zero"
+    assert results[2] == 1.0
+
+
+def test_stream_invalid_queue_size():
+    with pytest.raises(ValueError, match="Queue size must be a positive"):
+        list(stream(square, range(2), queue_size=0))
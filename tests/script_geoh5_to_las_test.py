@@ -133,3 +133,32 @@ def test_geoh5_to_las_with_absolute_output_dir(
 
     assert len([forced_export_dir.glob("*.las")]) > 0
     assert not unused_dir.exists()
+
+
+def test_geoh5_to_las_with_workers(
+    tmp_path: Path,
+    input_workspace: Workspace,
+    dh_group: DrillholeGroup,
+):
+    """Test the geoh5_to_las script with worker processes."""
+
+    export_dir = tmp_path / "export here"
+    export_dir.mkdir()
+    params_filepath = write_export_params_file(
+        tmp_path / "export params.json",
+        input_workspace,
+        dh_group,
+        export_dir,
+        use_directories=False,
+    )
+    with (
+        patch("las_geoh5.export_files.driver.export_las_files") as mock_export,
+        patch("sys.argv", ["geoh5_to_las", str(params_filepath), "-w", "2"]),
+    ):
+        geoh5_to_las.main()
+
+    assert mock_export.call_args.kwargs["n_workers"] == 2
+
+    with patch("sys.argv", ["geoh5_to_las", str(params_filepath), "-w", "-1"]):
+        with pytest.raises(SystemExit):
+            geoh5_to_las.main()
@@ -8,6 +8,7 @@
 #                                                                              '
 # ''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''''
 
+from multiprocessing import Pool
 from pathlib import Path
 from unittest.mock import patch
 
@@ -182,3 +183,29 @@ def test_las_to_geoh5_with_absolute_output_path(
     assert workspace_file.is_file()
     last_modified_date = workspace_file.stat().st_mtime
     assert last_modified_date == modified_date
+
+
+@pytest.mark.parametrize("workers", ["0", "2"])
+def test_las_to_geoh5_with_workers(tmp_path: Path, params_filepath: Path, workers: str):
+    """Test the las_to_geoh5 script with a number of workers."""
+
+    output = tmp_path / "output.geoh5"
+    with (
+        patch(
+            "sys.argv",
+            ["las_to_geoh5", str(params_filepath), "-o", str(output), "-w", workers],
+        ),
+        patch("las_geoh5.pool.Pool", wraps=Pool) as mock_pool,
+    ):
+        las_to_geoh5.main()
+
+    assert output.is_file()
+    assert mock_pool.called is (workers != "0")
+    if mock_pool.called:
+        assert mock_pool.call_args.args[0] == int(workers)
+
+
+def test_las_to_geoh5_with_negative_workers(params_filepath: Path):
+    with patch("sys.argv", ["las_to_geoh5", str(params_filepath), "-w", "-1"]):
+        with pytest.raises(SystemExit):
+            las_to_geoh5.main()